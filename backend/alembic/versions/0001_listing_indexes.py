@@ -0,0 +1,53 @@
+"""Индексы под запросы публичных списков, заявок и ленты новостей
+
+Каталоги (члены правления, партнёры, главные ревматологи, заболевания, центры,
+сотрудники центров) всегда фильтруются по is_active = true и сортируются по
+"order" — для них частичные индексы только по активным строкам.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE = sa.text("is_active = true")
+
+# (имя индекса, таблица, колонки, условие частичного индекса)
+INDEXES = [
+    ("ix_board_members_active_order", "board_members", ["order"], ACTIVE),
+    ("ix_partners_active_order", "partners", ["order"], ACTIVE),
+    ("ix_chief_rheumatologists_active_order", "chief_rheumatologists", ["order"], ACTIVE),
+    ("ix_diseases_active_order", "diseases", ["order"], ACTIVE),
+    ("ix_rheumatology_centers_active_order", "rheumatology_centers", ["order"], ACTIVE),
+    ("ix_center_staff_center_active_order", "center_staff", ["center_id", "order"], ACTIVE),
+    ("ix_school_applications_status_type_created", "school_applications",
+     ["status", "school_type", "created_at"], None),
+    ("ix_congress_registrations_congress_created", "congress_registrations",
+     ["congress_id", "created_at"], None),
+    # На базах, где их создал прежний разовый скрипт (до Alembic), — IF NOT EXISTS
+    ("ix_news_feed", "news",
+     ["is_published", "news_type", sa.text("created_at DESC"), sa.text("id DESC")], None),
+    ("ix_news_published_feed", "news",
+     ["is_published", sa.text("created_at DESC"), sa.text("id DESC")], None),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns, where in INDEXES:
+        op.create_index(name, table, columns, postgresql_where=where, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
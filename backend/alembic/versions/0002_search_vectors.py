@@ -0,0 +1,56 @@
+"""Полнотекстовый поиск: генерируемые tsvector-колонки search_<lang> и GIN-индексы
+
+Колонки GENERATED ALWAYS ... STORED — Postgres пересчитывает их при каждой записи
+строки, поэтому поиск актуален для любых изменений (API, seed-скрипты, ручные правки).
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Зафиксированная копия полей из database/models.py на момент ревизии
+CONFIGS = {"ru": "russian", "uz": "simple", "en": "english"}
+FIELDS = {
+    "news": (("title_{lang}", "A"), ("subtitle_{lang}", "B"), ("excerpt_{lang}", "B"), ("content_{lang}", "C")),
+    "diseases": (("name_{lang}", "A"), ("short_name", "A"), ("description_{lang}", "B"),
+                 ("symptoms_{lang}", "C"), ("treatment_{lang}", "C")),
+    "disease_documents": (("title_{lang}", "A"), ("description_{lang}", "B")),
+}
+
+
+def _vector_sql(lang: str, fields) -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('{CONFIGS[lang]}', coalesce({field.format(lang=lang)}, '')), '{weight}')"
+        for field, weight in fields
+    )
+
+
+def upgrade() -> None:
+    for table, fields in FIELDS.items():
+        for lang in CONFIGS:
+            op.execute(
+                f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_{lang} tsvector "
+                f"GENERATED ALWAYS AS ({_vector_sql(lang, fields)}) STORED"
+            )
+            op.create_index(
+                f"ix_{table}_search_{lang}", table, [f"search_{lang}"],
+                postgresql_using="gin", if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    for table in FIELDS:
+        for lang in CONFIGS:
+            op.drop_index(f"ix_{table}_search_{lang}", table_name=table, if_exists=True)
+            op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_{lang}")
@@ -0,0 +1,43 @@
+"""Таблица загруженных файлов (stored_files) для дедупликации и сборки мусора
+
+Файлы, загруженные до этой ревизии (uploads/<uuid>.<ext>), регистрируются
+при первом запуске collect_uploads.py.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Таблица могла быть создана через create_all (reset_db.py)
+    if "stored_files" in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        "stored_files",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("filename", sa.String(255), nullable=False, unique=True),
+        sa.Column("sha256", sa.String(64), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("content_type", sa.String(100)),
+        sa.Column("uploaded_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("orphaned_at", sa.DateTime(timezone=True)),
+    )
+    op.create_index("ix_stored_files_id", "stored_files", ["id"])
+    op.create_index("ix_stored_files_sha256", "stored_files", ["sha256"])
+
+
+def downgrade() -> None:
+    op.drop_table("stored_files", if_exists=True)
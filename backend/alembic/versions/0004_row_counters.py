@@ -0,0 +1,118 @@
+"""Счётчики строк (row_counters) для админ-панели: триггеры и начальный пересчёт
+
+Триггеры уровня оператора обновляют row_counters в той же транзакции, что и
+INSERT/UPDATE/DELETE/TRUNCATE. CREATE TRIGGER блокирует запись в таблицу до конца
+миграции, поэтому пересчёт ниже не теряет строк, вставленных параллельно.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Зафиксированная копия COUNTED_TABLES и функции из database/models.py на момент ревизии
+COUNTED_TABLES = {
+    "news": ("is_published",),
+    "users": (),
+    "congress_registrations": ("congress_id",),
+    "school_applications": ("status", "school_type"),
+}
+
+FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION row_counters_apply() RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    deltas text := '';
+    rows_name text;
+    sign text;
+    column_name text;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM row_counters WHERE table_name = TG_TABLE_NAME;
+        RETURN NULL;
+    END IF;
+    FOREACH rows_name IN ARRAY CASE TG_OP
+        WHEN 'INSERT' THEN ARRAY['new_rows'] WHEN 'DELETE' THEN ARRAY['old_rows']
+        ELSE ARRAY['new_rows', 'old_rows'] END
+    LOOP
+        sign := CASE rows_name WHEN 'new_rows' THEN '1' ELSE '-1' END;
+        IF deltas <> '' THEN
+            deltas := deltas || ' UNION ALL ';
+        END IF;
+        deltas := deltas || 'SELECT '''' AS key, ' || sign || ' * count(*) AS delta FROM ' || rows_name;
+        FOREACH column_name IN ARRAY coalesce(TG_ARGV, '{}') LOOP
+            deltas := deltas || ' UNION ALL SELECT ' || quote_literal(column_name || '=')
+                || ' || coalesce(' || quote_ident(column_name) || '::text, ''''), '
+                || sign || ' * count(*) FROM ' || rows_name || ' GROUP BY 1';
+        END LOOP;
+    END LOOP;
+    EXECUTE 'INSERT INTO row_counters (table_name, key, count) SELECT '
+        || quote_literal(TG_TABLE_NAME) || ', key, sum(delta) FROM (' || deltas || ') AS deltas'
+        || ' GROUP BY key HAVING sum(delta) <> 0'
+        || ' ON CONFLICT (table_name, key) DO UPDATE SET count = row_counters.count + excluded.count';
+    RETURN NULL;
+END $$
+"""
+
+TRIGGERS = ("insert", "delete", "truncate", "update")
+
+
+def upgrade() -> None:
+    # Таблица могла быть создана через create_all в lifespan — триггеры и пересчёт всё равно нужны
+    if "row_counters" not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table(
+            "row_counters",
+            sa.Column("table_name", sa.String(100), primary_key=True),
+            sa.Column("key", sa.String(255), primary_key=True),
+            sa.Column("count", sa.BigInteger(), nullable=False),
+        )
+    op.execute(FUNCTION_SQL)
+
+    for table, columns in COUNTED_TABLES.items():
+        args = ", ".join(f"'{column}'" for column in columns)
+        op.execute(
+            f"CREATE OR REPLACE TRIGGER {table}_count_insert AFTER INSERT ON {table} "
+            f"REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION row_counters_apply({args})"
+        )
+        op.execute(
+            f"CREATE OR REPLACE TRIGGER {table}_count_delete AFTER DELETE ON {table} "
+            f"REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION row_counters_apply({args})"
+        )
+        op.execute(
+            f"CREATE OR REPLACE TRIGGER {table}_count_truncate AFTER TRUNCATE ON {table} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION row_counters_apply()"
+        )
+        if columns:
+            op.execute(
+                f"CREATE OR REPLACE TRIGGER {table}_count_update AFTER UPDATE ON {table} "
+                f"REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION row_counters_apply({args})"
+            )
+
+        selects = [f"SELECT '' AS key, count(*) AS count FROM {table}"] + [
+            f"SELECT '{column}=' || coalesce({column}::text, ''), count(*) FROM {table} GROUP BY 1"
+            for column in columns
+        ]
+        op.execute(f"DELETE FROM row_counters WHERE table_name = '{table}'")
+        op.execute(
+            f"INSERT INTO row_counters (table_name, key, count) SELECT '{table}', key, count "
+            f"FROM ({' UNION ALL '.join(selects)}) AS counts"
+        )
+
+
+def downgrade() -> None:
+    for table in COUNTED_TABLES:
+        for operation in TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_count_{operation} ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS row_counters_apply()")
+    op.drop_table("row_counters", if_exists=True)
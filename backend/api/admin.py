@@ -1,32 +1,75 @@
-from typing import List
+from datetime import date, timedelta
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, and_, cast, literal, String
 
-from database import get_db, User, News, Congress
+from database import get_db, User, News, Congress, RowCounter
 from database.models import CongressRegistration, SchoolApplication, UserRole
 from schemas import UserResponse
 from functions.auth import get_current_admin_user
+from functions.export import EXPORT_FORMATS, export_response
+from functions.invalidation import publish_invalidation, publish_user_eviction
 
 router = APIRouter()
 
+EXPORT_FORMAT_PATTERN = "^(" + "|".join(EXPORT_FORMATS) + ")$"
+
+
+def created_between(column, date_from: Optional[date], date_to: Optional[date]) -> list:
+    """Условия по дате создания; date_to включительно"""
+    conditions = []
+    if date_from:
+        conditions.append(column >= date_from)
+    if date_to:
+        conditions.append(column < date_to + timedelta(days=1))
+    return conditions
+
 
 # Dashboard Stats
+SCHOOL_STATUSES = ("pending", "approved", "rejected")
+SCHOOL_TYPES = ("rheumatologist", "patient")
+
+
 @router.get("/stats")
 async def get_dashboard_stats(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
-    news_count = await db.scalar(select(func.count(News.id)))
-    users_count = await db.scalar(select(func.count(User.id)))
-    congress_regs = await db.scalar(select(func.count(CongressRegistration.id)))
-    school_apps = await db.scalar(select(func.count(SchoolApplication.id)))
+    """Итоги для панели: один запрос к row_counters (их ведут триггеры),
+    время не зависит от размера таблиц"""
+    congress_key = literal("congress_id=") + cast(Congress.id, String)
+    result = await db.execute(
+        select(RowCounter.table_name, RowCounter.key, RowCounter.count, Congress.id, Congress.title_ru)
+        .outerjoin(Congress, and_(
+            RowCounter.table_name == CongressRegistration.__tablename__,
+            RowCounter.key == congress_key
+        ))
+    )
+    counts = {}
+    by_congress = []
+    for table_name, key, count, congress_id, title in result.all():
+        counts[(table_name, key)] = count
+        if congress_id is not None:
+            by_congress.append({"congressId": congress_id, "title": title, "count": count})
+    by_congress.sort(key=lambda item: -item["congressId"])
+
+    def total(model, key: str = "") -> int:
+        return counts.get((model.__tablename__, key), 0)
 
     return {
-        "news": news_count or 0,
-        "users": users_count or 0,
-        "congressRegistrations": congress_regs or 0,
-        "schoolApplications": school_apps or 0
+        "news": total(News),
+        "publishedNews": total(News, "is_published=true"),
+        "users": total(User),
+        "congressRegistrations": total(CongressRegistration),
+        "schoolApplications": total(SchoolApplication),
+        "schoolApplicationsByStatus": {
+            value: total(SchoolApplication, f"status={value}") for value in SCHOOL_STATUSES
+        },
+        "schoolApplicationsByType": {
+            value: total(SchoolApplication, f"school_type={value}") for value in SCHOOL_TYPES
+        },
+        "congressRegistrationsByCongress": by_congress,
     }
 
 
@@ -61,6 +104,7 @@ async def update_user_role(
         raise HTTPException(status_code=400, detail="Cannot change own role")
 
     user.role = role
+    await publish_user_eviction(db, user.email)
     await db.commit()
     return {"message": "Role updated successfully"}
 
@@ -81,22 +125,30 @@ async def delete_user(
         raise HTTPException(status_code=400, detail="Cannot delete yourself")
 
     await db.delete(user)
+    await publish_user_eviction(db, user.email)
     await db.commit()
     return {"message": "User deleted successfully"}
 
 
 # Congress Registrations
+def registration_filters(congress_id: Optional[int], date_from: Optional[date], date_to: Optional[date]) -> list:
+    conditions = created_between(CongressRegistration.created_at, date_from, date_to)
+    if congress_id:
+        conditions.append(CongressRegistration.congress_id == congress_id)
+    return conditions
+
+
 @router.get("/congress/registrations")
 async def list_congress_registrations(
     congress_id: int = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
-    query = select(CongressRegistration)
-    if congress_id:
-        query = query.where(CongressRegistration.congress_id == congress_id)
+    query = select(CongressRegistration).where(*registration_filters(congress_id, date_from, date_to))
     query = query.offset(skip).limit(limit)
 
     result = await db.execute(query)
@@ -106,7 +158,7 @@ async def list_congress_registrations(
         {
             "id": r.id,
             "congress_id": r.congress_id,
-            "full_name": r.full_name,
+            "full_name": " ".join(filter(None, (r.last_name, r.first_name, r.patronymic))),
             "email": r.email,
             "phone": r.phone,
             "organization": r.organization,
@@ -117,21 +169,52 @@ async def list_congress_registrations(
     ]
 
 
+@router.get("/congress/registrations/export")
+async def export_congress_registrations(
+    congress_id: int = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    export_format: str = Query("csv", alias="format", pattern=EXPORT_FORMAT_PATTERN),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """Все заявки на конгресс по фильтрам — потоком, без ограничения числа строк"""
+    r = CongressRegistration
+    query = (
+        select(r.id, Congress.title_ru, r.last_name, r.first_name, r.patronymic, r.email, r.phone,
+               r.organization, r.position, r.created_at)
+        .outerjoin(Congress, Congress.id == r.congress_id)
+        .where(*registration_filters(congress_id, date_from, date_to))
+        .order_by(r.id)
+    )
+    headers = ["ID", "Конгресс", "Фамилия", "Имя", "Отчество", "Email", "Телефон",
+               "Организация", "Должность", "Дата регистрации"]
+    return export_response(query, headers, export_format, "congress_registrations")
+
+
 # School Applications
+def application_filters(
+    school_type: Optional[str], status: Optional[str], date_from: Optional[date], date_to: Optional[date]
+) -> list:
+    conditions = created_between(SchoolApplication.created_at, date_from, date_to)
+    if school_type:
+        conditions.append(SchoolApplication.school_type == school_type)
+    if status:
+        conditions.append(SchoolApplication.status == status)
+    return conditions
+
+
 @router.get("/school/applications")
 async def list_school_applications(
     school_type: str = None,
     status: str = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
-    query = select(SchoolApplication)
-    if school_type:
-        query = query.where(SchoolApplication.school_type == school_type)
-    if status:
-        query = query.where(SchoolApplication.status == status)
+    query = select(SchoolApplication).where(*application_filters(school_type, status, date_from, date_to))
     query = query.offset(skip).limit(limit)
 
     result = await db.execute(query)
@@ -141,11 +224,11 @@ async def list_school_applications(
         {
             "id": a.id,
             "school_type": a.school_type,
-            "full_name": a.full_name,
+            "full_name": " ".join(filter(None, (a.last_name, a.first_name, a.patronymic))),
             "email": a.email,
             "phone": a.phone,
-            "organization": a.organization,
-            "specialty": a.specialty,
+            "organization": a.workplace,
+            "specialty": a.specialization,
             "message": a.message,
             "status": a.status,
             "created_at": a.created_at
@@ -154,6 +237,28 @@ async def list_school_applications(
     ]
 
 
+@router.get("/school/applications/export")
+async def export_school_applications(
+    school_type: str = None,
+    status: str = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    export_format: str = Query("csv", alias="format", pattern=EXPORT_FORMAT_PATTERN),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """Все заявки в школу по фильтрам — потоком, без ограничения числа строк"""
+    a = SchoolApplication
+    query = (
+        select(a.id, a.school_type, a.last_name, a.first_name, a.patronymic, a.phone, a.email, a.city,
+               a.category, a.inn, a.specialization, a.workplace, a.message, a.status, a.created_at)
+        .where(*application_filters(school_type, status, date_from, date_to))
+        .order_by(a.id)
+    )
+    headers = ["ID", "Школа", "Фамилия", "Имя", "Отчество", "Телефон", "Email", "Город", "Категория",
+               "ИНН", "Специализация", "Место работы", "Сообщение", "Статус", "Дата заявки"]
+    return export_response(query, headers, export_format, "school_applications")
+
+
 @router.put("/school/applications/{application_id}/status")
 async def update_application_status(
     application_id: int,
@@ -161,7 +266,7 @@ async def update_application_status(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
-    if status not in ["pending", "approved", "rejected"]:
+    if status not in SCHOOL_STATUSES:
         raise HTTPException(status_code=400, detail="Invalid status")
 
     result = await db.execute(
@@ -6,8 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
 from schemas import UserCreate, UserResponse, Token
 from functions.auth import (
-    verify_password,
-    get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
     create_access_token,
     get_current_user,
 )
@@ -25,7 +25,7 @@ async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await get_password_hash_async(user.password)
     return await create_user(db, user, hashed_password)
 
 
@@ -35,12 +35,19 @@ async def login(
     db: AsyncSession = Depends(get_db)
 ):
     user = await get_user_by_email(db, email=form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    verified, new_hash = (False, None)
+    if user:
+        verified, new_hash = await verify_password_async(form_data.password, user.hashed_password)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if new_hash:
+        # Изменилась стоимость bcrypt (BCRYPT_ROUNDS) — сохраняем хеш с новой
+        user.hashed_password = new_hash
+        await db.commit()
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": user.email, "role": user.role.value},
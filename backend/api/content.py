@@ -1,27 +1,41 @@
 """API для управления контентом (админка)"""
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
-from typing import List, Optional
+from sqlalchemy import select, desc, func
+from typing import Dict, List, Optional, Union
+import asyncio
 import os
-import uuid
 from datetime import datetime
 
-from database import get_db, BoardMember, Partner, Charter, ChiefRheumatologist, Disease, DiseaseDocument, News, RheumatologyCenter, CenterStaff, SchoolApplication
+from config import settings
+from database import get_db, async_session, BoardMember, Partner, Charter, ChiefRheumatologist, Disease, DiseaseDocument, News, RheumatologyCenter, CenterStaff, SchoolApplication
+from database.models import Language
 from sqlalchemy.orm import selectinload
 from schemas import (
-    BoardMemberCreate, BoardMemberUpdate, BoardMemberResponse,
-    PartnerCreate, PartnerUpdate, PartnerResponse,
-    CharterCreate, CharterUpdate, CharterResponse,
-    ChiefRheumatologistCreate, ChiefRheumatologistUpdate, ChiefRheumatologistResponse,
-    DiseaseCreate, DiseaseUpdate, DiseaseResponse,
-    DiseaseDocumentCreate, DiseaseDocumentUpdate, DiseaseDocumentResponse,
-    NewsCreate, NewsUpdate, NewsResponse,
-    RheumatologyCenterCreate, RheumatologyCenterUpdate, RheumatologyCenterResponse, RheumatologyCenterWithStaffResponse,
-    CenterStaffCreate, CenterStaffUpdate, CenterStaffResponse,
+    BoardMemberCreate, BoardMemberUpdate, BoardMemberResponse, BoardMemberLocalizedResponse,
+    PartnerCreate, PartnerUpdate, PartnerResponse, PartnerLocalizedResponse,
+    CharterCreate, CharterUpdate, CharterResponse, CharterLocalizedResponse,
+    ChiefRheumatologistCreate, ChiefRheumatologistUpdate, ChiefRheumatologistResponse, ChiefRheumatologistLocalizedResponse,
+    DiseaseCreate, DiseaseUpdate, DiseaseResponse, DiseaseLocalizedResponse,
+    DiseaseDocumentCreate, DiseaseDocumentUpdate, DiseaseDocumentResponse, DiseaseDocumentLocalizedResponse,
+    NewsCreate, NewsUpdate, NewsResponse, NewsLocalizedResponse,
+    NewsSummaryResponse, NewsSummaryLocalizedResponse, NewsFeedResponse,
+    RheumatologyCenterCreate, RheumatologyCenterUpdate, RheumatologyCenterResponse, RheumatologyCenterWithStaffResponse, RheumatologyCenterLocalizedResponse, RheumatologyCenterWithStaffLocalizedResponse,
+    CenterStaffCreate, CenterStaffUpdate, CenterStaffResponse, CenterStaffLocalizedResponse,
+    HomeResponse, HomeLocalizedResponse,
+    SearchResponse,
 )
 from schemas.rheumatology import SchoolApplicationCreate, SchoolApplicationResponse
 from functions.auth import get_current_admin
+from functions.cache import cache_bypass, content_cache, MISSING
+from functions.crud import encode_news_cursor, paginate_news_keyset
+from functions.etag import etag_guard
+from functions.invalidation import publish_invalidation
+from functions.localization import Projection
+from functions.search import search_content
+from functions.serialization import trusted_response
+from functions.uploads import save_upload
+from functions.view_counter import view_counter
 
 router = APIRouter()
 
@@ -29,46 +43,78 @@ router = APIRouter()
 UPLOAD_DIR = "uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# Схемы ответа: все языки (по умолчанию) или один язык (?lang=ru|uz|en)
+board_member_projection = Projection(BoardMember, BoardMemberResponse, BoardMemberLocalizedResponse)
+partner_projection = Projection(Partner, PartnerResponse, PartnerLocalizedResponse)
+charter_projection = Projection(Charter, CharterResponse, CharterLocalizedResponse)
+chief_rheumatologist_projection = Projection(ChiefRheumatologist, ChiefRheumatologistResponse, ChiefRheumatologistLocalizedResponse)
+disease_projection = Projection(Disease, DiseaseResponse, DiseaseLocalizedResponse)
+disease_document_projection = Projection(DiseaseDocument, DiseaseDocumentResponse, DiseaseDocumentLocalizedResponse)
+news_projection = Projection(News, NewsResponse, NewsLocalizedResponse)
+news_summary_projection = Projection(News, NewsSummaryResponse, NewsSummaryLocalizedResponse)
+center_projection = Projection(RheumatologyCenter, RheumatologyCenterResponse, RheumatologyCenterLocalizedResponse)
+center_staff_projection = Projection(CenterStaff, CenterStaffResponse, CenterStaffLocalizedResponse)
+
 
 # ==================== ЗАГРУЗКА ФАЙЛОВ ====================
 @router.post("/upload")
 async def upload_file(
     file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
     admin = Depends(get_current_admin)
 ):
-    """Загрузка файла (изображения или документа)"""
-    # Генерируем уникальное имя файла
-    ext = os.path.splitext(file.filename)[1]
-    filename = f"{uuid.uuid4()}{ext}"
-    filepath = os.path.join(UPLOAD_DIR, filename)
-
-    with open(filepath, "wb") as f:
-        content = await file.read()
-        f.write(content)
-
-    return {"url": f"/uploads/{filename}", "filename": filename}
+    """Загрузка файла (изображения или документа): потоково, с проверкой размера и типа.
+    Повторная загрузка того же содержимого возвращает уже сохранённый файл."""
+    stored = await save_upload(db, file, UPLOAD_DIR)
+    return {
+        "url": stored.url,
+        "filename": stored.filename,
+        "size": stored.size,
+        "sha256": stored.sha256,
+        "content_type": stored.content_type,
+    }
 
 
 # ==================== ЧЛЕНЫ ПРАВЛЕНИЯ ====================
-@router.get("/board-members", response_model=List[BoardMemberResponse])
+@router.get("/board-members", response_model=Union[List[BoardMemberResponse], List[BoardMemberLocalizedResponse]],
+             dependencies=[Depends(etag_guard("board_members"))])
 async def get_board_members(
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    include_inactive: bool = False
+    include_inactive: bool = False,
+    lang: Optional[Language] = None
 ):
-    query = select(BoardMember).order_by(BoardMember.order)
+    return trusted_response(await load_board_members(db, include_inactive, lang), response)
+
+
+async def load_board_members(db: AsyncSession, include_inactive: bool = False, lang: Optional[Language] = None):
+    cache_key = ("board_members", include_inactive, lang)
+    cached = content_cache.get(cache_key)
+    if cached is not MISSING:
+        return cached
+
+    query = board_member_projection.select(lang).order_by(BoardMember.order)
     if not include_inactive:
         query = query.where(BoardMember.is_active == True)
     result = await db.execute(query)
-    return result.scalars().all()
+    members = board_member_projection.all(result)
+    content_cache.set(cache_key, members)
+    return members
 
 
-@router.get("/board-members/{member_id}", response_model=BoardMemberResponse)
-async def get_board_member(member_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(BoardMember).where(BoardMember.id == member_id))
-    member = result.scalar_one_or_none()
+@router.get("/board-members/{member_id}", response_model=Union[BoardMemberResponse, BoardMemberLocalizedResponse],
+             dependencies=[Depends(etag_guard("board_members"))])
+async def get_board_member(
+    response: Response,
+    member_id: int,
+    db: AsyncSession = Depends(get_db),
+    lang: Optional[Language] = None
+):
+    result = await db.execute(board_member_projection.select(lang).where(BoardMember.id == member_id))
+    member = board_member_projection.one_or_none(result)
     if not member:
         raise HTTPException(status_code=404, detail="Board member not found")
-    return member
+    return trusted_response(member, response)
 
 
 @router.post("/board-members", response_model=BoardMemberResponse)
@@ -79,6 +125,7 @@ async def create_board_member(
 ):
     member = BoardMember(**data.model_dump())
     db.add(member)
+    await publish_invalidation(db, "board_members")
     await db.commit()
     await db.refresh(member)
     return member
@@ -100,6 +147,7 @@ async def update_board_member(
     for key, value in update_data.items():
         setattr(member, key, value)
 
+    await publish_invalidation(db, "board_members")
     await db.commit()
     await db.refresh(member)
     return member
@@ -117,30 +165,51 @@ async def delete_board_member(
         raise HTTPException(status_code=404, detail="Board member not found")
 
     await db.delete(member)
+    await publish_invalidation(db, "board_members")
     await db.commit()
     return {"message": "Board member deleted"}
 
 
 # ==================== МЕЖДУНАРОДНЫЕ ПАРТНЁРЫ ====================
-@router.get("/partners", response_model=List[PartnerResponse])
+@router.get("/partners", response_model=Union[List[PartnerResponse], List[PartnerLocalizedResponse]],
+             dependencies=[Depends(etag_guard("partners"))])
 async def get_partners(
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    include_inactive: bool = False
+    include_inactive: bool = False,
+    lang: Optional[Language] = None
 ):
-    query = select(Partner).order_by(Partner.order)
+    return trusted_response(await load_partners(db, include_inactive, lang), response)
+
+
+async def load_partners(db: AsyncSession, include_inactive: bool = False, lang: Optional[Language] = None):
+    cache_key = ("partners", include_inactive, lang)
+    cached = content_cache.get(cache_key)
+    if cached is not MISSING:
+        return cached
+
+    query = partner_projection.select(lang).order_by(Partner.order)
     if not include_inactive:
         query = query.where(Partner.is_active == True)
     result = await db.execute(query)
-    return result.scalars().all()
+    partners = partner_projection.all(result)
+    content_cache.set(cache_key, partners)
+    return partners
 
 
-@router.get("/partners/{partner_id}", response_model=PartnerResponse)
-async def get_partner(partner_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Partner).where(Partner.id == partner_id))
-    partner = result.scalar_one_or_none()
+@router.get("/partners/{partner_id}", response_model=Union[PartnerResponse, PartnerLocalizedResponse],
+             dependencies=[Depends(etag_guard("partners"))])
+async def get_partner(
+    response: Response,
+    partner_id: int,
+    db: AsyncSession = Depends(get_db),
+    lang: Optional[Language] = None
+):
+    result = await db.execute(partner_projection.select(lang).where(Partner.id == partner_id))
+    partner = partner_projection.one_or_none(result)
     if not partner:
         raise HTTPException(status_code=404, detail="Partner not found")
-    return partner
+    return trusted_response(partner, response)
 
 
 @router.post("/partners", response_model=PartnerResponse)
@@ -151,6 +220,7 @@ async def create_partner(
 ):
     partner = Partner(**data.model_dump())
     db.add(partner)
+    await publish_invalidation(db, "partners")
     await db.commit()
     await db.refresh(partner)
     return partner
@@ -172,6 +242,7 @@ async def update_partner(
     for key, value in update_data.items():
         setattr(partner, key, value)
 
+    await publish_invalidation(db, "partners")
     await db.commit()
     await db.refresh(partner)
     return partner
@@ -189,18 +260,38 @@ async def delete_partner(
         raise HTTPException(status_code=404, detail="Partner not found")
 
     await db.delete(partner)
+    await publish_invalidation(db, "partners")
     await db.commit()
     return {"message": "Partner deleted"}
 
 
 # ==================== УСТАВ ====================
-@router.get("/charter", response_model=Optional[CharterResponse])
-async def get_active_charter(db: AsyncSession = Depends(get_db)):
+@router.get("/charter", response_model=Optional[Union[CharterResponse, CharterLocalizedResponse]],
+             dependencies=[Depends(etag_guard("charters"))])
+async def get_active_charter(
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    lang: Optional[Language] = None
+):
     """Получить активный устав"""
+    return trusted_response(await load_active_charter(db, lang), response)
+
+
+async def load_active_charter(db: AsyncSession, lang: Optional[Language] = None):
+    cache_key = ("charters", "active", lang)
+    cached = content_cache.get(cache_key)
+    if cached is not MISSING:
+        return cached
+
     result = await db.execute(
-        select(Charter).where(Charter.is_active == True).order_by(desc(Charter.created_at))
+        charter_projection.select(lang)
+        .where(Charter.is_active == True)
+        .order_by(desc(Charter.created_at))
+        .limit(1)
     )
-    return result.scalar_one_or_none()
+    charter = charter_projection.one_or_none(result)
+    content_cache.set(cache_key, charter)
+    return charter
 
 
 @router.get("/charters", response_model=List[CharterResponse])
@@ -227,6 +318,7 @@ async def create_charter(
 
     charter = Charter(**data.model_dump())
     db.add(charter)
+    await publish_invalidation(db, "charters")
     await db.commit()
     await db.refresh(charter)
     return charter
@@ -254,6 +346,7 @@ async def update_charter(
     for key, value in update_data.items():
         setattr(charter, key, value)
 
+    await publish_invalidation(db, "charters")
     await db.commit()
     await db.refresh(charter)
     return charter
@@ -271,30 +364,47 @@ async def delete_charter(
         raise HTTPException(status_code=404, detail="Charter not found")
 
     await db.delete(charter)
+    await publish_invalidation(db, "charters")
     await db.commit()
     return {"message": "Charter deleted"}
 
 
 # ==================== ГЛАВНЫЕ РЕВМАТОЛОГИ ====================
-@router.get("/chief-rheumatologists", response_model=List[ChiefRheumatologistResponse])
+@router.get("/chief-rheumatologists", response_model=Union[List[ChiefRheumatologistResponse], List[ChiefRheumatologistLocalizedResponse]],
+             dependencies=[Depends(etag_guard("chief_rheumatologists"))])
 async def get_chief_rheumatologists(
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    include_inactive: bool = False
+    include_inactive: bool = False,
+    lang: Optional[Language] = None
 ):
-    query = select(ChiefRheumatologist).order_by(ChiefRheumatologist.order)
+    cache_key = ("chief_rheumatologists", include_inactive, lang)
+    cached = content_cache.get(cache_key)
+    if cached is not MISSING:
+        return trusted_response(cached, response)
+
+    query = chief_rheumatologist_projection.select(lang).order_by(ChiefRheumatologist.order)
     if not include_inactive:
         query = query.where(ChiefRheumatologist.is_active == True)
     result = await db.execute(query)
-    return result.scalars().all()
+    doctors = chief_rheumatologist_projection.all(result)
+    content_cache.set(cache_key, doctors)
+    return trusted_response(doctors, response)
 
 
-@router.get("/chief-rheumatologists/{doctor_id}", response_model=ChiefRheumatologistResponse)
-async def get_chief_rheumatologist(doctor_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(ChiefRheumatologist).where(ChiefRheumatologist.id == doctor_id))
-    doctor = result.scalar_one_or_none()
+@router.get("/chief-rheumatologists/{doctor_id}", response_model=Union[ChiefRheumatologistResponse, ChiefRheumatologistLocalizedResponse],
+             dependencies=[Depends(etag_guard("chief_rheumatologists"))])
+async def get_chief_rheumatologist(
+    response: Response,
+    doctor_id: int,
+    db: AsyncSession = Depends(get_db),
+    lang: Optional[Language] = None
+):
+    result = await db.execute(chief_rheumatologist_projection.select(lang).where(ChiefRheumatologist.id == doctor_id))
+    doctor = chief_rheumatologist_projection.one_or_none(result)
     if not doctor:
         raise HTTPException(status_code=404, detail="Chief rheumatologist not found")
-    return doctor
+    return trusted_response(doctor, response)
 
 
 @router.post("/chief-rheumatologists", response_model=ChiefRheumatologistResponse)
@@ -305,6 +415,7 @@ async def create_chief_rheumatologist(
 ):
     doctor = ChiefRheumatologist(**data.model_dump())
     db.add(doctor)
+    await publish_invalidation(db, "chief_rheumatologists")
     await db.commit()
     await db.refresh(doctor)
     return doctor
@@ -326,6 +437,7 @@ async def update_chief_rheumatologist(
     for key, value in update_data.items():
         setattr(doctor, key, value)
 
+    await publish_invalidation(db, "chief_rheumatologists")
     await db.commit()
     await db.refresh(doctor)
     return doctor
@@ -343,30 +455,47 @@ async def delete_chief_rheumatologist(
         raise HTTPException(status_code=404, detail="Chief rheumatologist not found")
 
     await db.delete(doctor)
+    await publish_invalidation(db, "chief_rheumatologists")
     await db.commit()
     return {"message": "Chief rheumatologist deleted"}
 
 
 # ==================== ЗАБОЛЕВАНИЯ ====================
-@router.get("/diseases", response_model=List[DiseaseResponse])
+@router.get("/diseases", response_model=Union[List[DiseaseResponse], List[DiseaseLocalizedResponse]],
+             dependencies=[Depends(etag_guard("diseases"))])
 async def get_diseases(
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    include_inactive: bool = False
+    include_inactive: bool = False,
+    lang: Optional[Language] = None
 ):
-    query = select(Disease).order_by(Disease.order)
+    cache_key = ("diseases", include_inactive, lang)
+    cached = content_cache.get(cache_key)
+    if cached is not MISSING:
+        return trusted_response(cached, response)
+
+    query = disease_projection.select(lang).order_by(Disease.order)
     if not include_inactive:
         query = query.where(Disease.is_active == True)
     result = await db.execute(query)
-    return result.scalars().all()
+    diseases = disease_projection.all(result)
+    content_cache.set(cache_key, diseases)
+    return trusted_response(diseases, response)
 
 
-@router.get("/diseases/{disease_id}", response_model=DiseaseResponse)
-async def get_disease(disease_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Disease).where(Disease.id == disease_id))
-    disease = result.scalar_one_or_none()
+@router.get("/diseases/{disease_id}", response_model=Union[DiseaseResponse, DiseaseLocalizedResponse],
+             dependencies=[Depends(etag_guard("diseases"))])
+async def get_disease(
+    response: Response,
+    disease_id: int,
+    db: AsyncSession = Depends(get_db),
+    lang: Optional[Language] = None
+):
+    result = await db.execute(disease_projection.select(lang).where(Disease.id == disease_id))
+    disease = disease_projection.one_or_none(result)
     if not disease:
         raise HTTPException(status_code=404, detail="Disease not found")
-    return disease
+    return trusted_response(disease, response)
 
 
 @router.post("/diseases", response_model=DiseaseResponse)
@@ -377,6 +506,8 @@ async def create_disease(
 ):
     disease = Disease(**data.model_dump())
     db.add(disease)
+    await db.flush()
+    await publish_invalidation(db, "diseases", ids=[disease.id])
     await db.commit()
     await db.refresh(disease)
     return disease
@@ -398,6 +529,7 @@ async def update_disease(
     for key, value in update_data.items():
         setattr(disease, key, value)
 
+    await publish_invalidation(db, "diseases", ids=[disease_id])
     await db.commit()
     await db.refresh(disease)
     return disease
@@ -415,24 +547,28 @@ async def delete_disease(
         raise HTTPException(status_code=404, detail="Disease not found")
 
     await db.delete(disease)
+    await publish_invalidation(db, "diseases", ids=[disease_id])
     await db.commit()
     return {"message": "Disease deleted"}
 
 
 # ==================== ДОКУМЕНТЫ О ЗАБОЛЕВАНИЯХ ====================
-@router.get("/disease-documents", response_model=List[DiseaseDocumentResponse])
+@router.get("/disease-documents", response_model=Union[List[DiseaseDocumentResponse], List[DiseaseDocumentLocalizedResponse]],
+             dependencies=[Depends(etag_guard("disease_documents"))])
 async def get_disease_documents(
+    response: Response,
     db: AsyncSession = Depends(get_db),
     disease_id: Optional[int] = None,
-    include_inactive: bool = False
+    include_inactive: bool = False,
+    lang: Optional[Language] = None
 ):
-    query = select(DiseaseDocument).order_by(DiseaseDocument.order)
+    query = disease_document_projection.select(lang).order_by(DiseaseDocument.order)
     if disease_id:
         query = query.where(DiseaseDocument.disease_id == disease_id)
     if not include_inactive:
         query = query.where(DiseaseDocument.is_active == True)
     result = await db.execute(query)
-    return result.scalars().all()
+    return trusted_response(disease_document_projection.all(result), response)
 
 
 @router.post("/disease-documents", response_model=DiseaseDocumentResponse)
@@ -443,6 +579,7 @@ async def create_disease_document(
 ):
     document = DiseaseDocument(**data.model_dump())
     db.add(document)
+    await publish_invalidation(db, "disease_documents")
     await db.commit()
     await db.refresh(document)
     return document
@@ -464,6 +601,7 @@ async def update_disease_document(
     for key, value in update_data.items():
         setattr(document, key, value)
 
+    await publish_invalidation(db, "disease_documents")
     await db.commit()
     await db.refresh(document)
     return document
@@ -481,33 +619,81 @@ async def delete_disease_document(
         raise HTTPException(status_code=404, detail="Document not found")
 
     await db.delete(document)
+    await publish_invalidation(db, "disease_documents")
     await db.commit()
     return {"message": "Document deleted"}
 
 
 # ==================== НОВОСТИ ====================
-@router.get("/news/featured", response_model=List[NewsResponse])
+# Полные или краткие (?summary=true, без content_*), на всех языках или на одном.
+# Только для документации: списки отдаются через trusted_response без валидации,
+# поэтому варианты не нужно различать по содержимому
+NewsListResponse = Union[
+    List[NewsResponse], List[NewsSummaryResponse],
+    List[NewsLocalizedResponse], List[NewsSummaryLocalizedResponse],
+]
+
+
+def _news_list_projection(summary: bool) -> Projection:
+    return news_summary_projection if summary else news_projection
+
+
+@router.get("/news/featured", response_model=NewsListResponse,
+             dependencies=[Depends(etag_guard("news"))])
 async def get_featured_news(
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    limit: int = 10
+    limit: int = 10,
+    lang: Optional[Language] = None,
+    summary: bool = False
 ):
     """Получить избранные новости/события для карусели"""
-    query = select(News).where(
+    projection = _news_list_projection(summary)
+    query = projection.select(lang).where(
         News.is_published == True,
         News.is_featured == True
     ).order_by(desc(News.created_at)).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    return trusted_response(projection.all(result), response)
 
 
-@router.get("/news/events", response_model=List[NewsResponse])
+@router.get("/news/popular", response_model=NewsListResponse)
+async def get_popular_news(
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    limit: int = Query(5, ge=1, le=20),
+    lang: Optional[Language] = None,
+    summary: bool = False
+):
+    """Самые читаемые новости (счётчики обновляются раз в VIEW_COUNTER_FLUSH_INTERVAL)"""
+    cache_key = ("news_popular", limit, lang, summary)
+    cached = content_cache.get(cache_key)
+    if cached is not MISSING:
+        return trusted_response(cached, response)
+
+    projection = _news_list_projection(summary)
+    query = projection.select(lang).where(News.is_published == True).order_by(
+        desc(News.views_count), desc(News.created_at)
+    ).limit(limit)
+    result = await db.execute(query)
+    news = projection.all(result)
+    # Просмотры не инвалидируют кэш, поэтому держим не дольше периода сброса счётчика
+    content_cache.set(cache_key, news, tags=("news",), ttl=settings.VIEW_COUNTER_FLUSH_INTERVAL)
+    return trusted_response(news, response)
+
+
+@router.get("/news/events", response_model=NewsListResponse)
 async def get_events(
+    response: Response,
     db: AsyncSession = Depends(get_db),
     upcoming_only: bool = True,
-    limit: int = 10
+    limit: int = 10,
+    lang: Optional[Language] = None,
+    summary: bool = False
 ):
     """Получить события"""
-    query = select(News).where(
+    projection = _news_list_projection(summary)
+    query = projection.select(lang).where(
         News.is_published == True,
         News.news_type == "event"
     )
@@ -515,34 +701,96 @@ async def get_events(
         query = query.where(News.event_date_start >= datetime.now())
     query = query.order_by(News.event_date_start).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    return trusted_response(projection.all(result), response)
+
+
+@router.get("/news/feed", response_model=NewsFeedResponse,
+             dependencies=[Depends(etag_guard("news"))])
+async def get_news_feed(
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    news_type: Optional[str] = None,
+    published_only: bool = True,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    lang: Optional[Language] = None,
+    summary: bool = False
+):
+    """Лента новостей с курсорной пагинацией (next_cursor -> следующая страница)"""
+    projection = _news_list_projection(summary)
+    query = projection.select(lang)
+    if news_type:
+        query = query.where(News.news_type == news_type)
+    if published_only:
+        query = query.where(News.is_published == True)
+    try:
+        query = paginate_news_keyset(query, cursor, limit)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    result = await db.execute(query)
+    items = projection.all(result)
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_news_cursor(items[-1]["created_at"], items[-1]["id"])
+    return trusted_response({"items": items, "next_cursor": next_cursor}, response)
 
 
-@router.get("/news", response_model=List[NewsResponse])
+@router.get("/news", response_model=NewsListResponse,
+             dependencies=[Depends(etag_guard("news"))])
 async def get_news(
+    response: Response,
     db: AsyncSession = Depends(get_db),
     news_type: Optional[str] = None,
     published_only: bool = True,
     skip: int = 0,
-    limit: int = 20
+    limit: int = 20,
+    lang: Optional[Language] = None,
+    summary: bool = False
 ):
-    query = select(News).order_by(desc(News.created_at))
+    projection = _news_list_projection(summary)
+    query = projection.select(lang).order_by(desc(News.created_at))
     if news_type:
         query = query.where(News.news_type == news_type)
     if published_only:
         query = query.where(News.is_published == True)
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    return trusted_response(projection.all(result), response)
 
 
-@router.get("/news/{news_id}", response_model=NewsResponse)
-async def get_news_item(news_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(News).where(News.id == news_id))
-    news = result.scalar_one_or_none()
+@router.get("/news/{news_id}", response_model=Union[NewsResponse, NewsLocalizedResponse],
+             dependencies=[Depends(etag_guard("news"))])
+async def get_news_item(
+    response: Response,
+    news_id: int,
+    db: AsyncSession = Depends(get_db),
+    lang: Optional[Language] = None
+):
+    result = await db.execute(news_projection.select(lang).where(News.id == news_id))
+    news = news_projection.one_or_none(result)
     if not news:
         raise HTTPException(status_code=404, detail="News not found")
-    return news
+    return trusted_response(news, response)
+
+
+@router.post("/news/{news_id}/view")
+async def register_news_view(
+    news_id: int = Path(..., ge=1, le=2**31 - 1),
+    db: AsyncSession = Depends(get_db)
+):
+    """Учесть просмотр новости и вернуть актуальное число просмотров. Отдельный запрос,
+    потому что сама страница может прийти из снимка nginx или по ETag (304) и до API
+    не дойти; views_count в ней — на момент последней правки новости."""
+    views_count = await db.scalar(
+        select(func.coalesce(News.views_count, 0)).where(News.id == news_id)
+    )
+    if views_count is None:
+        raise HTTPException(status_code=404, detail="News not found")
+    view_counter.hit(news_id)
+    # Просмотры, не записанные другими воркерами, появятся после их ближайшего сброса
+    return {"views_count": views_count + view_counter.pending(news_id)}
 
 
 @router.post("/news", response_model=NewsResponse)
@@ -553,6 +801,8 @@ async def create_news(
 ):
     news = News(**data.model_dump(), author_id=admin.id)
     db.add(news)
+    await db.flush()
+    await publish_invalidation(db, "news", ids=[news.id])
     await db.commit()
     await db.refresh(news)
     return news
@@ -574,6 +824,7 @@ async def update_news(
     for key, value in update_data.items():
         setattr(news, key, value)
 
+    await publish_invalidation(db, "news", ids=[news_id])
     await db.commit()
     await db.refresh(news)
     return news
@@ -591,30 +842,179 @@ async def delete_news(
         raise HTTPException(status_code=404, detail="News not found")
 
     await db.delete(news)
+    await publish_invalidation(db, "news", ids=[news_id])
     await db.commit()
     return {"message": "News deleted"}
 
 
+# ==================== ГЛАВНАЯ СТРАНИЦА ====================
+# Одна сборка на ключ кэша: при промахе параллельные запросы с тем же ключом ждут её результат,
+# запросы с другими news_limit / lang собираются независимо
+_home_builds: Dict[tuple, asyncio.Future] = {}
+
+
+async def _in_session(loader, *args):
+    """Выполнить загрузчик в собственной сессии (для параллельной загрузки секций)"""
+    async with async_session() as session:
+        return await loader(session, *args)
+
+
+async def load_latest_news(
+    db: AsyncSession,
+    news_type: Optional[str],
+    limit: int,
+    lang: Optional[Language] = None
+):
+    query = news_projection.select(lang).where(News.is_published == True)
+    if news_type:
+        query = query.where(News.news_type == news_type)
+    query = query.order_by(desc(News.created_at)).limit(limit)
+    result = await db.execute(query)
+    return news_projection.all(result)
+
+
+@router.get("/home", response_model=Union[HomeResponse, HomeLocalizedResponse],
+             dependencies=[Depends(etag_guard("board_members", "partners", "charters", "news"))])
+async def get_home(
+    response: Response,
+    news_limit: int = Query(3, ge=1, le=12),
+    lang: Optional[Language] = None
+):
+    """Все секции главной страницы одним запросом (кэшируется целиком)"""
+    cache_key = ("home", news_limit, lang)
+    cached = content_cache.get(cache_key)
+    if cached is not MISSING:
+        return trusted_response(cached, response)
+
+    if cache_bypass.get():
+        # Рендер снимка: не присоединяемся к сборке, начатой до записи
+        return trusted_response(await _build_home(cache_key, news_limit, lang), response)
+
+    build = _home_builds.get(cache_key)
+    if build is None:
+        build = asyncio.ensure_future(_build_home(cache_key, news_limit, lang))
+        _home_builds[cache_key] = build
+        build.add_done_callback(lambda _: _home_builds.pop(cache_key, None))
+    # shield: отключение одного клиента не отменяет сборку для остальных
+    return trusted_response(await asyncio.shield(build), response)
+
+
+async def _build_home(cache_key: tuple, news_limit: int, lang: Optional[Language]) -> dict:
+    # Сборка могла завершиться между промахом кэша и стартом этой
+    cached = content_cache.get(cache_key)
+    if cached is not MISSING:
+        return cached
+
+    board_members, partners, charter, news, events = await asyncio.gather(
+        _in_session(load_board_members, False, lang),
+        _in_session(load_partners, False, lang),
+        _in_session(load_active_charter, lang),
+        _in_session(load_latest_news, None, news_limit, lang),
+        _in_session(load_latest_news, "event", 1, lang),
+    )
+    home = {
+        "board_members": board_members,
+        "partners": partners,
+        "charter": charter,
+        "news": news,
+        "upcoming_event": events[0] if events else None,
+    }
+    content_cache.set(
+        cache_key, home,
+        tags=("home", "board_members", "partners", "charters", "news")
+    )
+    return home
+
+
+# ==================== ПОИСК ====================
+@router.get("/search", response_model=SearchResponse,
+             dependencies=[Depends(etag_guard("news", "diseases", "disease_documents"))])
+async def search(
+    response: Response,
+    q: str = Query(..., min_length=2, max_length=200),
+    lang: Language = Language.RU,
+    type: Optional[str] = Query(None, pattern="^(news|disease|document)$"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=50),
+    db: AsyncSession = Depends(get_db)
+):
+    """Полнотекстовый поиск по новостям, заболеваниям и документам на выбранном языке"""
+    types = [type] if type else None
+    return trusted_response(await search_content(db, q, lang, types, skip, limit), response)
+
+
 # ==================== РЕВМАТОЛОГИЧЕСКИЕ ЦЕНТРЫ ====================
-@router.get("/centers", response_model=List[RheumatologyCenterResponse])
+@router.get("/centers", response_model=Union[List[RheumatologyCenterResponse], List[RheumatologyCenterLocalizedResponse]],
+             dependencies=[Depends(etag_guard("rheumatology_centers"))])
 async def get_centers(
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    include_inactive: bool = False
+    include_inactive: bool = False,
+    lang: Optional[Language] = None
 ):
-    query = select(RheumatologyCenter).order_by(RheumatologyCenter.order)
+    cache_key = ("rheumatology_centers", include_inactive, lang)
+    cached = content_cache.get(cache_key)
+    if cached is not MISSING:
+        return trusted_response(cached, response)
+
+    query = center_projection.select(lang).order_by(RheumatologyCenter.order)
     if not include_inactive:
         query = query.where(RheumatologyCenter.is_active == True)
     result = await db.execute(query)
-    return result.scalars().all()
+    centers = center_projection.all(result)
+    content_cache.set(cache_key, centers)
+    return trusted_response(centers, response)
 
 
-@router.get("/centers/{center_id}", response_model=RheumatologyCenterResponse)
-async def get_center(center_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(RheumatologyCenter).where(RheumatologyCenter.id == center_id))
-    center = result.scalar_one_or_none()
+@router.get("/centers/with-staff", response_model=Union[List[RheumatologyCenterWithStaffResponse], List[RheumatologyCenterWithStaffLocalizedResponse]],
+             dependencies=[Depends(etag_guard("rheumatology_centers", "center_staff"))])
+async def get_centers_with_staff(
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    lang: Optional[Language] = None
+):
+    """Все активные центры с активными сотрудниками (два запроса: центры + сотрудники)"""
+    cache_key = ("centers_with_staff", lang)
+    cached = content_cache.get(cache_key)
+    if cached is not MISSING:
+        return trusted_response(cached, response)
+
+    result = await db.execute(
+        center_projection.select(lang)
+        .where(RheumatologyCenter.is_active == True)
+        .order_by(RheumatologyCenter.order)
+    )
+    centers = center_projection.all(result)
+    staff_by_center = {}
+    for center in centers:
+        center["staff"] = staff_by_center[center["id"]] = []
+
+    if centers:
+        result = await db.execute(
+            center_staff_projection.select(lang)
+            .where(CenterStaff.is_active == True, CenterStaff.center_id.in_(staff_by_center))
+            .order_by(CenterStaff.order)
+        )
+        for member in center_staff_projection.all(result):
+            staff_by_center[member["center_id"]].append(member)
+
+    content_cache.set(cache_key, centers, tags=("rheumatology_centers", "center_staff"))
+    return trusted_response(centers, response)
+
+
+@router.get("/centers/{center_id}", response_model=Union[RheumatologyCenterResponse, RheumatologyCenterLocalizedResponse],
+             dependencies=[Depends(etag_guard("rheumatology_centers"))])
+async def get_center(
+    response: Response,
+    center_id: int,
+    db: AsyncSession = Depends(get_db),
+    lang: Optional[Language] = None
+):
+    result = await db.execute(center_projection.select(lang).where(RheumatologyCenter.id == center_id))
+    center = center_projection.one_or_none(result)
     if not center:
         raise HTTPException(status_code=404, detail="Center not found")
-    return center
+    return trusted_response(center, response)
 
 
 @router.post("/centers", response_model=RheumatologyCenterResponse)
@@ -625,6 +1025,7 @@ async def create_center(
 ):
     center = RheumatologyCenter(**data.model_dump())
     db.add(center)
+    await publish_invalidation(db, "rheumatology_centers")
     await db.commit()
     await db.refresh(center)
     return center
@@ -646,6 +1047,7 @@ async def update_center(
     for key, value in update_data.items():
         setattr(center, key, value)
 
+    await publish_invalidation(db, "rheumatology_centers")
     await db.commit()
     await db.refresh(center)
     return center
@@ -663,11 +1065,13 @@ async def delete_center(
         raise HTTPException(status_code=404, detail="Center not found")
 
     await db.delete(center)
+    await publish_invalidation(db, "rheumatology_centers")
     await db.commit()
     return {"message": "Center deleted"}
 
 
-@router.get("/centers/{center_id}/with-staff", response_model=RheumatologyCenterWithStaffResponse)
+@router.get("/centers/{center_id}/with-staff", response_model=RheumatologyCenterWithStaffResponse,
+             dependencies=[Depends(etag_guard("rheumatology_centers", "center_staff"))])
 async def get_center_with_staff(center_id: int, db: AsyncSession = Depends(get_db)):
     """Получить центр вместе с сотрудниками"""
     result = await db.execute(
@@ -682,29 +1086,38 @@ async def get_center_with_staff(center_id: int, db: AsyncSession = Depends(get_d
 
 
 # ==================== СОТРУДНИКИ ЦЕНТРОВ ====================
-@router.get("/center-staff", response_model=List[CenterStaffResponse])
+@router.get("/center-staff", response_model=Union[List[CenterStaffResponse], List[CenterStaffLocalizedResponse]],
+             dependencies=[Depends(etag_guard("center_staff"))])
 async def get_center_staff(
+    response: Response,
     db: AsyncSession = Depends(get_db),
     center_id: Optional[int] = None,
-    include_inactive: bool = False
+    include_inactive: bool = False,
+    lang: Optional[Language] = None
 ):
     """Получить сотрудников центров"""
-    query = select(CenterStaff).order_by(CenterStaff.order)
+    query = center_staff_projection.select(lang).order_by(CenterStaff.order)
     if center_id:
         query = query.where(CenterStaff.center_id == center_id)
     if not include_inactive:
         query = query.where(CenterStaff.is_active == True)
     result = await db.execute(query)
-    return result.scalars().all()
+    return trusted_response(center_staff_projection.all(result), response)
 
 
-@router.get("/center-staff/{staff_id}", response_model=CenterStaffResponse)
-async def get_staff_member(staff_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(CenterStaff).where(CenterStaff.id == staff_id))
-    staff = result.scalar_one_or_none()
+@router.get("/center-staff/{staff_id}", response_model=Union[CenterStaffResponse, CenterStaffLocalizedResponse],
+             dependencies=[Depends(etag_guard("center_staff"))])
+async def get_staff_member(
+    response: Response,
+    staff_id: int,
+    db: AsyncSession = Depends(get_db),
+    lang: Optional[Language] = None
+):
+    result = await db.execute(center_staff_projection.select(lang).where(CenterStaff.id == staff_id))
+    staff = center_staff_projection.one_or_none(result)
     if not staff:
         raise HTTPException(status_code=404, detail="Staff member not found")
-    return staff
+    return trusted_response(staff, response)
 
 
 @router.post("/center-staff", response_model=CenterStaffResponse)
@@ -720,6 +1133,7 @@ async def create_staff_member(
 
     staff = CenterStaff(**data.model_dump())
     db.add(staff)
+    await publish_invalidation(db, "center_staff")
     await db.commit()
     await db.refresh(staff)
     return staff
@@ -747,6 +1161,7 @@ async def update_staff_member(
     for key, value in update_data.items():
         setattr(staff, key, value)
 
+    await publish_invalidation(db, "center_staff")
     await db.commit()
     await db.refresh(staff)
     return staff
@@ -764,6 +1179,7 @@ async def delete_staff_member(
         raise HTTPException(status_code=404, detail="Staff member not found")
 
     await db.delete(staff)
+    await publish_invalidation(db, "center_staff")
     await db.commit()
     return {"message": "Staff member deleted"}
 
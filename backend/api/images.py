@@ -0,0 +1,27 @@
+"""Уменьшенные копии загруженных изображений: /img/{width}/{filename}"""
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import FileResponse
+
+from config import settings
+from functions.images import ImageError, image_cache
+
+router = APIRouter()
+
+# Имя файла — хеш содержимого, копия по этому адресу никогда не меняется
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+@router.get("/{width}/{filename}")
+async def get_image(width: int, filename: str, request: Request):
+    """Изображение шириной не больше width (из IMAGE_WIDTHS); WebP, если клиент его принимает"""
+    if width not in settings.IMAGE_WIDTHS:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Width is not allowed")
+    webp = "image/webp" in request.headers.get("accept", "")
+    try:
+        result = await image_cache.get(filename, width, webp)
+    except ImageError:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail="File is not an image")
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+    path, media_type = result
+    return FileResponse(path, media_type=media_type, headers={"Cache-Control": IMMUTABLE, "Vary": "Accept"})
@@ -0,0 +1,40 @@
+"""Служебные эндпоинты (не проксируются nginx, доступны только изнутри сети)"""
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from database.connection import pool_stats
+from functions.cache import content_cache, user_cache
+from functions.images import image_cache
+from functions.invalidation import invalidation_listener
+from functions.metrics import CONTENT_TYPE, request_metrics
+from functions.query_budget import query_budget
+from functions.snapshots import snapshot_publisher
+from functions.view_counter import view_counter
+
+router = APIRouter()
+
+
+@router.get("/cache")
+async def get_cache_stats():
+    """Статистика кэша публичного контента (hits/misses, размер)"""
+    return {
+        "content": content_cache.stats(),
+        "users": user_cache.stats(),
+        "invalidation": invalidation_listener.stats(),
+        "snapshots": snapshot_publisher.stats(),
+        "views": view_counter.stats(),
+        "images": image_cache.stats(),
+        "query_budget": query_budget.stats(),
+    }
+
+
+@router.get("/db/pool")
+async def get_pool_stats():
+    """Пул соединений воркера: занятые, overflow, ожидание выдачи соединения"""
+    return pool_stats()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Метрики в формате Prometheus: запросы, время ответа и время в БД по маршрутам, пул соединений"""
+    return PlainTextResponse(await request_metrics.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,21 @@
+"""Общие помощники бенчмарков"""
+import statistics
+from typing import List
+
+
+def percentile(values: List[float], pct: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def latency_summary(values: List[float]) -> dict:
+    """p50/p95/p99/max в миллисекундах (values — в секундах)"""
+    ms = [v * 1000 for v in values]
+    return {
+        "count": len(ms),
+        "p50": round(percentile(ms, 50), 2),
+        "p95": round(percentile(ms, 95), 2),
+        "p99": round(percentile(ms, 99), 2),
+        "max": round(max(ms), 2) if ms else 0.0,
+    }
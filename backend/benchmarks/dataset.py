@@ -0,0 +1,482 @@
+"""
+Детерминированный синтетический набор данных для нагрузочных тестов
+
+В отличие от seed_data.py (десяток написанных вручную строк, по одному ORM-объекту)
+набор строится любого размера: от состава действующего сайта (small) до объёмов,
+на которых видны проблемы планов запросов и индексов (large: 100 тыс. новостей,
+5 тыс. центров с сотрудниками, 1 млн заявок в школу, 200 тыс. регистраций на конгресс).
+
+Тексты — на трёх языках, из тематических слов и псевдослов (как в search_benchmark),
+так что размер полей и выборочность поиска похожи на настоящие. У каждой таблицы свой
+генератор, инициализированный из (seed, таблица): тот же seed даёт те же строки
+(включая created_at), а изменение размера одной таблицы не меняет остальные. Строки генерируются потоком и
+загружаются пакетами — COPY в Postgres (asyncpg), иначе Core insert — в таблицы без
+индексов, индексы строятся после загрузки. Память не растёт с размером набора.
+
+Запуск из папки backend; схема пересоздаётся, поэтому нужна ОТДЕЛЬНАЯ база:
+    python -m benchmarks.dataset --database-url postgresql+asyncpg://postgres@localhost/rheum_bench
+    python -m benchmarks.dataset --preset large --seed 7
+    python -m benchmarks.dataset --preset small --scale '{"news": 20000}' --method insert
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+
+from database import Base
+from database.models import (
+    BoardMember, Partner, Charter, ChiefRheumatologist, Disease, DiseaseDocument,
+    RheumatologyCenter, CenterStaff, News, SchoolApplication, Congress, CongressRegistration,
+    User, UserRole,
+)
+from functions.auth import get_password_hash
+from benchmarks.search_benchmark import TOPIC_WORDS, filler_vocabulary
+
+BATCH_SIZE = 1000
+COPY_BATCH_SIZE = 10000
+LANGS = ("ru", "uz", "en")
+
+ADMIN_EMAIL = "admin@benchmark.invalid"
+ADMIN_PASSWORD = "benchmark-admin"
+
+# Размер набора по умолчанию: как у действующего сайта, с запасом по новостям и заявкам
+DEFAULT_SCALE = {
+    "board_members": 20,
+    "partners": 15,
+    "chief_rheumatologists": 14,
+    "diseases": 30,
+    "disease_documents": 60,
+    "centers": 40,
+    "staff_per_center": 6,
+    "news": 2000,
+    "school_applications": 2000,
+    "congresses": 3,
+    "congress_registrations": 2000,
+}
+
+PRESETS = {
+    "small": DEFAULT_SCALE,
+    "medium": {
+        **DEFAULT_SCALE,
+        "diseases": 100, "disease_documents": 500, "centers": 500,
+        "news": 20_000, "school_applications": 100_000,
+        "congresses": 10, "congress_registrations": 20_000,
+    },
+    "large": {
+        **DEFAULT_SCALE,
+        "board_members": 50, "partners": 50, "chief_rheumatologists": 14,
+        "diseases": 300, "disease_documents": 3000, "centers": 5000,
+        "news": 100_000, "school_applications": 1_000_000,
+        "congresses": 20, "congress_registrations": 200_000,
+    },
+}
+
+LAST_NAMES = {
+    "ru": "Каримов Юсупова Рахимов Ахмедова Назаров Исмоилова Турсунов Алиева Хасанов Собирова".split(),
+    "uz": "Karimov Yusupova Rahimov Ahmedova Nazarov Ismoilova Tursunov Aliyeva Hasanov Sobirova".split(),
+    "en": "Karimov Yusupova Rakhimov Akhmedova Nazarov Ismoilova Tursunov Alieva Khasanov Sobirova".split(),
+}
+FIRST_NAMES = {
+    "ru": "Азиз Дилноза Бахтиёр Гулнора Шерзод Нилуфар Отабек Малика Жасур Севара".split(),
+    "uz": "Aziz Dilnoza Baxtiyor Gulnora Sherzod Nilufar Otabek Malika Jasur Sevara".split(),
+    "en": "Aziz Dilnoza Bakhtiyor Gulnora Sherzod Nilufar Otabek Malika Jasur Sevara".split(),
+}
+CITIES = "Ташкент Самарканд Бухара Андижан Наманган Фергана Нукус Карши Термез Ургенч".split()
+EPOCH = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+class TextGenerator:
+    def __init__(self, rng: random.Random, filler: Optional[dict] = None):
+        self.rng = rng
+        self.filler = filler if filler is not None else filler_vocabulary(rng)
+
+    def text(self, lang: str, topic: int, noise: int) -> str:
+        words = self.rng.choices(TOPIC_WORDS[lang], k=topic) + self.rng.choices(self.filler[lang], k=noise)
+        self.rng.shuffle(words)
+        return " ".join(words)
+
+    def fields(self, field: str, topic: int, noise: int, capitalize: bool = False) -> Dict[str, str]:
+        """{field_ru, field_uz, field_en}"""
+        values = {}
+        for lang in LANGS:
+            value = self.text(lang, topic, noise)
+            values[f"{field}_{lang}"] = value.capitalize() if capitalize else value
+        return values
+
+    def person(self) -> Dict[str, str]:
+        i, j = self.rng.randrange(len(LAST_NAMES["ru"])), self.rng.randrange(len(FIRST_NAMES["ru"]))
+        values = {}
+        for lang in LANGS:
+            values[f"last_name_{lang}"] = LAST_NAMES[lang][i]
+            values[f"first_name_{lang}"] = FIRST_NAMES[lang][j]
+        return values
+
+    def upload_url(self, ext: str = ".jpg") -> str:
+        return f"/uploads/{self.rng.getrandbits(256):064x}{ext}"
+
+    def timestamp(self, days: int = 3 * 365) -> datetime:
+        return EPOCH + timedelta(seconds=self.rng.randrange(days * 86400))
+
+
+def board_member_rows(gen: TextGenerator, count: int) -> Iterator[dict]:
+    return ({
+        **gen.person(),
+        **gen.fields("position", 2, 2, capitalize=True),
+        **gen.fields("degree", 1, 2),
+        **gen.fields("workplace", 2, 6),
+        **gen.fields("bio", 10, 120),
+        **gen.fields("achievements", 5, 40),
+        "photo_url": gen.upload_url(),
+        "email": f"member{i}@example.uz",
+        "order": i,
+        "created_at": gen.timestamp(),
+        "is_active": gen.rng.random() < 0.9,
+    } for i in range(count))
+
+
+def partner_rows(gen: TextGenerator, count: int) -> Iterator[dict]:
+    return ({
+        **gen.fields("name", 2, 3, capitalize=True),
+        **gen.fields("description", 5, 40),
+        **gen.fields("country", 0, 1, capitalize=True),
+        "short_name": f"P{i}",
+        "logo_url": gen.upload_url(".png"),
+        "website_url": f"https://partner{i}.example.org",
+        "order": i,
+        "created_at": gen.timestamp(),
+        "is_active": True,
+    } for i in range(count))
+
+
+def chief_rheumatologist_rows(gen: TextGenerator, count: int) -> Iterator[dict]:
+    return ({
+        **gen.person(),
+        **gen.fields("position", 2, 2, capitalize=True),
+        **gen.fields("region", 0, 1, capitalize=True),
+        **gen.fields("workplace", 2, 6),
+        **gen.fields("bio", 10, 100),
+        "photo_url": gen.upload_url(),
+        "order": i,
+        "created_at": gen.timestamp(),
+        "is_active": True,
+    } for i in range(count))
+
+
+def disease_rows(gen: TextGenerator, count: int) -> Iterator[dict]:
+    return ({
+        **gen.fields("name", 2, 1, capitalize=True),
+        **gen.fields("description", 15, 150),
+        **gen.fields("symptoms", 10, 80),
+        **gen.fields("treatment", 10, 100),
+        "short_name": f"D{i}",
+        "image_url": gen.upload_url(),
+        "protocol_file_url": gen.upload_url(".pdf"),
+        "order": i,
+        "created_at": gen.timestamp(),
+        "is_active": gen.rng.random() < 0.95,
+    } for i in range(count))
+
+
+def disease_document_rows(gen: TextGenerator, count: int, disease_ids: List[int]) -> Iterator[dict]:
+    return ({
+        **gen.fields("title", 2, 4, capitalize=True),
+        **gen.fields("description", 4, 20),
+        "disease_id": gen.rng.choice(disease_ids) if disease_ids else None,
+        "file_url": gen.upload_url(".pdf"),
+        "document_type": gen.rng.choice(("guideline", "info", "research")),
+        "order": i,
+        "created_at": gen.timestamp(),
+        "is_active": True,
+    } for i in range(count))
+
+
+def center_rows(gen: TextGenerator, count: int) -> Iterator[dict]:
+    return ({
+        **gen.fields("name", 2, 3, capitalize=True),
+        **gen.fields("description", 5, 40),
+        **gen.fields("address", 1, 4),
+        "phone": f"+998 71 {i:03d} 00 00",
+        "image_url": gen.upload_url(),
+        "order": i,
+        "created_at": gen.timestamp(),
+        "is_active": gen.rng.random() < 0.95,
+    } for i in range(count))
+
+
+def staff_rows(gen: TextGenerator, center_ids: List[int], per_center: int) -> Iterator[dict]:
+    return ({
+        **gen.person(),
+        **gen.fields("position", 2, 1, capitalize=True),
+        **gen.fields("credentials", 1, 4),
+        "center_id": center_id,
+        "photo_url": gen.upload_url(),
+        "order": i,
+        "created_at": gen.timestamp(),
+        "is_active": gen.rng.random() < 0.95,
+    } for center_id in center_ids for i in range(per_center))
+
+
+def news_rows(gen: TextGenerator, count: int) -> Iterator[dict]:
+    for _ in range(count):
+        created_at = gen.timestamp()
+        row = {
+            **gen.fields("title", 2, 5, capitalize=True),
+            **gen.fields("subtitle", 1, 6),
+            **gen.fields("excerpt", 2, 18),
+            **gen.fields("content", 6, 250),
+            "news_type": "event" if gen.rng.random() < 0.2 else "news",
+            "image_url": gen.upload_url(),
+            "is_published": gen.rng.random() < 0.95,
+            "is_featured": gen.rng.random() < 0.03,
+            "views_count": int(gen.rng.paretovariate(1.2) * 20),
+            "created_at": created_at,
+            # executemany требует одинаковый набор ключей во всех строках пакета
+            "event_date_start": None,
+            "event_date_end": None,
+            **{f"event_location_{lang}": None for lang in LANGS},
+        }
+        if row["news_type"] == "event":
+            row["event_date_start"] = created_at + timedelta(days=gen.rng.randint(7, 400))
+            row["event_date_end"] = row["event_date_start"] + timedelta(days=gen.rng.randint(0, 3))
+            row.update(gen.fields("event_location", 0, 2, capitalize=True))
+        yield row
+
+
+def school_application_rows(gen: TextGenerator, count: int) -> Iterator[dict]:
+    rng = gen.rng
+    return ({
+        "school_type": "patient" if rng.random() < 0.3 else "rheumatologist",
+        "last_name": rng.choice(LAST_NAMES["ru"]),
+        "first_name": rng.choice(FIRST_NAMES["ru"]),
+        "phone": f"+998 9{rng.randint(0, 9)} {rng.randint(100, 999)} {rng.randint(10, 99)} {rng.randint(10, 99)}",
+        "city": rng.choice(CITIES),
+        "category": rng.choice(("highest", "first", "second", "third", "none")),
+        "inn": f"{rng.randrange(10 ** 9):09d}",
+        "email": f"applicant{i}@example.uz",
+        "specialization": "Ревматология",
+        "workplace": gen.text("ru", 1, 4),
+        "status": rng.choice(("pending", "pending", "pending", "approved", "rejected")),
+        "created_at": gen.timestamp(),
+    } for i in range(count))
+
+
+def congress_rows(gen: TextGenerator, count: int) -> Iterator[dict]:
+    for i in range(count):
+        date_start = gen.timestamp() + timedelta(days=180)
+        yield {
+            **gen.fields("title", 2, 4, capitalize=True),
+            **gen.fields("description", 10, 80),
+            **gen.fields("program", 15, 300),
+            **gen.fields("location", 0, 2, capitalize=True),
+            "date_start": date_start,
+            "date_end": date_start + timedelta(days=gen.rng.randint(1, 3)),
+            "image_url": gen.upload_url(),
+            "is_active": True,
+            "registration_open": i == count - 1,
+            "created_at": date_start - timedelta(days=240),
+        }
+
+
+def congress_registration_rows(gen: TextGenerator, count: int, congresses: List[tuple]) -> Iterator[dict]:
+    """Регистрации распределены по конгрессам неравномерно и приходят в последние недели перед началом"""
+    rng = gen.rng
+    weights = [1 / (rank + 1) for rank in range(len(congresses))]
+    for i in range(count):
+        congress_id, date_start = rng.choices(congresses, weights)[0]
+        yield {
+            "congress_id": congress_id,
+            "user_id": None,
+            "last_name": rng.choice(LAST_NAMES["ru"]),
+            "first_name": rng.choice(FIRST_NAMES["ru"]),
+            "patronymic": None,
+            "email": f"delegate{i}@example.uz",
+            "phone": f"+998 9{rng.randint(0, 9)} {rng.randint(100, 999)} {rng.randint(10, 99)} {rng.randint(10, 99)}",
+            "organization": gen.text("ru", 1, 4),
+            "position": rng.choice(("Ревматолог", "Терапевт", "Ординатор", "Заведующий отделением")),
+            "created_at": date_start - timedelta(seconds=int(rng.expovariate(1 / (14 * 86400)))),
+        }
+
+
+# ==================== ЗАГРУЗКА ====================
+def _batches(rows: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def _python_defaults(model, columns: Iterable[str]) -> Dict[str, object]:
+    """Скалярные default= колонок, которых нет в строке: Core insert подставляет их сам, COPY — нет"""
+    return {
+        column.name: column.default.arg
+        for column in model.__table__.columns
+        if column.name not in columns and column.default is not None and column.default.is_scalar
+    }
+
+
+async def _copy(conn: AsyncConnection, model, rows: Iterable[dict]) -> int:
+    """COPY строк в таблицу через asyncpg (в текущей транзакции); возвращает число строк"""
+    raw = (await conn.get_raw_connection()).driver_connection
+    table = model.__table__.name
+    count = 0
+    columns = defaults = None
+    for batch in _batches(rows, COPY_BATCH_SIZE):
+        if columns is None:
+            defaults = _python_defaults(model, batch[0])
+            columns = list(batch[0]) + list(defaults)
+        await raw.copy_records_to_table(
+            table, columns=columns,
+            records=[tuple({**row, **defaults}[name] for name in columns) for row in batch],
+        )
+        count += len(batch)
+    return count
+
+
+async def _insert(conn: AsyncConnection, model, rows: Iterable[dict]) -> int:
+    """Пакетный Core insert (executemany); возвращает число строк"""
+    count = 0
+    for batch in _batches(rows, BATCH_SIZE):
+        await conn.execute(insert(model), batch)
+        count += len(batch)
+    return count
+
+
+async def _insert_returning(conn: AsyncConnection, model, rows: Iterable[dict], *columns) -> List[tuple]:
+    """Core insert с RETURNING — для таблиц, на которые ссылаются следующие"""
+    returned = []
+    for batch in _batches(rows, BATCH_SIZE):
+        result = await conn.execute(insert(model).returning(*columns), batch)
+        returned.extend(tuple(row) for row in result.all())
+    return returned
+
+
+async def seed_dataset(
+    conn: AsyncConnection,
+    seed: int = 42,
+    scale: Optional[dict] = None,
+    method: str = "auto",
+    progress: bool = False,
+) -> Dict[str, int]:
+    """Вставить набор данных в пустую базу; возвращает число строк по таблицам.
+
+    method: "copy" — COPY (только Postgres), "insert" — Core insert, "auto" — COPY, если возможно.
+    """
+    scale = {**DEFAULT_SCALE, **(scale or {})}
+    if method == "auto":
+        method = "copy" if conn.dialect.name == "postgresql" else "insert"
+    load = _copy if method == "copy" else _insert
+    filler = filler_vocabulary(random.Random(seed))
+    counts: Dict[str, int] = {}
+
+    def generator(table: str) -> TextGenerator:
+        return TextGenerator(random.Random(f"{seed}:{table}"), filler)
+
+    async def step(table: str, coroutine):
+        started = time.perf_counter()
+        result = await coroutine
+        counts[table] = result if isinstance(result, int) else len(result)
+        if progress:
+            print(f"  {table:24} {counts[table]:>9} rows  {time.perf_counter() - started:7.1f}s", flush=True)
+        return result
+
+    await step("users", _insert(conn, User, [{
+        "email": ADMIN_EMAIL,
+        "hashed_password": get_password_hash(ADMIN_PASSWORD),
+        "last_name": "Benchmark",
+        "first_name": "Admin",
+        "role": UserRole.ADMIN,
+        "created_at": EPOCH,
+    }]))
+    await step("board_members", load(conn, BoardMember, board_member_rows(generator("board_members"),
+                                                                          scale["board_members"])))
+    await step("partners", load(conn, Partner, partner_rows(generator("partners"), scale["partners"])))
+    gen = generator("charters")
+    await step("charters", load(conn, Charter, [{
+        **gen.fields("title", 1, 3, capitalize=True),
+        **gen.fields("description", 5, 60),
+        "file_url": gen.upload_url(".pdf"),
+        "version": "1.0",
+        "is_active": True,
+        "created_at": EPOCH,
+    }]))
+    await step("chief_rheumatologists", load(conn, ChiefRheumatologist, chief_rheumatologist_rows(
+        generator("chief_rheumatologists"), scale["chief_rheumatologists"])))
+    diseases = await step("diseases", _insert_returning(
+        conn, Disease, disease_rows(generator("diseases"), scale["diseases"]), Disease.id))
+    await step("disease_documents", load(conn, DiseaseDocument, disease_document_rows(
+        generator("disease_documents"), scale["disease_documents"], [row[0] for row in diseases])))
+    centers = await step("rheumatology_centers", _insert_returning(
+        conn, RheumatologyCenter, center_rows(generator("centers"), scale["centers"]), RheumatologyCenter.id))
+    await step("center_staff", load(conn, CenterStaff, staff_rows(
+        generator("center_staff"), [row[0] for row in centers], scale["staff_per_center"])))
+    await step("news", load(conn, News, news_rows(generator("news"), scale["news"])))
+    await step("school_applications", load(conn, SchoolApplication, school_application_rows(
+        generator("school_applications"), scale["school_applications"])))
+    congresses = await step("congresses", _insert_returning(
+        conn, Congress, congress_rows(generator("congresses"), scale["congresses"]),
+        Congress.id, Congress.date_start))
+    if congresses:
+        await step("congress_registrations", load(conn, CongressRegistration, congress_registration_rows(
+            generator("congress_registrations"), scale["congress_registrations"], congresses)))
+    return counts
+
+
+async def build_dataset(
+    engine: AsyncEngine,
+    seed: int = 42,
+    scale: Optional[dict] = None,
+    method: str = "auto",
+    progress: bool = False,
+) -> Dict[str, int]:
+    """Пересоздать схему, загрузить набор данных и обновить статистику планировщика"""
+    indexes = [index for table in Base.metadata.sorted_tables for index in table.indexes]
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        # Индексы (в том числе GIN по tsvector) строятся один раз после загрузки,
+        # а не обновляются на каждую строку — при больших наборах это в разы быстрее
+        await conn.run_sync(lambda sync_conn: [index.drop(sync_conn) for index in indexes])
+        counts = await seed_dataset(conn, seed=seed, scale=scale, method=method, progress=progress)
+        started = time.perf_counter()
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("SET LOCAL maintenance_work_mem = '256MB'"))
+        await conn.run_sync(lambda sync_conn: [index.create(sync_conn) for index in indexes])
+        if progress:
+            print(f"  {'indexes':24} {len(indexes):>9}       {time.perf_counter() - started:7.1f}s")
+    if engine.dialect.name == "postgresql":
+        async with engine.connect() as conn:
+            await conn.execute(text("ANALYZE"))
+    return counts
+
+
+async def main(args) -> None:
+    engine = create_async_engine(args.database_url)
+    scale = {**PRESETS[args.preset], **(json.loads(args.scale) if args.scale else {})}
+    print(f"Building dataset: preset={args.preset}, seed={args.seed}, method={args.method}")
+    started = time.perf_counter()
+    try:
+        counts = await build_dataset(engine, args.seed, scale, args.method, progress=True)
+    finally:
+        await engine.dispose()
+    print(f"Done in {time.perf_counter() - started:.1f}s, {sum(counts.values())} rows")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build a deterministic synthetic dataset")
+    parser.add_argument("--database-url", default=os.environ.get("BENCHMARK_DATABASE_URL"),
+                        help="отдельная база: схема будет пересоздана (или BENCHMARK_DATABASE_URL)")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="small")
+    parser.add_argument("--scale", help='переопределить размеры, JSON: {"news": 20000}')
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--method", choices=("auto", "copy", "insert"), default="auto")
+    cli_args = parser.parse_args()
+    if not cli_args.database_url:
+        parser.error("--database-url or BENCHMARK_DATABASE_URL is required (the schema is recreated)")
+    asyncio.run(main(cli_args))
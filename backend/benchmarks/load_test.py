@@ -0,0 +1,442 @@
+"""
+Нагрузочный тест публичного и админского API на синтетических данных
+
+Запуск из папки backend; нужна ОТДЕЛЬНАЯ база Postgres — схема пересоздаётся:
+    python -m benchmarks.load_test --database-url postgresql+asyncpg://postgres@localhost/rheum_bench
+    python -m benchmarks.load_test --save benchmarks/baselines/load_test.json
+    python -m benchmarks.load_test --compare benchmarks/baselines/load_test.json
+    python -m benchmarks.load_test --scenarios home_burst,news_scrolling --users 10
+
+База задаётся --database-url или BENCHMARK_DATABASE_URL (DATABASE_URL из .env не
+используется, чтобы не затереть рабочие данные). Приложение запускается в процессе
+со своим lifespan, запросы идут через functions/asgi.py — весь стек middleware,
+зависимостей и сериализации, без сетевого клиента. Виртуальные пользователи
+каждого сценария работают параллельно в одном event loop, как клиенты одного
+воркера uvicorn, и, как браузер, повторяют GET с If-None-Match.
+
+По каждому эндпоинту: число запросов, ошибки, пропускная способность, p50/p95/p99
+и число SQL-запросов на запрос. Сценарии повторяются --rounds раз (первый раунд —
+с холодными кэшами), в отчёт идёт медиана по раундам: один прогон p95 слишком шумный. --save пишет результат в JSON, --compare сравнивает
+с сохранённым: рост p95 больше --threshold или рост числа SQL-запросов — регрессия
+(код выхода 1).
+"""
+import argparse
+import asyncio
+import contextvars
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+
+# Счётчик SQL-запросов текущего HTTP-запроса (задачи asyncio.gather наследуют контекст)
+_current_request: contextvars.ContextVar = contextvars.ContextVar("load_test_request", default=None)
+
+
+@dataclass
+class Scenario:
+    name: str
+    run: Callable
+    users: int
+    iterations: int
+
+
+class Metrics:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.queries: Dict[str, List[int]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    def record(self, endpoint: str, status: int, ok: bool, latency: float, queries: int) -> None:
+        self.latencies[endpoint].append(latency)
+        self.queries[endpoint].append(queries)
+        self.statuses[endpoint][status] += 1
+        if not ok:
+            self.errors[endpoint] += 1
+
+
+class RequestCounter:
+    __slots__ = ("queries",)
+
+    def __init__(self):
+        self.queries = 0
+
+
+class VirtualUser:
+    """Клиент со своим кэшем ETag и токеном"""
+
+    def __init__(self, app, metrics: Metrics, rng: random.Random):
+        self.app = app
+        self.metrics = metrics
+        self.rng = rng
+        self.token: Optional[str] = None
+        self.etags: Dict[Tuple[str, str], str] = {}
+
+    async def request(
+        self,
+        endpoint: str,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        json_body=None,
+        form: Optional[dict] = None,
+        expect: Iterable[int] = (200,),
+    ):
+        from functions.asgi import ASGIResponse, asgi_request
+
+        headers, body = [], b""
+        if json_body is not None:
+            body = json.dumps(json_body).encode()
+            headers.append(("content-type", "application/json"))
+        elif form is not None:
+            body = urlencode(form).encode()
+            headers.append(("content-type", "application/x-www-form-urlencoded"))
+        if self.token:
+            headers.append(("authorization", f"Bearer {self.token}"))
+        cache_key = (path, urlencode(params or {}))
+        if method == "GET" and cache_key in self.etags:
+            headers.append(("if-none-match", self.etags[cache_key]))
+
+        counter = RequestCounter()
+        token = _current_request.set(counter)
+        started = time.perf_counter()
+        try:
+            response = await asgi_request(self.app, method, path, params=params, body=body, headers=headers)
+        except Exception as e:
+            # Необработанное исключение uvicorn превратил бы в 500
+            response = ASGIResponse(500, {}, repr(e).encode())
+        finally:
+            latency = time.perf_counter() - started
+            _current_request.reset(token)
+
+        ok = response.status in expect or (method == "GET" and response.status == 304)
+        self.metrics.record(endpoint, response.status, ok, latency, counter.queries)
+        if method == "GET" and "etag" in response.headers:
+            self.etags[cache_key] = response.headers["etag"]
+        if response.status == 200 and response.headers.get("content-type", "").startswith("application/json"):
+            return json.loads(response.body)
+        return None
+
+    def cached(self, path: str) -> bool:
+        return any(key[0] == path for key in self.etags)
+
+
+# ==================== СЦЕНАРИИ ====================
+async def home_burst(user: VirtualUser, context: dict):
+    """Первый заход на главную: главная, популярные и избранные новости"""
+    lang = user.rng.choice(("ru", "ru", "uz", "en"))
+    await user.request("GET /content/home", "GET", "/api/content/home", {"lang": lang})
+    await user.request("GET /content/news/popular", "GET", "/api/content/news/popular",
+                       {"lang": lang, "summary": "true"})
+    await user.request("GET /content/news/featured", "GET", "/api/content/news/featured",
+                       {"lang": lang, "summary": "true"})
+
+
+async def news_scrolling(user: VirtualUser, context: dict):
+    """Лента новостей: несколько страниц по курсору, затем одна новость и её просмотр"""
+    params = {"lang": "ru", "summary": "true", "limit": 12}
+    items = []
+    for _ in range(user.rng.randint(2, 5)):
+        page = await user.request("GET /content/news/feed", "GET", "/api/content/news/feed", params)
+        if not page:
+            break
+        items.extend(page["items"])
+        if not page["next_cursor"]:
+            break
+        params = {**params, "cursor": page["next_cursor"]}
+    if items:
+        news_id = user.rng.choice(items)["id"]
+        await user.request("GET /content/news/{id}", "GET", f"/api/content/news/{news_id}", {"lang": "ru"})
+        await user.request("POST /content/news/{id}/view", "POST", f"/api/content/news/{news_id}/view",
+                           expect=(200,))
+
+
+async def rheumatology_page(user: VirtualUser, context: dict):
+    """Страница «Ревматология»: центры с сотрудниками, главные ревматологи, заболевания"""
+    await user.request("GET /content/centers/with-staff", "GET", "/api/content/centers/with-staff")
+    await user.request("GET /content/chief-rheumatologists", "GET", "/api/content/chief-rheumatologists",
+                       {"lang": "ru"})
+    diseases = await user.request("GET /content/diseases", "GET", "/api/content/diseases", {"lang": "ru"})
+    if diseases:
+        context["disease_ids"] = [item["id"] for item in diseases]
+    if context.get("disease_ids"):
+        disease_id = user.rng.choice(context["disease_ids"])
+        await user.request("GET /content/diseases/{id}", "GET", f"/api/content/diseases/{disease_id}",
+                           {"lang": "ru"})
+
+
+async def registration_spike(user: VirtualUser, context: dict):
+    """Открытие регистрации: поток заявок на школу ревматологов"""
+    rng = user.rng
+    n = rng.randrange(10 ** 9)
+    await user.request("POST /content/school-applications", "POST", "/api/content/school-applications", json_body={
+        "school_type": "rheumatologist",
+        "last_name": "Каримов",
+        "first_name": "Азиз",
+        "phone": f"+998 90 {n % 1000:03d} {n % 97:02d} {n % 89:02d}",
+        "city": rng.choice(("Ташкент", "Самарканд", "Бухара")),
+        "category": rng.choice(("highest", "first", "second", "third", "none")),
+        "inn": f"{n:09d}",
+        "email": f"spike{n}@example.uz",
+        "specialization": "Ревматология",
+        "workplace": "Городская клиническая больница",
+    })
+
+
+async def admin_session(user: VirtualUser, context: dict):
+    """Редактор: заявки, список новостей, правка и создание/удаление новости"""
+    from benchmarks.dataset import ADMIN_EMAIL, ADMIN_PASSWORD
+
+    if user.token is None:
+        login = await user.request("POST /auth/login", "POST", "/api/auth/login",
+                                   form={"username": ADMIN_EMAIL, "password": ADMIN_PASSWORD})
+        user.token = login["access_token"]
+    await user.request("GET /content/school-applications", "GET", "/api/content/school-applications")
+    news = await user.request("GET /content/news (admin)", "GET", "/api/content/news",
+                              {"published_only": "false", "limit": 20})
+    if news:
+        news_id = user.rng.choice(news)["id"]
+        await user.request("PUT /content/news/{id}", "PUT", f"/api/content/news/{news_id}",
+                           json_body={"title_ru": f"Отредактировано {user.rng.randrange(10 ** 6)}"})
+    created = await user.request("POST /content/news", "POST", "/api/content/news", json_body={
+        **{f"title_{lang}": "Черновик" for lang in ("ru", "uz", "en")},
+        **{f"content_{lang}": "Текст черновика" for lang in ("ru", "uz", "en")},
+        "is_published": False,
+    })
+    if created:
+        await user.request("DELETE /content/news/{id}", "DELETE", f"/api/content/news/{created['id']}")
+
+
+SCENARIOS = [
+    Scenario("home_burst", home_burst, users=50, iterations=3),
+    Scenario("news_scrolling", news_scrolling, users=20, iterations=3),
+    Scenario("rheumatology_page", rheumatology_page, users=20, iterations=3),
+    Scenario("registration_spike", registration_spike, users=50, iterations=4),
+    Scenario("admin_session", admin_session, users=2, iterations=5),
+]
+
+
+# ==================== ЗАПУСК ====================
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = _current_request.get()
+    if counter is not None:
+        counter.queries += 1
+
+
+async def run_scenario(app, scenario: Scenario, metrics: Metrics, seed: str) -> dict:
+    context: dict = {}
+
+    async def virtual_user(index: int):
+        user = VirtualUser(app, metrics, random.Random(f"{seed}:{scenario.name}:{index}"))
+        for _ in range(scenario.iterations):
+            await scenario.run(user, context)
+
+    before = sum(len(v) for v in metrics.latencies.values())
+    started = time.perf_counter()
+    await asyncio.gather(*(virtual_user(i) for i in range(scenario.users)))
+    wall_time = time.perf_counter() - started
+    requests = sum(len(v) for v in metrics.latencies.values()) - before
+    return {
+        "users": scenario.users,
+        "iterations": scenario.iterations,
+        "requests": requests,
+        "wall_time_s": round(wall_time, 3),
+        "throughput_rps": round(requests / wall_time, 1) if wall_time else 0.0,
+    }
+
+
+def summarize(metrics: Metrics, wall_times: Dict[str, float]) -> Dict[str, dict]:
+    from benchmarks.common import latency_summary
+
+    endpoints = {}
+    for endpoint, latencies in metrics.latencies.items():
+        queries = metrics.queries[endpoint]
+        summary = latency_summary(latencies)
+        wall_time = wall_times.get(endpoint) or sum(latencies)
+        endpoints[endpoint] = {
+            **summary,
+            "errors": metrics.errors[endpoint],
+            "statuses": {str(code): count for code, count in sorted(metrics.statuses[endpoint].items())},
+            "throughput_rps": round(len(latencies) / wall_time, 1) if wall_time else 0.0,
+            "queries_avg": round(sum(queries) / len(queries), 2),
+            "queries_max": max(queries),
+        }
+    return endpoints
+
+
+def merge_rounds(rounds: List[Dict[str, dict]]) -> Dict[str, dict]:
+    """Свести раунды: медиана времён и пропускной способности, сумма счётчиков, максимум SQL"""
+    merged = {}
+    for name in rounds[0]:
+        values = [r[name] for r in rounds if name in r]
+        stats = {}
+        for key, value in values[0].items():
+            column = [v[key] for v in values]
+            if key in ("count", "requests", "errors"):
+                stats[key] = sum(column)
+            elif key == "queries_max":
+                stats[key] = max(column)
+            elif key == "statuses":
+                statuses = defaultdict(int)
+                for item in column:
+                    for code, count in item.items():
+                        statuses[code] += count
+                stats[key] = dict(sorted(statuses.items()))
+            elif isinstance(value, float):
+                stats[key] = round(statistics.median(column), 3)
+            else:
+                stats[key] = value
+        merged[name] = stats
+    return merged
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(report: dict) -> None:
+    print(f"\n{'scenario':20} {'users':>5} {'req':>6} {'time s':>7} {'req/s':>7}")
+    for name, stats in report["scenarios"].items():
+        print(f"{name:20} {stats['users']:>5} {stats['requests']:>6} {stats['wall_time_s']:>7.2f} "
+              f"{stats['throughput_rps']:>7.1f}")
+    print(f"\n{'endpoint':36} {'count':>6} {'err':>4} {'req/s':>7} {'p50':>7} {'p95':>7} {'p99':>7} {'sql':>5}")
+    for endpoint, stats in sorted(report["endpoints"].items()):
+        print(f"{endpoint:36} {stats['count']:>6} {stats['errors']:>4} {stats['throughput_rps']:>7.1f} "
+              f"{stats['p50']:>7.1f} {stats['p95']:>7.1f} {stats['p99']:>7.1f} {stats['queries_avg']:>5.1f}")
+    print("(latency in ms, sql = SQL queries per request)")
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> List[str]:
+    """Регрессии относительно baseline: рост p95 больше threshold, рост числа SQL-запросов, ошибки"""
+    regressions = []
+    print(f"\nCompared with baseline {baseline['meta'].get('commit')} ({baseline['meta'].get('created_at')})")
+    print(f"{'endpoint':36} {'p95 was':>8} {'p95 now':>8} {'change':>7} {'sql max was':>11} {'now':>5}")
+    for endpoint, stats in sorted(report["endpoints"].items()):
+        old = baseline["endpoints"].get(endpoint)
+        if old is None:
+            print(f"{endpoint:36} {'new':>8}")
+            continue
+        change = stats["p95"] / old["p95"] - 1 if old["p95"] else 0.0
+        flags = []
+        if change > threshold:
+            flags.append("p95")
+        # Среднее зависит от попаданий в кэш, максимум (холодный путь) — нет
+        if stats["queries_max"] > old["queries_max"]:
+            flags.append("sql")
+        if stats["errors"] > old["errors"]:
+            flags.append("errors")
+        print(f"{endpoint:36} {old['p95']:>8.1f} {stats['p95']:>8.1f} {change:>+7.0%} "
+              f"{old['queries_max']:>11} {stats['queries_max']:>5}  {' '.join(flags)}")
+        if flags:
+            regressions.append(f"{endpoint}: {', '.join(flags)}")
+    return regressions
+
+
+async def run(args) -> dict:
+    from sqlalchemy import event
+    from database import engine
+    from main import app
+    from benchmarks.dataset import PRESETS, build_dataset
+
+    engine.echo = False  # Лог SQL исказил бы замеры
+    scale = {**PRESETS[args.preset], **(json.loads(args.scale) if args.scale else {})}
+    started = time.perf_counter()
+    counts = await build_dataset(engine, args.seed, scale)
+    print(f"Dataset seeded in {time.perf_counter() - started:.1f}s: {counts}")
+
+    selected = args.scenarios.split(",") if args.scenarios else [s.name for s in SCENARIOS]
+    unknown = set(selected) - {s.name for s in SCENARIOS}
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_query)
+    rounds = []
+    async with app.router.lifespan_context(app):
+        for round_index in range(args.rounds):
+            metrics = Metrics()
+            scenarios, wall_times = {}, {}
+            for scenario in SCENARIOS:
+                if scenario.name not in selected:
+                    continue
+                if args.users:
+                    scenario = Scenario(scenario.name, scenario.run, args.users, scenario.iterations)
+                seen = set(metrics.latencies)
+                scenarios[scenario.name] = await run_scenario(app, scenario, metrics, f"{args.seed}:{round_index}")
+                # Пропускная способность эндпоинта — за время сценария, в котором он впервые встретился
+                for endpoint in set(metrics.latencies) - seen:
+                    wall_times[endpoint] = scenarios[scenario.name]["wall_time_s"]
+            rounds.append((scenarios, summarize(metrics, wall_times)))
+            print(f"Round {round_index + 1}/{args.rounds}: "
+                  f"{sum(stats['requests'] for stats in scenarios.values())} requests")
+    event.remove(engine.sync_engine, "before_cursor_execute", _count_query)
+
+    from config import settings
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "db_profile": settings.DB_PROFILE,
+            "seed": args.seed,
+            "preset": args.preset,
+            "rounds": args.rounds,
+            "dataset": counts,
+        },
+        "scenarios": merge_rounds([scenarios for scenarios, _ in rounds]),
+        "endpoints": merge_rounds([endpoints for _, endpoints in rounds]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test of the public and admin API")
+    parser.add_argument("--database-url", default=os.environ.get("BENCHMARK_DATABASE_URL"),
+                        help="отдельная база: схема будет пересоздана (или BENCHMARK_DATABASE_URL)")
+    parser.add_argument("--scenarios", help="через запятую: " + ",".join(s.name for s in SCENARIOS))
+    parser.add_argument("--users", type=int, help="виртуальных пользователей в каждом сценарии")
+    parser.add_argument("--preset", default="small", help="размер набора данных: small, medium, large")
+    parser.add_argument("--scale", help='переопределить размеры, JSON: {"news": 20000}')
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--rounds", type=int, default=3, help="повторов всех сценариев; в отчёте — медиана")
+    parser.add_argument("--save", help="записать результат в JSON")
+    parser.add_argument("--compare", help="сравнить с сохранённым JSON")
+    parser.add_argument("--threshold", type=float, default=0.25, help="допустимый рост p95 (доля)")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url or BENCHMARK_DATABASE_URL is required (the schema is recreated)")
+
+    # Настройки читаются при импорте config — база и профиль задаются до импорта приложения
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("DB_PROFILE", "prod")
+
+    report = asyncio.run(run(args))
+    print_report(report)
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\nSaved to {args.save}")
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        if regressions:
+            print("\nRegressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+        print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
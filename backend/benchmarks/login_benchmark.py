@@ -0,0 +1,108 @@
+"""
+Бенчмарк: задержка публичных GET во время потока входов (bcrypt)
+
+Запуск из папки backend:
+    python -m benchmarks.login_benchmark                # bcrypt в пуле потоков
+    python -m benchmarks.login_benchmark --inline       # как раньше: bcrypt в event loop
+
+Запросы идут в приложение внутри процесса (functions/asgi.py), в одном event loop
+с обработкой входов — ровно как в воркере uvicorn. Фазы: только GET, затем GET на
+фоне --logins параллельных циклов входа. При bcrypt в пуле p99 GET почти не растёт.
+"""
+import argparse
+import asyncio
+import time
+from urllib.parse import urlencode
+
+from sqlalchemy import delete, select
+
+import functions.auth as auth
+from benchmarks.common import latency_summary
+from database import async_session, engine, User
+from functions.asgi import asgi_request
+from main import app
+
+BENCH_EMAIL = "login-benchmark@example.invalid"
+BENCH_PASSWORD = "benchmark-password"
+GET_PATH = "/api/content/news"
+
+
+async def _ensure_user():
+    async with async_session() as db:
+        result = await db.execute(select(User).where(User.email == BENCH_EMAIL))
+        if result.scalar_one_or_none() is None:
+            db.add(User(
+                email=BENCH_EMAIL,
+                hashed_password=auth.get_password_hash(BENCH_PASSWORD),
+                last_name="Benchmark",
+                first_name="Login",
+            ))
+            await db.commit()
+
+
+async def _remove_user():
+    async with async_session() as db:
+        await db.execute(delete(User).where(User.email == BENCH_EMAIL))
+        await db.commit()
+
+
+async def _get_loop(deadline: float, latencies: list):
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await asgi_request(app, "GET", GET_PATH, params={"summary": "true", "limit": 10})
+        latencies.append(time.perf_counter() - started)
+        assert response.status == 200, response.status
+        await asyncio.sleep(0.005)
+
+
+async def _login_loop(deadline: float, statuses: dict):
+    body = urlencode({"username": BENCH_EMAIL, "password": BENCH_PASSWORD}).encode()
+    headers = [("content-type", "application/x-www-form-urlencoded")]
+    while time.perf_counter() < deadline:
+        response = await asgi_request(app, "POST", "/api/auth/login", body=body, headers=headers)
+        statuses[response.status] = statuses.get(response.status, 0) + 1
+
+
+async def run_phase(duration: float, logins: int, readers: int) -> dict:
+    deadline = time.perf_counter() + duration
+    latencies, statuses = [], {}
+    await asyncio.gather(
+        *(_get_loop(deadline, latencies) for _ in range(readers)),
+        *(_login_loop(deadline, statuses) for _ in range(logins)),
+    )
+    return {"get": latency_summary(latencies), "logins": statuses}
+
+
+async def run_benchmark(duration: float, logins: int, readers: int, inline: bool):
+    engine.echo = False  # Лог SQL исказил бы замеры
+    if inline:
+        async def _inline_hashing(func, *args):
+            return func(*args)
+        auth._run_hashing = _inline_hashing
+
+    await _ensure_user()
+    try:
+        await run_phase(1.0, 0, readers)  # прогрев
+        mode = "inline (event loop)" if inline else f"thread pool x{auth.settings.PASSWORD_HASH_WORKERS}"
+        print(f"bcrypt: {mode}, rounds={auth.settings.BCRYPT_ROUNDS}, {readers} GET loops, {duration:.0f}s per phase\n")
+        print(f"{'phase':22} {'GETs':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}  logins")
+        for name, concurrency in (("GET only", 0), (f"GET + {logins} login loops", logins)):
+            result = await run_phase(duration, concurrency, readers)
+            get = result["get"]
+            print(
+                f"{name:22} {get['count']:>6} {get['p50']:>8} {get['p95']:>8} {get['p99']:>8} {get['max']:>8}  "
+                f"{result['logins'] or '-'}"
+            )
+    finally:
+        await _remove_user()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Public GET latency while logins are hammered")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--logins", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--inline", action="store_true", help="bcrypt in the event loop (previous behaviour)")
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.duration, args.logins, args.readers, args.inline))
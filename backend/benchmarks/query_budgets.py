@@ -0,0 +1,142 @@
+"""
+Закреплённые бюджеты SQL-запросов по эндпоинтам
+
+Запуск из папки backend; нужна ОТДЕЛЬНАЯ база Postgres — схема пересоздаётся:
+    python -m benchmarks.query_budgets --database-url postgresql+asyncpg://postgres@localhost/rheum_bench
+
+Каждый запрос выполняется с пустыми кэшами (content_cache, user_cache), то есть по
+самому дорогому пути, внутри assert_max_queries. Число запросов больше бюджета или
+повтор одного текста запроса больше REPEAT_LIMIT раз (N+1) — ошибка, код выхода 1.
+Если эндпоинт стал делать меньше запросов, бюджет в BUDGETS стоит уменьшить.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import Optional
+
+# Один и тот же текст запроса в одном HTTP-запросе — не больше стольких раз
+REPEAT_LIMIT = 2
+
+STAFF = {
+    "center_id": 1,
+    **{f"last_name_{lang}": "Каримов" for lang in ("ru", "uz", "en")},
+    **{f"first_name_{lang}": "Азиз" for lang in ("ru", "uz", "en")},
+}
+APPLICATION = {
+    "school_type": "rheumatologist", "last_name": "Каримов", "first_name": "Азиз",
+    "phone": "+998 90 000 00 00", "city": "Ташкент", "category": "first", "inn": "123456789",
+    "email": "budget@example.uz", "specialization": "Ревматология", "workplace": "Клиника",
+}
+
+# (метод, путь, query-параметры, тело JSON, бюджет); admin — с токеном администратора
+BUDGETS = [
+    ("GET", "/api/content/home", {"lang": "ru"}, None, 6),
+    ("GET", "/api/content/board-members", {"lang": "ru"}, None, 2),
+    ("GET", "/api/content/partners", None, None, 2),
+    ("GET", "/api/content/charter", {"lang": "ru"}, None, 2),
+    ("GET", "/api/content/chief-rheumatologists", {"lang": "ru"}, None, 2),
+    ("GET", "/api/content/diseases", {"lang": "ru"}, None, 2),
+    ("GET", "/api/content/diseases/1", {"lang": "ru"}, None, 2),
+    ("GET", "/api/content/disease-documents", {"disease_id": 1}, None, 2),
+    ("GET", "/api/content/news/featured", {"summary": "true"}, None, 2),
+    ("GET", "/api/content/news/popular", {"summary": "true"}, None, 1),
+    ("GET", "/api/content/news/feed", {"lang": "ru", "summary": "true"}, None, 2),
+    ("GET", "/api/content/news", {"limit": 20}, None, 2),
+    ("GET", "/api/content/news/1", {"lang": "ru"}, None, 2),
+    ("GET", "/api/content/search", {"q": "ревматоидный артрит"}, None, 5),
+    ("GET", "/api/content/centers", None, None, 2),
+    ("GET", "/api/content/centers/with-staff", None, None, 3),
+    ("GET", "/api/content/centers/1/with-staff", None, None, 3),
+    ("GET", "/api/content/center-staff", {"center_id": 1}, None, 2),
+    ("POST", "/api/content/school-applications", None, APPLICATION, 2),
+    ("admin", "GET", "/api/content/school-applications", None, None, 2),
+    ("admin", "GET", "/api/admin/stats", None, None, 2),
+    ("admin", "GET", "/api/admin/school/applications/export", {"status": "pending"}, None, 2),
+    ("admin", "GET", "/api/admin/congress/registrations/export", {"congress_id": 1, "format": "xlsx"}, None, 2),
+    # Правки: пользователь, проверка/выборка, запись, версии таблиц, refresh после commit
+    ("admin", "PUT", "/api/content/news/1", None, {"title_ru": "Новый заголовок"}, 6),
+    ("admin", "POST", "/api/content/center-staff", None, STAFF, 6),
+    ("admin", "PUT", "/api/content/center-staff/1", None, {"order": 3}, 6),
+    ("admin", "GET", "/api/auth/me", None, None, 1),
+]
+
+
+async def check(app, method: str, path: str, params: Optional[dict], body, budget: int,
+                token: Optional[str]) -> Optional[str]:
+    """Ошибка (текст) или None; печатает строку отчёта"""
+    from functions.asgi import asgi_request
+    from functions.cache import content_cache, user_cache
+    from functions.query_budget import assert_max_queries
+
+    content_cache.clear()
+    user_cache.clear()
+    headers = [("content-type", "application/json")]
+    if token:
+        headers.append(("authorization", f"Bearer {token}"))
+    payload = json.dumps(body).encode() if body is not None else b""
+    error = None
+    try:
+        with assert_max_queries(budget, repeat_limit=REPEAT_LIMIT) as recorded:
+            response = await asgi_request(app, method, path, params=params, body=payload, headers=headers)
+        if response.status >= 400:
+            error = f"HTTP {response.status}: {response.body[:200]!r}"
+    except AssertionError as e:
+        error = str(e)
+        response = None
+    count = recorded[0][2].count if recorded else 0
+    status = response.status if response else "-"
+    print(f"{method:6} {path:44} {status!s:>4} {count:>4} {budget:>6}  {'FAIL' if error else 'ok'}")
+    return f"{method} {path}: {error}" if error else None
+
+
+async def run() -> int:
+    from database import engine
+    from main import app
+    from benchmarks.dataset import ADMIN_EMAIL, ADMIN_PASSWORD, build_dataset
+    from functions.asgi import asgi_request
+    from urllib.parse import urlencode
+
+    engine.echo = False
+    await build_dataset(engine)
+    failures = []
+    async with app.router.lifespan_context(app):
+        login = await asgi_request(
+            app, "POST", "/api/auth/login",
+            body=urlencode({"username": ADMIN_EMAIL, "password": ADMIN_PASSWORD}).encode(),
+            headers=[("content-type", "application/x-www-form-urlencoded")],
+        )
+        token = json.loads(login.body)["access_token"]
+
+        print(f"{'method':6} {'path':44} {'HTTP':>4} {'sql':>4} {'budget':>6}")
+        for entry in BUDGETS:
+            admin = entry[0] == "admin"
+            method, path, params, body, budget = entry[1:] if admin else entry
+            error = await check(app, method, path, params, body, budget, token if admin else None)
+            if error:
+                failures.append(error)
+
+    if failures:
+        print("\n" + "\n".join(failures))
+        return 1
+    print("\nAll endpoints within budget")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check pinned per-endpoint SQL query budgets")
+    parser.add_argument("--database-url", default=os.environ.get("BENCHMARK_DATABASE_URL"),
+                        help="отдельная база: схема будет пересоздана (или BENCHMARK_DATABASE_URL)")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url or BENCHMARK_DATABASE_URL is required (the schema is recreated)")
+
+    # Настройки читаются при импорте config — база задаётся до импорта приложения
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("DB_PROFILE", "prod")
+    sys.exit(asyncio.run(run()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Бенчмарк полнотекстового поиска (/content/search) на синтетическом корпусе
+
+Запуск из папки backend (нужен Postgres с миграциями alembic):
+    python -m benchmarks.search_benchmark                 # 50 000 новостей, 20 повторов
+    python -m benchmarks.search_benchmark --rows 100000 --repeat 50
+
+Корпус вставляется в одной транзакции и откатывается в конце — данные базы
+не меняются. Для каждого запроса печатаются число совпадений и p50/p95/max.
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.connection import engine
+from database.models import News, Language
+from functions.search import search_content
+from benchmarks.common import percentile
+
+BATCH_SIZE = 1000
+
+# Тематические слова: в каждой статье их несколько, остальное — «шум» из псевдослов
+TOPIC_WORDS = {
+    "ru": (
+        "ревматоидный артрит сустав суставы боль воспаление пациент лечение терапия диагностика "
+        "волчанка системная красная остеоартроз подагра спондилит анкилозирующий васкулит "
+        "склеродермия фибромиалгия остеопороз конференция конгресс школа врач ревматолог "
+        "клиника исследование препарат доза рекомендации протокол симптомы утренняя скованность "
+        "отёк кисти колени позвоночник мочевая кислота иммунитет биологическая генно-инженерная "
+        "ассоциация узбекистан ташкент семинар обучение программа участие регистрация"
+    ).split(),
+    "uz": (
+        "revmatoid artrit bo'g'im bo'g'imlar og'riq yallig'lanish bemor davolash terapiya tashxis "
+        "volchanka tizimli osteoartroz podagra spondilit vaskulit sklerodermiya osteoporoz "
+        "konferensiya kongress maktab shifokor revmatolog klinika tadqiqot dori doza tavsiyalar "
+        "protokol belgilar ertalabki qotish shish qo'l tizza umurtqa immunitet assotsiatsiya "
+        "o'zbekiston toshkent seminar o'qitish dastur ishtirok ro'yxatdan o'tish"
+    ).split(),
+    "en": (
+        "rheumatoid arthritis joint joints pain inflammation patient treatment therapy diagnosis "
+        "lupus systemic erythematosus osteoarthritis gout spondylitis ankylosing vasculitis "
+        "scleroderma fibromyalgia osteoporosis conference congress school doctor rheumatologist "
+        "clinic research drug dose guidelines protocol symptoms morning stiffness swelling hands "
+        "knees spine uric acid immunity biologic association uzbekistan tashkent seminar training"
+    ).split(),
+}
+
+SYLLABLES = {
+    "ru": "ка ро ми не ла то ва ре пи су до ны ле ст ор ан ет ин".split(),
+    "uz": "qa ro mi ne la to va re pi su do ni le sh o' an et in".split(),
+    "en": "ka ro mi ne la to va re pi su do ny le st or an et in".split(),
+}
+FILLER_SIZE = 5000
+
+QUERIES = [
+    (Language.RU, "ревматоидный артрит"),
+    (Language.RU, "боль в суставах"),
+    (Language.RU, "системная красная волчанка"),
+    (Language.RU, "подагра -конгресс"),
+    (Language.UZ, "revmatoid artrit"),
+    (Language.UZ, "bo'g'im og'riq"),
+    (Language.EN, "rheumatoid arthritis"),
+    (Language.EN, "\"morning stiffness\""),
+    (Language.EN, "lupus OR vasculitis"),
+]
+
+
+def filler_vocabulary(rng: random.Random) -> dict:
+    return {
+        lang: ["".join(rng.choices(syllables, k=rng.randint(2, 4))) for _ in range(FILLER_SIZE)]
+        for lang, syllables in SYLLABLES.items()
+    }
+
+
+def _text(rng: random.Random, lang: str, filler: dict, topic: int, noise: int) -> str:
+    words = rng.choices(TOPIC_WORDS[lang], k=topic) + rng.choices(filler[lang], k=noise)
+    rng.shuffle(words)
+    return " ".join(words)
+
+
+def synthetic_news(rng: random.Random, filler: dict, count: int) -> list:
+    rows = []
+    for _ in range(count):
+        row = {"news_type": rng.choice(("news", "event")), "is_published": rng.random() < 0.9}
+        for lang in TOPIC_WORDS:
+            row[f"title_{lang}"] = _text(rng, lang, filler, 2, 4).capitalize()
+            row[f"excerpt_{lang}"] = _text(rng, lang, filler, 2, 18)
+            row[f"content_{lang}"] = _text(rng, lang, filler, 4, 76)
+        rows.append(row)
+    return rows
+
+
+async def run_benchmark(rows: int, repeat: int, seed: int):
+    rng = random.Random(seed)
+    filler = filler_vocabulary(rng)
+    engine.echo = False  # Лог SQL исказил бы замеры
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            started = time.perf_counter()
+            for offset in range(0, rows, BATCH_SIZE):
+                await conn.execute(insert(News), synthetic_news(rng, filler, min(BATCH_SIZE, rows - offset)))
+            await conn.execute(text("ANALYZE news"))
+            print(f"Corpus: {rows} news inserted in {time.perf_counter() - started:.1f}s\n")
+
+            db = AsyncSession(bind=conn)
+            print(f"{'lang':4}  {'query':32} {'matches':>8} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+            for lang, q in QUERIES:
+                await search_content(db, q, lang)  # прогрев
+                timings = []
+                for _ in range(repeat):
+                    t0 = time.perf_counter()
+                    result = await search_content(db, q, lang)
+                    timings.append((time.perf_counter() - t0) * 1000)
+                print(
+                    f"{lang.value:4}  {q:32} {result['total']:>8} "
+                    f"{statistics.median(timings):>8.1f} {percentile(timings, 95):>8.1f} {max(timings):>8.1f}"
+                )
+        finally:
+            await trans.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Full-text search latency benchmark")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.rows, args.repeat, args.seed))
@@ -0,0 +1,157 @@
+"""
+Микробенчмарк сериализации списков контента: прежний путь против trusted_response
+
+Запуск из папки backend (нужен Postgres с миграциями alembic):
+    python -m benchmarks.serialization_benchmark                # 50 элементов, 300 повторов
+    python -m benchmarks.serialization_benchmark --items 100 --repeat 1000
+
+Сравниваются три пути для списков NewsResponse и BoardMemberResponse:
+  orm+response_model — ORM-объекты, model_validate, затем валидация FastAPI по
+                       Union[List[...], List[...Localized]], jsonable_encoder и json;
+  rows+TypeAdapter   — строки колонок, заранее собранный TypeAdapter(List[...]):
+                       validate_python + dump_json;
+  rows+orjson        — строки колонок (Projection) и trusted_response, текущий путь.
+«serialize» — только преобразование уже выбранных данных, «query+serialize» —
+вместе с запросом к базе. Данные вставляются в транзакции и откатываются.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Callable, List, Union
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+
+from database.connection import engine
+from database.models import BoardMember, News
+from functions.localization import Projection
+from functions.serialization import trusted_response
+from schemas import BoardMemberResponse, BoardMemberLocalizedResponse, NewsResponse, NewsLocalizedResponse
+from benchmarks.common import latency_summary
+from benchmarks.search_benchmark import filler_vocabulary, synthetic_news
+
+CASES = [
+    (News, NewsResponse, NewsLocalizedResponse),
+    (BoardMember, BoardMemberResponse, BoardMemberLocalizedResponse),
+]
+
+
+def synthetic_board_members(rng: random.Random, count: int) -> list:
+    rows = []
+    for i in range(count):
+        row = {"order": i, "is_active": True, "email": f"member{i}@example.uz", "phone": "+998 71 000 00 00",
+               "photo_url": f"/uploads/{rng.getrandbits(128):032x}.jpg"}
+        for lang in ("ru", "uz", "en"):
+            row.update({
+                f"last_name_{lang}": f"Фамилия{i}", f"first_name_{lang}": f"Имя{i}",
+                f"patronymic_{lang}": f"Отчество{i}", f"position_{lang}": "Член правления ассоциации",
+                f"degree_{lang}": "д.м.н., профессор", f"workplace_{lang}": "Ташкентская медицинская академия",
+                f"bio_{lang}": "Биография и научные интересы. " * rng.randint(5, 30),
+                f"achievements_{lang}": "Награды и публикации. " * rng.randint(2, 10),
+            })
+        rows.append(row)
+    return rows
+
+
+async def _timed(repeat: int, func: Callable) -> List[float]:
+    await func()  # прогрев
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - t0)
+    return timings
+
+
+async def run_benchmark(items: int, repeat: int, seed: int):
+    rng = random.Random(seed)
+    engine.echo = False  # Лог SQL исказил бы замеры
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            await conn.execute(insert(News), synthetic_news(rng, filler_vocabulary(rng), items))
+            await conn.execute(insert(BoardMember), synthetic_board_members(rng, items))
+            db = AsyncSession(bind=conn)
+
+            print(f"{items} items per list, {repeat} runs; microseconds\n")
+            print(f"{'schema':22} {'path':20} {'mode':16} {'p50':>9} {'p95':>9} {'x':>6}")
+            for model, schema, localized_schema in CASES:
+                projection = Projection(model, schema, localized_schema)
+                columns_query = projection.select().order_by(model.id.desc()).limit(items)
+                orm_query = select_entities(model, schema).order_by(model.id.desc()).limit(items)
+                field = create_response_field(name="response", type_=Union[List[schema], List[localized_schema]])
+                adapter = TypeAdapter(List[schema])
+
+                entities = list((await db.execute(orm_query)).scalars().all())
+                rows = projection.all(await db.execute(columns_query))
+
+                async def before(entities):
+                    models = [schema.model_validate(entity) for entity in entities]
+                    content = await serialize_response(field=field, response_content=models)
+                    return JSONResponse(content).body
+
+                async def type_adapter(rows):
+                    return adapter.dump_json(adapter.validate_python(rows))
+
+                async def current(rows):
+                    return trusted_response(rows).body
+
+                async def fetch_entities():
+                    db.expunge_all()  # Иначе объекты берутся из identity map без гидрации
+                    return list((await db.execute(orm_query)).scalars().all())
+
+                async def fetch_rows():
+                    return projection.all(await db.execute(columns_query))
+
+                # Все пути должны давать один и тот же JSON
+                expected = json.loads(await before(entities))
+                assert json.loads(await type_adapter(rows)) == expected
+                assert json.loads(await current(rows)) == expected
+
+                paths = [
+                    ("orm+response_model", fetch_entities, before, entities),
+                    ("rows+TypeAdapter", fetch_rows, type_adapter, rows),
+                    ("rows+orjson", fetch_rows, current, rows),
+                ]
+                for mode in ("serialize", "query+serialize"):
+                    baseline = None
+                    for name, fetch, serialize, data in paths:
+                        if mode == "serialize":
+                            timings = await _timed(repeat, lambda: serialize(data))
+                        else:
+                            timings = await _timed(repeat, lambda: _fetch_and_serialize(fetch, serialize))
+                        summary = latency_summary(timings)
+                        p50 = summary["p50"] * 1000
+                        baseline = baseline or p50
+                        print(f"{schema.__name__:22} {name:20} {mode:16} {p50:>9.0f} "
+                              f"{summary['p95'] * 1000:>9.0f} {baseline / p50:>5.1f}x")
+                print()
+        finally:
+            await trans.rollback()
+    await engine.dispose()
+
+
+def select_entities(model, schema):
+    """SELECT ORM-объектов только с колонками схемы — как Projection до перехода на строки"""
+    columns = [getattr(model, field) for field in schema.model_fields if field in model.__table__.columns]
+    return select(model).options(load_only(*columns))
+
+
+async def _fetch_and_serialize(fetch, serialize):
+    return await serialize(await fetch())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Response serialization micro-benchmark")
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.items, args.repeat, args.seed))
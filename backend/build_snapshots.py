@@ -0,0 +1,33 @@
+"""
+Перестроить все статические JSON-снимки публичного контента (functions/snapshots.py)
+
+Запуск из папки backend:
+    python build_snapshots.py                 # в каталог SNAPSHOT_DIR из настроек
+    python build_snapshots.py /app/snapshots  # в указанный каталог
+
+Запускается deploy.sh после старта контейнеров (воркеры сами полный проход не делают);
+вручную — после изменений данных в обход API (seed_data.py, миграции, правки в БД).
+"""
+import asyncio
+import sys
+
+from config import settings
+from database.connection import engine
+from functions.snapshots import snapshot_publisher
+from main import app
+
+
+async def build_snapshots(directory: str):
+    snapshot_publisher.directory = directory
+    snapshot_publisher.attach(app)
+    count = await snapshot_publisher.rebuild()
+    await engine.dispose()
+    print(f"Snapshots written: {count} -> {directory} (failed: {snapshot_publisher.failed})")
+    return snapshot_publisher.failed == 0
+
+
+if __name__ == "__main__":
+    directory = sys.argv[1] if len(sys.argv) > 1 else settings.SNAPSHOT_DIR
+    if not directory:
+        sys.exit("SNAPSHOT_DIR is not set: pass a directory or set it in .env")
+    sys.exit(0 if asyncio.run(build_snapshots(directory)) else 1)
@@ -0,0 +1,34 @@
+"""
+Сборка мусора в каталоге uploads (functions/uploads.py: collect_garbage)
+
+Запуск из папки backend (например, раз в сутки из cron):
+    python collect_uploads.py             # удалить файлы без ссылок старше UPLOAD_GC_GRACE_DAYS
+    python collect_uploads.py --dry-run   # только показать, что было бы удалено
+
+Первый запуск регистрирует в stored_files файлы, загруженные до хранения по хешу.
+"""
+import argparse
+import asyncio
+from datetime import timedelta
+
+from config import settings
+from database import async_session, engine
+from functions.uploads import collect_garbage
+
+UPLOAD_DIR = "uploads"
+
+
+async def collect_uploads(grace_days: int, dry_run: bool):
+    async with async_session() as db:
+        stats = await collect_garbage(db, UPLOAD_DIR, timedelta(days=grace_days), dry_run=dry_run)
+    await engine.dispose()
+    for key, value in stats.items():
+        print(f"{key:16} {value}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Удаление загруженных файлов без ссылок")
+    parser.add_argument("--dry-run", action="store_true", help="ничего не удалять")
+    parser.add_argument("--grace-days", type=int, default=settings.UPLOAD_GC_GRACE_DAYS)
+    args = parser.parse_args()
+    asyncio.run(collect_uploads(args.grace_days, args.dry_run))
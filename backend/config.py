@@ -1,5 +1,46 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import List, Literal, Optional
+
+
+# Профили движка БД. prod: без лога SQL, пул на 2 воркера uvicorn (до 2 * 20 соединений),
+# короткий pool_timeout — при всплеске регистраций лучше быстрый отказ, чем очередь на минуту
+ENGINE_PROFILES = {
+    "dev": {
+        "echo": True,
+        "pool_size": 5,
+        "max_overflow": 5,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "statement_cache_size": 100,
+        "command_timeout": 60,
+        "statement_timeout_ms": 30000,
+    },
+    "prod": {
+        "echo": False,
+        "pool_size": 10,
+        "max_overflow": 10,
+        "pool_timeout": 10,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "statement_cache_size": 256,
+        "command_timeout": 30,
+        "statement_timeout_ms": 15000,
+    },
+    # Тесты: без пула (NullPool) — соединения не переживают event loop теста
+    "test": {
+        "echo": False,
+        "pool_size": None,
+        "max_overflow": None,
+        "pool_timeout": None,
+        "pool_recycle": None,
+        "pool_pre_ping": False,
+        "statement_cache_size": 100,
+        "command_timeout": 30,
+        "statement_timeout_ms": 30000,
+    },
+}
 
 
 class Settings(BaseSettings):
@@ -8,9 +49,88 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Пароли: стоимость bcrypt (log2 раундов) и пул потоков для хеширования
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_TIMEOUT: float = 5.0  # Сколько ждать свободный поток, иначе 503
+
+    # Движок БД: профиль и переопределения отдельных параметров (пусто — из профиля)
+    DB_PROFILE: Literal["dev", "prod", "test"] = "dev"
+    DB_ECHO: Optional[bool] = None
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: Optional[float] = None
+    DB_POOL_RECYCLE: Optional[int] = None
+    DB_POOL_PRE_PING: Optional[bool] = None
+    DB_STATEMENT_CACHE_SIZE: Optional[int] = None
+    DB_COMMAND_TIMEOUT: Optional[float] = None
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None  # 0 — без ограничения
+
+    # Кэш публичного контента (в памяти воркера)
+    CONTENT_CACHE_TTL: int = 300
+    CONTENT_CACHE_MAXSIZE: int = 256
+
+    # Кэш пользователей в get_current_user (ключ — subject токена)
+    AUTH_USER_CACHE_TTL: int = 60
+    AUTH_USER_CACHE_MAXSIZE: int = 1024
+
+    # Каталог статических JSON-снимков для nginx (пусто — снимки не пишутся)
+    SNAPSHOT_DIR: str = ""
+
+    # Загрузка файлов: лимит размера (как client_max_body_size в nginx) и разрешённые типы
+    # (SVG не разрешён: может содержать скрипты). Атрибуты accept в формах админки — те же типы
+    UPLOAD_MAX_SIZE: int = 20 * 1024 * 1024
+    UPLOAD_ALLOWED_TYPES: List[str] = [
+        "image/jpeg", "image/png", "image/gif", "image/webp",
+        "application/pdf",
+        "application/msword",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ]
+    # Файл без ссылок из колонок *_url удаляется сборщиком мусора через столько дней
+    UPLOAD_GC_GRACE_DAYS: int = 7
+
+    # Уменьшенные копии изображений (/img/{width}/{filename}): разрешённые ширины,
+    # каталог и лимит дискового кэша, число процессов для обработки, качество WebP/JPEG
+    IMAGE_WIDTHS: List[int] = [160, 320, 640, 960, 1280]
+    IMAGE_CACHE_DIR: str = "image_cache"
+    IMAGE_CACHE_MAX_SIZE: int = 512 * 1024 * 1024
+    IMAGE_WORKERS: int = 1
+    IMAGE_QUALITY: int = 80
+
+    # Счётчик просмотров новостей: период сброса буфера воркера в БД, секунды; сколько разных
+    # новостей держать в буфере (просмотры сверх лимита отбрасываются) и сколько раз повторять
+    # неудачную запись приращений, прежде чем их выбросить
+    VIEW_COUNTER_FLUSH_INTERVAL: float = 10.0
+    VIEW_COUNTER_MAX_PENDING: int = 10000
+    VIEW_COUNTER_MAX_ATTEMPTS: int = 5
+
+    # Метрики Prometheus (/internal/metrics): каталог, куда воркеры пишут снимки метрик
+    # для суммирования (пусто — только метрики воркера, ответившего на запрос), и период записи
+    METRICS_DIR: str = ""
+    METRICS_FLUSH_INTERVAL: float = 5.0
+
+    # Бюджет SQL-запросов на HTTP-запрос: предупреждение в лог, если запросов больше QUERY_BUDGET
+    # или один и тот же запрос выполнен QUERY_REPEAT_THRESHOLD раз (N+1); 0 — не проверять.
+    # Для одного маршрута предупреждение повторяется не чаще раза в QUERY_WARNING_INTERVAL секунд
+    QUERY_BUDGET: int = 10
+    QUERY_REPEAT_THRESHOLD: int = 5
+    QUERY_WARNING_INTERVAL: float = 300.0
+
+    # Выгрузка заявок в CSV/XLSX: строк на одну выборку из серверного курсора
+    EXPORT_BATCH_SIZE: int = 2000
+
     class Config:
         env_file = ".env"
 
+    def engine_profile(self) -> dict:
+        """Параметры движка: профиль DB_PROFILE с переопределениями из DB_*"""
+        profile = dict(ENGINE_PROFILES[self.DB_PROFILE])
+        for key in profile:
+            override = getattr(self, f"DB_{key.upper()}")
+            if override is not None:
+                profile[key] = override
+        return profile
+
 
 @lru_cache()
 def get_settings():
@@ -1,9 +1,45 @@
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 from config import settings
+from .pool import MeasuredAsyncPool
+
+
+def engine_options(database_url: str, profile: dict) -> dict:
+    """Аргументы create_async_engine для профиля из config.ENGINE_PROFILES"""
+    options = {"echo": profile["echo"], "pool_pre_ping": profile["pool_pre_ping"]}
+    if profile["pool_size"] is None:
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            poolclass=MeasuredAsyncPool,
+            pool_size=profile["pool_size"],
+            max_overflow=profile["max_overflow"],
+            pool_timeout=profile["pool_timeout"],
+            pool_recycle=profile["pool_recycle"],
+        )
+
+    if make_url(database_url).get_driver_name() == "asyncpg":
+        server_settings = {"application_name": "rheumatology_backend"}
+        if profile["statement_timeout_ms"]:
+            # Ограничение на стороне Postgres: зависший запрос не держит соединение пула
+            server_settings["statement_timeout"] = str(profile["statement_timeout_ms"])
+        options["connect_args"] = {
+            "statement_cache_size": profile["statement_cache_size"],
+            "command_timeout": profile["command_timeout"],
+            "server_settings": server_settings,
+        }
+    return options
 
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+engine = create_async_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL, settings.engine_profile()))
 
 async_session = async_sessionmaker(
     engine,
@@ -22,3 +58,42 @@ async def get_db():
             yield session
         finally:
             await session.close()
+
+
+def pool_stats() -> dict:
+    """Состояние пула соединений этого воркера"""
+    pool = engine.pool
+    if isinstance(pool, MeasuredAsyncPool):
+        return pool.stats()
+    return {"status": pool.status()}
+
+
+# ==================== ЗАПРОСЫ ТЕКУЩЕГО HTTP-ЗАПРОСА ====================
+class QueryStats:
+    """SQL-запросы одного HTTP-запроса: число, время в базе и сколько раз выполнен каждый текст"""
+    __slots__ = ("count", "duration", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        # Текст с параметрами-плейсхолдерами: N+1 — один и тот же текст много раз
+        self.statements: Counter = Counter()
+
+
+# Задаётся middleware метрик; задачи, созданные внутри запроса (asyncio.gather), видят тот же объект
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_query_stats.get()
+    if stats is not None and context is not None:
+        stats.count += 1
+        stats.duration += time.perf_counter() - context._query_started
+        stats.statements[statement] += 1
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, BigInteger, String, Text, Boolean, DateTime, ForeignKey, Enum, Index, Computed, event
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 from .connection import Base
 import enum
@@ -16,6 +17,31 @@ class Language(str, enum.Enum):
     EN = "en"
 
 
+# ==================== ПОЛНОТЕКСТОВЫЙ ПОИСК ====================
+# Конфигурация tsvector по языку: для узбекского словаря в Postgres нет — simple
+SEARCH_CONFIGS = {"ru": "russian", "uz": "simple", "en": "english"}
+
+# Индексируемые поля и их веса (A — важнее всего); {lang} подставляется для каждого языка
+NEWS_SEARCH_FIELDS = (("title_{lang}", "A"), ("subtitle_{lang}", "B"), ("excerpt_{lang}", "B"), ("content_{lang}", "C"))
+DISEASE_SEARCH_FIELDS = (("name_{lang}", "A"), ("short_name", "A"), ("description_{lang}", "B"),
+                         ("symptoms_{lang}", "C"), ("treatment_{lang}", "C"))
+DOCUMENT_SEARCH_FIELDS = (("title_{lang}", "A"), ("description_{lang}", "B"))
+
+
+def search_vector_sql(lang: str, fields) -> str:
+    config = SEARCH_CONFIGS[lang]
+    return " || ".join(
+        f"setweight(to_tsvector('{config}', coalesce({field.format(lang=lang)}, '')), '{weight}')"
+        for field, weight in fields
+    )
+
+
+def search_vector(lang: str, fields):
+    """Генерируемая колонка tsvector: Postgres пересчитывает её при каждой записи строки.
+    Отложенная загрузка — в обычных SELECT модели она не читается."""
+    return deferred(Column(TSVECTOR, Computed(search_vector_sql(lang, fields), persisted=True)))
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -89,8 +115,23 @@ class News(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # Полнотекстовый поиск (/content/search)
+    search_ru = search_vector("ru", NEWS_SEARCH_FIELDS)
+    search_uz = search_vector("uz", NEWS_SEARCH_FIELDS)
+    search_en = search_vector("en", NEWS_SEARCH_FIELDS)
+
     author = relationship("User")
 
+    __table_args__ = (
+        # Лента новостей: keyset-пагинация по (created_at, id) с фильтром по типу
+        Index("ix_news_feed", is_published, news_type, created_at.desc(), id.desc()),
+        # Та же лента без фильтра по типу (News.jsx, главная)
+        Index("ix_news_published_feed", is_published, created_at.desc(), id.desc()),
+        Index("ix_news_search_ru", "search_ru", postgresql_using="gin"),
+        Index("ix_news_search_uz", "search_uz", postgresql_using="gin"),
+        Index("ix_news_search_en", "search_en", postgresql_using="gin"),
+    )
+
 
 # ==================== КОНГРЕСС ====================
 class Congress(Base):
@@ -135,6 +176,10 @@ class CongressRegistration(Base):
     congress = relationship("Congress")
     user = relationship("User")
 
+    __table_args__ = (
+        Index("ix_congress_registrations_congress_created", congress_id, created_at),
+    )
+
 
 # ==================== ЧЛЕНЫ ПРАВЛЕНИЯ ====================
 class BoardMember(Base):
@@ -172,6 +217,10 @@ class BoardMember(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_board_members_active_order", order, postgresql_where=(is_active == True)),
+    )
+
 
 # ==================== МЕЖДУНАРОДНЫЕ ПАРТНЁРЫ ====================
 class Partner(Base):
@@ -194,6 +243,10 @@ class Partner(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_partners_active_order", order, postgresql_where=(is_active == True)),
+    )
+
 
 # ==================== УСТАВ ====================
 class Charter(Base):
@@ -252,6 +305,10 @@ class ChiefRheumatologist(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_chief_rheumatologists_active_order", order, postgresql_where=(is_active == True)),
+    )
+
 
 # ==================== РЕВМАТОЛОГИЧЕСКИЕ ЦЕНТРЫ ====================
 class RheumatologyCenter(Base):
@@ -276,7 +333,11 @@ class RheumatologyCenter(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationship to staff
-    staff = relationship("CenterStaff", back_populates="center", cascade="all, delete-orphan")
+    staff = relationship("CenterStaff", back_populates="center", cascade="all, delete-orphan", order_by="CenterStaff.order")
+
+    __table_args__ = (
+        Index("ix_rheumatology_centers_active_order", order, postgresql_where=(is_active == True)),
+    )
 
 
 # ==================== СОТРУДНИКИ ЦЕНТРОВ ====================
@@ -308,6 +369,10 @@ class CenterStaff(Base):
 
     center = relationship("RheumatologyCenter", back_populates="staff")
 
+    __table_args__ = (
+        Index("ix_center_staff_center_active_order", center_id, order, postgresql_where=(is_active == True)),
+    )
+
 
 # ==================== ЗАБОЛЕВАНИЯ ====================
 class Disease(Base):
@@ -334,6 +399,18 @@ class Disease(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Полнотекстовый поиск (/content/search)
+    search_ru = search_vector("ru", DISEASE_SEARCH_FIELDS)
+    search_uz = search_vector("uz", DISEASE_SEARCH_FIELDS)
+    search_en = search_vector("en", DISEASE_SEARCH_FIELDS)
+
+    __table_args__ = (
+        Index("ix_diseases_active_order", order, postgresql_where=(is_active == True)),
+        Index("ix_diseases_search_ru", "search_ru", postgresql_using="gin"),
+        Index("ix_diseases_search_uz", "search_uz", postgresql_using="gin"),
+        Index("ix_diseases_search_en", "search_en", postgresql_using="gin"),
+    )
+
 
 # ==================== ДОКУМЕНТЫ О ЗАБОЛЕВАНИЯХ (устаревшее) ====================
 class DiseaseDocument(Base):
@@ -353,8 +430,19 @@ class DiseaseDocument(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Полнотекстовый поиск (/content/search)
+    search_ru = search_vector("ru", DOCUMENT_SEARCH_FIELDS)
+    search_uz = search_vector("uz", DOCUMENT_SEARCH_FIELDS)
+    search_en = search_vector("en", DOCUMENT_SEARCH_FIELDS)
+
     disease = relationship("Disease")
 
+    __table_args__ = (
+        Index("ix_disease_documents_search_ru", "search_ru", postgresql_using="gin"),
+        Index("ix_disease_documents_search_uz", "search_uz", postgresql_using="gin"),
+        Index("ix_disease_documents_search_en", "search_en", postgresql_using="gin"),
+    )
+
 
 # ==================== ШКОЛА РЕВМАТОЛОГОВ ====================
 class SchoolApplication(Base):
@@ -377,6 +465,128 @@ class SchoolApplication(Base):
     status = Column(String(50), default="pending")  # pending, approved, rejected
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_school_applications_status_type_created", status, school_type, created_at),
+    )
+
+
+# ==================== ВЕРСИИ КОНТЕНТА ====================
+class ContentVersion(Base):
+    """Счётчик изменений таблицы (растёт при каждой записи из админки, используется для ETag)"""
+    __tablename__ = "content_versions"
+
+    table_name = Column(String(100), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+# ==================== ЗАГРУЖЕННЫЕ ФАЙЛЫ ====================
+class StoredFile(Base):
+    """Файл в каталоге uploads. Новые файлы называются по SHA-256 содержимого,
+    поэтому повторная загрузка того же файла не создаёт копию.
+    orphaned_at — когда сборщик мусора впервые не нашёл ссылок на файл."""
+    __tablename__ = "stored_files"
+
+    id = Column(Integer, primary_key=True, index=True)
+    filename = Column(String(255), unique=True, nullable=False)
+    sha256 = Column(String(64), index=True, nullable=False)
+    size = Column(BigInteger, nullable=False)
+    content_type = Column(String(100))
+    uploaded_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # Последняя загрузка
+    orphaned_at = Column(DateTime(timezone=True), nullable=True)
+
+
+# ==================== СЧЁТЧИКИ СТРОК ====================
+class RowCounter(Base):
+    """Число строк таблицы (key='') и строк с данным значением колонки (key='status=pending').
+    Ведётся триггерами Postgres в той же транзакции, что и запись, поэтому итоги
+    для админ-панели читаются одной маленькой выборкой, а не count(*) по таблицам."""
+    __tablename__ = "row_counters"
+
+    table_name = Column(String(100), primary_key=True)
+    key = Column(String(255), primary_key=True, default="")
+    count = Column(BigInteger, nullable=False, default=0)
+
+
+# Таблица -> колонки, по значениям которых ведутся отдельные счётчики
+COUNTED_TABLES = {
+    "news": ("is_published",),
+    "users": (),
+    "congress_registrations": ("congress_id",),
+    "school_applications": ("status", "school_type"),
+}
+
+# Триггеры уровня оператора с таблицами переходов: вставка миллиона строк одним COPY
+# или executemany — один upsert по сгруппированным значениям, а не миллион.
+# В тексте нет %: DDL передаётся драйверу как есть.
+ROW_COUNTERS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION row_counters_apply() RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    deltas text := '';
+    rows_name text;
+    sign text;
+    column_name text;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM row_counters WHERE table_name = TG_TABLE_NAME;
+        RETURN NULL;
+    END IF;
+    FOREACH rows_name IN ARRAY CASE TG_OP
+        WHEN 'INSERT' THEN ARRAY['new_rows'] WHEN 'DELETE' THEN ARRAY['old_rows']
+        ELSE ARRAY['new_rows', 'old_rows'] END
+    LOOP
+        sign := CASE rows_name WHEN 'new_rows' THEN '1' ELSE '-1' END;
+        IF deltas <> '' THEN
+            deltas := deltas || ' UNION ALL ';
+        END IF;
+        deltas := deltas || 'SELECT '''' AS key, ' || sign || ' * count(*) AS delta FROM ' || rows_name;
+        FOREACH column_name IN ARRAY coalesce(TG_ARGV, '{}') LOOP
+            deltas := deltas || ' UNION ALL SELECT ' || quote_literal(column_name || '=')
+                || ' || coalesce(' || quote_ident(column_name) || '::text, ''''), '
+                || sign || ' * count(*) FROM ' || rows_name || ' GROUP BY 1';
+        END LOOP;
+    END LOOP;
+    EXECUTE 'INSERT INTO row_counters (table_name, key, count) SELECT '
+        || quote_literal(TG_TABLE_NAME) || ', key, sum(delta) FROM (' || deltas || ') AS deltas'
+        || ' GROUP BY key HAVING sum(delta) <> 0'
+        || ' ON CONFLICT (table_name, key) DO UPDATE SET count = row_counters.count + excluded.count';
+    RETURN NULL;
+END $$
+"""
+
+
+def row_counter_triggers_sql(table: str, columns) -> list:
+    """CREATE TRIGGER для таблицы; UPDATE меняет только счётчики по колонкам"""
+    args = ", ".join(f"'{column}'" for column in columns)
+    statements = [
+        f"CREATE OR REPLACE TRIGGER {table}_count_insert AFTER INSERT ON {table} "
+        f"REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION row_counters_apply({args})",
+        f"CREATE OR REPLACE TRIGGER {table}_count_delete AFTER DELETE ON {table} "
+        f"REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION row_counters_apply({args})",
+        f"CREATE OR REPLACE TRIGGER {table}_count_truncate AFTER TRUNCATE ON {table} "
+        f"FOR EACH STATEMENT EXECUTE FUNCTION row_counters_apply()",
+    ]
+    if columns:
+        statements.append(
+            f"CREATE OR REPLACE TRIGGER {table}_count_update AFTER UPDATE ON {table} "
+            f"REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION row_counters_apply({args})"
+        )
+    return statements
+
+
+def _install_row_counters(table, connection, **kw):
+    if connection.dialect.name != "postgresql":
+        return
+    connection.exec_driver_sql(ROW_COUNTERS_FUNCTION_SQL)
+    for statement in row_counter_triggers_sql(table.name, COUNTED_TABLES[table.name]):
+        connection.exec_driver_sql(statement)
+
+
+# create_all (reset_db.py, benchmarks) сразу ставит триггеры; существующим базам — миграция 0004
+for _table in (User.__table__, News.__table__, CongressRegistration.__table__, SchoolApplication.__table__):
+    event.listen(_table, "after_create", _install_row_counters)
+
 
 # Удаляем старые модели которые заменены
 # Doctor -> ChiefRheumatologist
@@ -0,0 +1,54 @@
+"""Пул соединений с замером ожидания свободного соединения"""
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class MeasuredAsyncPool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool, который считает время выдачи соединения.
+
+    Время включает ожидание освобождения соединения при исчерпанном пуле и
+    открытие нового соединения, если пул ещё может расти (overflow). Учитываются
+    только успешные выдачи; истечения pool_timeout считаются отдельно в timeouts.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.acquired = 0
+        self.waiting = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        self.waiting += 1
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            # Соединение не выдано: в acquired и время ожидания не попадает
+            self.timeouts += 1
+            raise
+        finally:
+            self.waiting -= 1
+        elapsed = time.perf_counter() - started
+        self.acquired += 1
+        self.wait_total += elapsed
+        self.wait_max = max(self.wait_max, elapsed)
+        return connection
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "timeout": self.timeout(),
+            "waiting": self.waiting,
+            "acquired": self.acquired,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": round(self.wait_total / self.acquired * 1000, 3) if self.acquired else 0.0,
+            "wait_max_ms": round(self.wait_max * 1000, 3),
+        }
@@ -1,6 +1,8 @@
 from .auth import (
     verify_password,
     get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
     create_access_token,
     get_current_user,
     get_current_admin_user,
@@ -18,6 +20,8 @@ from .crud import (
 __all__ = [
     "verify_password",
     "get_password_hash",
+    "verify_password_async",
+    "get_password_hash_async",
     "create_access_token",
     "get_current_user",
     "get_current_admin_user",
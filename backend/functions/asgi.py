@@ -0,0 +1,66 @@
+"""HTTP-запрос к ASGI-приложению внутри процесса (без сети и HTTP-клиента)
+
+Используется снимками для nginx и бенчмарками: запрос проходит весь стек
+приложения — middleware, зависимости, схемы ответа и сериализацию.
+"""
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import urlencode
+
+
+@dataclass
+class ASGIResponse:
+    status: Optional[int] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+
+async def asgi_request(
+    app,
+    method: str,
+    path: str,
+    params: Optional[dict] = None,
+    body: bytes = b"",
+    headers: Iterable[Tuple[str, str]] = ()
+) -> ASGIResponse:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": urlencode(params or {}, doseq=True).encode(),
+        "headers": [(b"host", b"localhost")] + [(k.lower().encode(), v.encode()) for k, v in headers],
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", 80),
+    }
+    response = ASGIResponse()
+    chunks = []
+    request_sent = False
+    response_complete = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # Как настоящий сервер: disconnect только после ответа, иначе StreamingResponse обрывается
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response.status = message["status"]
+            response.headers = {k.decode().lower(): v.decode() for k, v in message.get("headers", [])}
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    await app(scope, receive, send)
+    response.body = b"".join(chunks)
+    return response
@@ -1,20 +1,36 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import make_transient_to_detached
 
 from config import settings
 from database import get_db, User
 from database.models import UserRole
 from schemas import TokenData
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from functions.cache import user_cache, user_tag, MISSING
+
+# Хеши с другим числом раундов считаются устаревшими и перехешируются при входе
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
+# bcrypt занимает процессор на 100-300 мс: считаем его в отдельных потоках (bcrypt
+# отпускает GIL), не больше PASSWORD_HASH_WORKERS одновременно на воркер
+_hash_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+_hash_slots = asyncio.Semaphore(settings.PASSWORD_HASH_WORKERS)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -24,6 +40,31 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def _run_hashing(func, *args):
+    """Выполнить bcrypt в пуле потоков; если очередь не подошла за таймаут — 503"""
+    try:
+        await asyncio.wait_for(_hash_slots.acquire(), timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please try again",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, func, *args)
+    finally:
+        _hash_slots.release()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Проверить пароль вне event loop; второй элемент — новый хеш, если стоимость изменилась"""
+    return await _run_hashing(pwd_context.verify_and_update, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_hashing(pwd_context.hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
@@ -53,14 +94,33 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
+    # Админка шлёт много запросов подряд — пользователя берём из кэша (TTL AUTH_USER_CACHE_TTL,
+    # сбрасывается publish_user_eviction() при смене роли и удалении)
+    cache_key = ("users", token_data.email)
+    cached = user_cache.get(cache_key)
+    if cached is not MISSING:
+        return await _attach_cached_user(db, cached)
+
     result = await db.execute(select(User).where(User.email == token_data.email))
     user = result.scalar_one_or_none()
 
     if user is None:
         raise credentials_exception
+    user_cache.set(
+        cache_key,
+        {column.key: getattr(user, column.key) for column in User.__table__.columns},
+        tags=("users", user_tag(user.email))
+    )
     return user
 
 
+async def _attach_cached_user(db: AsyncSession, values: dict) -> User:
+    """Объект User из кэша, привязанный к сессии запроса без SELECT"""
+    user = User(**values)
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
+
 async def get_current_admin_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -0,0 +1,117 @@
+"""In-process кэш с TTL и LRU-вытеснением для публичного контента"""
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Hashable, Iterable, Optional
+
+from config import settings
+
+
+# Маркер отсутствия значения (None — валидный ответ, например нет активного устава)
+MISSING = object()
+
+# True — читать мимо кэшей (рендер снимков: запись другого воркера могла ещё не сброситься)
+cache_bypass: ContextVar[bool] = ContextVar("cache_bypass", default=False)
+
+
+class TTLCache:
+    """Ограниченный по размеру кэш: у каждой записи свой TTL, при переполнении
+    вытесняется давно не использованная запись.
+
+    Записи помечаются тегами (по умолчанию — первый элемент ключа, имя таблицы),
+    чтобы обработчики записи могли сбросить всё, что зависит от таблицы.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any, frozenset]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.bypassed = 0
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        if cache_bypass.get():
+            self.bypassed += 1
+            return default
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        tags: Optional[Iterable[str]] = None,
+        ttl: Optional[float] = None
+    ) -> None:
+        if tags is None:
+            tags = (key[0],) if isinstance(key, tuple) else (key,)
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.ttl)
+
+        self._data[key] = (expires_at, value, frozenset(tags))
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, *tags: str) -> int:
+        """Удалить все записи, помеченные хотя бы одним из тегов"""
+        wanted = set(tags)
+        keys = [key for key, (_, _, entry_tags) in self._data.items() if entry_tags & wanted]
+        for key in keys:
+            del self._data[key]
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        self.invalidations += len(self._data)
+        self._data.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "bypassed": self.bypassed,
+        }
+
+
+# Кэш публичных справочников (члены правления, партнёры, устав, центры, ...)
+content_cache = TTLCache(
+    maxsize=settings.CONTENT_CACHE_MAXSIZE,
+    ttl=settings.CONTENT_CACHE_TTL
+)
+
+# Пользователи, найденные по токену (get_current_user); запись пользователя сбрасывается
+# по тегу user_tag(email), все пользователи — по тегу "users"
+user_cache = TTLCache(
+    maxsize=settings.AUTH_USER_CACHE_MAXSIZE,
+    ttl=settings.AUTH_USER_CACHE_TTL
+)
+
+
+def user_tag(email: str) -> str:
+    return f"users:{email}"
+
+# Кэши, которые сбрасывает шина инвалидации (functions/invalidation.py)
+invalidated_caches = (content_cache, user_cache)
@@ -1,5 +1,8 @@
+import base64
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, tuple_
+from sqlalchemy.sql import Select
 from typing import List, Optional
 
 from database import User, News, Congress, RheumatologyCenter, ChiefRheumatologist, Disease, SchoolApplication
@@ -28,16 +31,50 @@ async def create_user(db: AsyncSession, user: UserCreate, hashed_password: str)
 
 
 # News CRUD
+def encode_news_cursor(created_at: datetime, news_id: int) -> str:
+    """Непрозрачный курсор ленты новостей: (created_at, id) последнего элемента"""
+    raw = f"{created_at.isoformat()}|{news_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_news_cursor(cursor: str) -> tuple[datetime, int]:
+    """Разобрать курсор; ValueError, если он повреждён"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, news_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(news_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def paginate_news_keyset(query: Select, cursor: Optional[str], limit: int) -> Select:
+    """Keyset-пагинация по (created_at DESC, id DESC).
+
+    Вместо OFFSET берём строки строго после курсора — это диапазонное сканирование
+    индекса ix_news_feed, и новость, опубликованная во время прокрутки, не сдвигает
+    страницы. Запрашивается limit + 1 строк, чтобы понять, есть ли следующая.
+    """
+    if cursor:
+        created_at, news_id = decode_news_cursor(cursor)
+        query = query.where(tuple_(News.created_at, News.id) < tuple_(created_at, news_id))
+    return query.order_by(desc(News.created_at), desc(News.id)).limit(limit + 1)
+
+
 async def get_news_list(
     db: AsyncSession,
     skip: int = 0,
     limit: int = 10,
-    published_only: bool = True
+    published_only: bool = True,
+    cursor: Optional[str] = None
 ) -> List[News]:
-    query = select(News).order_by(desc(News.created_at))
+    """Список новостей; с cursor — keyset-пагинация вместо OFFSET"""
+    query = select(News)
     if published_only:
         query = query.where(News.is_published == True)
-    query = query.offset(skip).limit(limit)
+    if cursor is not None:
+        result = await db.execute(paginate_news_keyset(query, cursor, limit))
+        return result.scalars().all()[:limit]
+    query = query.order_by(desc(News.created_at)).offset(skip).limit(limit)
     result = await db.execute(query)
     return result.scalars().all()
 
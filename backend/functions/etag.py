@@ -0,0 +1,102 @@
+"""ETag / If-None-Match для публичных GET-эндпоинтов
+
+ETag строится из версий таблиц (content_versions), а не из самих строк:
+проверка стоит один маленький запрос (или ноль — версии кэшируются в памяти
+и сбрасываются шиной инвалидации), ORM-объекты при 304 не загружаются.
+"""
+import hashlib
+from typing import Dict, Iterable
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import get_db, ContentVersion
+from functions.cache import content_cache, MISSING
+
+
+async def bump_versions(db: AsyncSession, tables: Iterable[str]) -> None:
+    """Увеличить версии таблиц в текущей транзакции"""
+    tables = sorted(set(tables))
+    if not tables:
+        return
+
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = pg_insert(ContentVersion).values(
+            [{"table_name": table, "version": 1} for table in tables]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ContentVersion.table_name],
+            set_={"version": ContentVersion.version + 1}
+        )
+        await db.execute(stmt)
+        return
+
+    for table in tables:
+        result = await db.execute(
+            ContentVersion.__table__.update()
+            .where(ContentVersion.table_name == table)
+            .values(version=ContentVersion.version + 1)
+        )
+        if result.rowcount == 0:
+            db.add(ContentVersion(table_name=table, version=1))
+    await db.flush()
+
+
+async def get_versions(db: AsyncSession, tables: tuple) -> Dict[str, int]:
+    cache_key = ("etag_versions", tables)
+    cached = content_cache.get(cache_key)
+    if cached is not MISSING:
+        return cached
+
+    result = await db.execute(
+        select(ContentVersion.table_name, ContentVersion.version)
+        .where(ContentVersion.table_name.in_(tables))
+    )
+    versions = {table: 0 for table in tables}
+    versions.update(dict(result.all()))
+    # Вернуть соединение в пул сразу, а не в конце запроса: иначе обработчик, открывающий
+    # свои сессии (главная), при всплеске запросов ждёт пул, занятый этими же запросами
+    await db.rollback()
+    content_cache.set(cache_key, versions, tags=tables)
+    return versions
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match сравнивается слабо: W/"x" совпадает с "x"
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+def etag_guard(*tables: str):
+    """Зависимость: ставит ETag на ответ или сразу отвечает 304 Not Modified.
+
+    ETag зависит от версий перечисленных таблиц, пути и query-параметров запроса,
+    поэтому разные представления (include_inactive, фильтры) получают разные ETag.
+    """
+    tables = tuple(sorted(tables))
+
+    async def dependency(
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_db)
+    ):
+        versions = await get_versions(db, tables)
+        raw = "|".join([
+            request.app.version,
+            request.url.path,
+            str(sorted(request.query_params.multi_items())),
+            *(f"{table}:{versions[table]}" for table in tables),
+        ])
+        etag = '"' + hashlib.sha1(raw.encode()).hexdigest() + '"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _matches(if_none_match, etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
+    return dependency
@@ -0,0 +1,177 @@
+"""Потоковая выгрузка таблиц в CSV и XLSX
+
+Строки читаются серверным курсором (AsyncSession.stream, yield_per) пачками по
+EXPORT_BATCH_SIZE, каждая пачка сразу кодируется и уходит клиенту. В памяти
+воркера — одна пачка и буфер сжатия, сколько бы строк ни было в выгрузке.
+
+Сессия открывается внутри генератора, а не берётся из get_db: зависимости с yield
+закрываются до отправки тела ответа. Соединение занято, пока идёт выгрузка.
+
+XLSX собирается без сторонних библиотек: zip пишется в поток (размеры файлов — в
+дескрипторах после данных), лист — строки с inline-строками, без общей таблицы
+строк, которую пришлось бы держать в памяти целиком.
+"""
+import codecs
+import csv
+import io
+import re
+import zipfile
+from contextlib import aclosing
+from datetime import date, datetime
+from typing import AsyncIterator, Iterable, List, Sequence
+from xml.sax.saxutils import escape
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+
+from config import settings
+from database import async_session
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",  # charset добавляет Starlette
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# Ячейка CSV, которую Excel может выполнить как формулу (OWASP CSV Injection); телефон
+# целиком из цифр, пробелов, скобок и дефисов не экранируется, чтобы остаться читаемым
+_FORMULA = re.compile(r"^[=+\-@\t\r]")
+_PHONE = re.compile(r"^\+?[\d(][\d\s()-]*$")
+# Символы, запрещённые в XML 1.0
+_XML_ILLEGAL = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M")
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+async def stream_rows(query: Select) -> AsyncIterator[Sequence]:
+    """Строки запроса пачками через серверный курсор"""
+    async with async_session() as session:
+        result = await session.stream(query.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+        async for batch in result.partitions():
+            yield batch
+
+
+# ==================== CSV ====================
+def csv_chunk(rows: Iterable[Sequence]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        cells = []
+        for value in row:
+            text = _text(value)
+            formula = isinstance(value, str) and _FORMULA.match(text) and not _PHONE.match(text)
+            cells.append("'" + text if formula else text)
+        writer.writerow(cells)
+    return buffer.getvalue().encode()
+
+
+async def csv_stream(headers: List[str], query: Select) -> AsyncIterator[bytes]:
+    # BOM — иначе Excel открывает UTF-8 как cp1251
+    yield codecs.BOM_UTF8 + csv_chunk([headers])
+    async with aclosing(stream_rows(query)) as batches:
+        async for batch in batches:
+            yield csv_chunk(batch)
+
+
+# ==================== XLSX ====================
+_XLSX_STATIC = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="xl/workbook.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="worksheets/sheet1.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+        '</Relationships>'
+    ),
+}
+_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_END = "</sheetData></worksheet>"
+
+
+class _ChunkSink(io.RawIOBase):
+    """Неперематываемый файл для ZipFile: записанное забирается через drain()"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def xlsx_row(values: Sequence) -> str:
+    cells = []
+    for value in values:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            cells.append(f"<c><v>{value}</v></c>")
+        else:
+            text = escape(_XML_ILLEGAL.sub("", _text(value)))
+            cells.append(f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+    return "<row>" + "".join(cells) + "</row>"
+
+
+async def xlsx_stream(headers: List[str], query: Select) -> AsyncIterator[bytes]:
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_STATIC.items():
+            archive.writestr(name, content)
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write((_SHEET_START + xlsx_row(headers)).encode())
+            async with aclosing(stream_rows(query)) as batches:
+                async for batch in batches:
+                    sheet.write("".join(xlsx_row(row) for row in batch).encode())
+                    yield sink.drain()
+            sheet.write(_SHEET_END.encode())
+    yield sink.drain()
+
+
+def export_response(query: Select, headers: List[str], export_format: str, filename: str) -> StreamingResponse:
+    """Ответ с выгрузкой: колонки query — в порядке headers. Порядок по первичному
+    ключу: строки идут из индекса сразу, без сортировки всей выборки до первой строки"""
+    stream = xlsx_stream if export_format == "xlsx" else csv_stream
+    return StreamingResponse(
+        stream(headers, query),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
@@ -0,0 +1,252 @@
+"""Уменьшенные копии загруженных изображений (/img/{width}/{filename})
+
+Копия строится один раз: декодирование, уменьшение и кодирование в WebP (если
+клиент его принимает) или JPEG/PNG выполняются в пуле процессов, event loop API
+только ждёт результат. Готовые копии лежат в IMAGE_CACHE_DIR/<width>/<вариант>/.
+Размер каталога ограничен IMAGE_CACHE_MAX_SIZE: при превышении удаляются давно не
+запрошенные копии (LRU по mtime, который обновляется при отдаче). Имена загрузок
+не меняются при замене содержимого (это SHA-256 файла), поэтому копии можно
+кэшировать в браузере бессрочно.
+"""
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Tuple
+
+from PIL import ExifTags, Image, ImageOps, UnidentifiedImageError
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_DIR = "uploads"
+IMAGE_SOURCE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
+MEDIA_TYPES = {".webp": "image/webp", ".jpg": "image/jpeg", ".png": "image/png"}
+# EXIF Orientation, при которых exif_transpose меняет ширину и высоту местами
+ROTATED_ORIENTATIONS = {5, 6, 7, 8}
+
+# Не трогать mtime копии чаще раза в час: для LRU этой точности достаточно
+TOUCH_INTERVAL = 3600
+# После вытеснения каталог занимает не больше этой доли лимита
+EVICT_TO = 0.9
+# Только что построенные и отданные копии не вытесняются: ответ с ними ещё может отправляться
+EVICT_MIN_AGE = 60
+# Защита от «бомб» распаковки: больше пикселей Pillow не декодирует
+Image.MAX_IMAGE_PIXELS = 64_000_000
+
+
+class ImageError(Exception):
+    """Файл нельзя обработать как изображение"""
+
+
+def render_image(source: str, target_base: str, width: int, webp: bool, quality: int) -> str:
+    """Уменьшить source до ширины width и записать копию; возвращает путь к ней.
+
+    Выполняется в дочернем процессе. Без WebP: JPEG, а для картинок с прозрачностью — PNG.
+    """
+    try:
+        with Image.open(source) as image:
+            # JPEG декодируется сразу в уменьшенном масштабе (1/2, 1/4, 1/8) — в разы быстрее.
+            # Масштаб — по ширине после поворота из EXIF: у снимков с телефона оси переставлены
+            rotated = image.getexif().get(ExifTags.Base.Orientation) in ROTATED_ORIENTATIONS
+            shown_width = image.height if rotated else image.width
+            scale = width / max(shown_width, 1)
+            image.draft("RGB", (math.ceil(image.width * scale), math.ceil(image.height * scale)))
+            image = ImageOps.exif_transpose(image)
+            has_alpha = image.mode in ("RGBA", "LA", "PA") or (image.mode == "P" and "transparency" in image.info)
+            image = image.convert("RGBA" if has_alpha else "RGB")
+            if image.width > width:
+                image = image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise ImageError(str(e)) from None
+
+    if webp:
+        ext, options = ".webp", {"format": "WEBP", "quality": quality, "method": 4}
+    elif has_alpha:
+        ext, options = ".png", {"format": "PNG", "optimize": True}
+    else:
+        ext, options = ".jpg", {"format": "JPEG", "quality": quality, "optimize": True, "progressive": True}
+
+    path = target_base + ext
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            image.save(f, **options)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+class ImageCache:
+    """Дисковый кэш уменьшенных копий с вытеснением давно не запрошенных"""
+
+    def __init__(self, directory: str, max_size: int, workers: int, quality: int):
+        self.directory = directory
+        self.max_size = max_size
+        self.workers = workers
+        self.quality = quality
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self.errors = 0
+        self._size: Optional[int] = None  # Оценка размера каталога; точное значение — при вытеснении
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Dict[Tuple[str, int, bool], asyncio.Future] = {}
+        self._evicting: Optional[asyncio.Task] = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: форк процесса с работающим event loop и потоками небезопасен
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @staticmethod
+    def source_path(filename: str) -> Optional[str]:
+        """Путь к загруженному изображению или None (чужие пути, не изображения)"""
+        if os.path.basename(filename) != filename or filename.startswith("."):
+            return None
+        if os.path.splitext(filename)[1].lower() not in IMAGE_SOURCE_EXTENSIONS:
+            return None
+        return os.path.join(UPLOAD_DIR, filename)
+
+    def _target_base(self, filename: str, width: int, webp: bool) -> str:
+        return os.path.join(self.directory, str(width), "webp" if webp else "legacy", filename)
+
+    def _lookup(self, target_base: str, webp: bool) -> Optional[str]:
+        for ext in ((".webp",) if webp else (".jpg", ".png")):
+            path = target_base + ext
+            try:
+                mtime = os.stat(path).st_mtime
+            except FileNotFoundError:
+                continue
+            if time.time() - mtime > TOUCH_INTERVAL:
+                os.utime(path)
+            return path
+        return None
+
+    async def get(self, filename: str, width: int, webp: bool) -> Optional[Tuple[str, str]]:
+        """Путь к копии и её MIME-тип; None — исходного изображения нет.
+        ImageError — исходный файл не является изображением."""
+        source = self.source_path(filename)
+        # Копия отдаётся, только пока существует оригинал (его мог удалить collect_uploads.py)
+        if source is None or not os.path.isfile(source):
+            return None
+        target_base = self._target_base(filename, width, webp)
+        path = await asyncio.to_thread(self._lookup, target_base, webp)
+        if path is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            path = await self._render(source, target_base, width, webp)
+        return path, MEDIA_TYPES[os.path.splitext(path)[1]]
+
+    async def _render(self, source: str, target_base: str, width: int, webp: bool) -> str:
+        # Одновременные запросы одной копии ждут один и тот же рендер
+        key = (source, width, webp)
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            try:
+                path = await loop.run_in_executor(
+                    self._pool(), render_image, source, target_base, width, webp, self.quality
+                )
+                future.set_result(path)
+            except BaseException as e:
+                if isinstance(e, ImageError):
+                    self.errors += 1
+                elif isinstance(e, BrokenProcessPool):
+                    # Процесс пула упал (например, OOM) — следующий запрос создаст новый пул
+                    self._executor = None
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    future.exception()  # Исключение передано ожидающим, здесь не «потеряно»
+                raise
+            finally:
+                del self._pending[key]
+            self._account(path)
+            return path
+        return await asyncio.shield(future)
+
+    def _account(self, path: str) -> None:
+        try:
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            return
+        if self._size is not None:
+            self._size += size
+        if (self._size is None or self._size > self.max_size) and (self._evicting is None or self._evicting.done()):
+            self._evicting = asyncio.get_running_loop().create_task(self._evict())
+
+    async def _evict(self) -> None:
+        try:
+            self._size, removed = await asyncio.to_thread(self._evict_sync)
+            self.evicted += removed
+        except Exception:
+            logger.exception("Image cache eviction failed")
+
+    def _evict_sync(self) -> Tuple[int, int]:
+        """Удалить самые давние копии, пока каталог больше лимита; возвращает (размер, удалено)"""
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        if total > self.max_size:
+            files.sort()
+            recent = time.time() - EVICT_MIN_AGE
+            for mtime, size, path in files:
+                if total <= self.max_size * EVICT_TO or mtime > recent:
+                    break
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                removed += 1
+        return total, removed
+
+    def stats(self) -> dict:
+        return {
+            "directory": self.directory,
+            "size": self._size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evicted": self.evicted,
+            "errors": self.errors,
+            "rendering": len(self._pending),
+        }
+
+
+# Кэш копий этого воркера (пул процессов создаётся при первом рендере)
+image_cache = ImageCache(
+    settings.IMAGE_CACHE_DIR, settings.IMAGE_CACHE_MAX_SIZE, settings.IMAGE_WORKERS, settings.IMAGE_QUALITY
+)
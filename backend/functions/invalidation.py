@@ -0,0 +1,179 @@
+"""Шина инвалидации кэша между воркерами (Postgres LISTEN/NOTIFY)
+
+Обработчики записи вызывают publish_invalidation() до COMMIT: NOTIFY уходит
+в той же транзакции, поэтому Postgres доставит его остальным воркерам только
+после фиксации изменений (и не доставит при откате). Каждый воркер держит одно
+выделенное asyncpg-соединение с LISTEN и сбрасывает записи кэша по тегу: имени
+таблицы или тегу одного пользователя (users:<email>, publish_user_eviction).
+"""
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Iterable, Optional
+
+import asyncpg
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from config import settings
+from functions.cache import invalidated_caches, user_tag
+from functions.etag import bump_versions
+from functions.snapshots import merge_changes, snapshot_publisher
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "content_invalidation"
+
+# Ключ в session.info, где копятся изменения текущей транзакции: таблица -> id строк или None
+_PENDING_KEY = "invalidated_tables"
+# Ключ в session.info для тегов, которые нужно только сбросить из кэшей (без версий и снимков)
+_EVICT_KEY = "evicted_tags"
+
+
+def evict_local(tag: str) -> None:
+    """Сбросить кэши этого воркера по тегу (имя таблицы или users:<email>)"""
+    for cache in invalidated_caches:
+        cache.invalidate(tag)
+
+
+async def _notify(db: AsyncSession, tag: str) -> None:
+    if db.get_bind().dialect.name == "postgresql":
+        await db.execute(text("SELECT pg_notify(:channel, :tag)"), {"channel": CHANNEL, "tag": tag})
+
+
+async def publish_invalidation(db: AsyncSession, *tables: str, ids: Optional[Iterable[int]] = None) -> None:
+    """Запланировать инвалидацию таблиц после успешного COMMIT текущей транзакции.
+
+    ids — id изменённых строк: снимки отдельных записей перестроятся только для них
+    (None — могли измениться любые строки). Кэши сбрасываются по таблице целиком.
+    """
+    ids = None if ids is None else set(ids)
+    pending = db.info.setdefault(_PENDING_KEY, {})
+    for table in tables:
+        merge_changes(pending, table, ids)
+    await bump_versions(db, tables)
+    for table in tables:
+        await _notify(db, table)
+
+
+async def publish_user_eviction(db: AsyncSession, email: str) -> None:
+    """Сбросить кэш одного пользователя во всех воркерах после COMMIT.
+    Пользователи — не публичный контент: версии таблиц и снимки не трогаются."""
+    tag = user_tag(email)
+    db.info.setdefault(_EVICT_KEY, set()).add(tag)
+    await _notify(db, tag)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_after_commit(session: Session) -> None:
+    # Свой воркер сбрасываем сразу, не дожидаясь возврата собственного NOTIFY
+    changes = session.info.pop(_PENDING_KEY, {})
+    for table in changes:
+        evict_local(table)
+    # Снимки перестраивает только воркер, сделавший запись
+    if changes:
+        snapshot_publisher.schedule(changes)
+    for tag in session.info.pop(_EVICT_KEY, ()):
+        evict_local(tag)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_EVICT_KEY, None)
+
+
+def listener_dsn(database_url: str) -> str:
+    """DSN для asyncpg из URL SQLAlchemy (postgresql+asyncpg://... -> postgresql://...)"""
+    url = make_url(database_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+class InvalidationListener:
+    """Выделенное LISTEN-соединение воркера с автоматическим переподключением"""
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str = CHANNEL,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        ping_interval: float = 30.0
+    ):
+        self.dsn = dsn
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.ping_interval = ping_interval
+        self.connected = False
+        self.received = 0
+        self.reconnects = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        self.received += 1
+        evict_local(payload)
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay
+        while True:
+            try:
+                await self._listen()
+                delay = self.reconnect_delay
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Cache invalidation listener disconnected: %s", e)
+            self.connected = False
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _listen(self) -> None:
+        conn = await asyncpg.connect(self.dsn)
+        closed = asyncio.Event()
+        conn.add_termination_listener(lambda _: closed.set())
+        try:
+            await conn.add_listener(self.channel, self._on_notify)
+            # Пока соединения не было, уведомления могли потеряться — сбрасываем весь кэш
+            for cache in invalidated_caches:
+                cache.clear()
+            self.connected = True
+
+            while not closed.is_set():
+                try:
+                    await asyncio.wait_for(closed.wait(), timeout=self.ping_interval)
+                except asyncio.TimeoutError:
+                    # Полуоткрытое TCP-соединение само не закроется — проверяем его
+                    await conn.fetchval("SELECT 1", timeout=self.ping_interval)
+        finally:
+            self.connected = False
+            if not conn.is_closed():
+                with suppress(Exception):
+                    await asyncio.shield(conn.close(timeout=5))
+
+    def stats(self) -> dict:
+        return {
+            "channel": self.channel,
+            "connected": self.connected,
+            "received": self.received,
+            "reconnects": self.reconnects,
+        }
+
+
+# Слушатель этого воркера (запускается в lifespan приложения)
+invalidation_listener = InvalidationListener(listener_dsn(settings.DATABASE_URL))
@@ -0,0 +1,68 @@
+"""Проекция мультиязычного контента на один язык (?lang=ru|uz|en)
+
+Для поля `title` схемы выбирается только `title_<lang>`, а пустой перевод
+заменяется другим языком прямо в SQL (COALESCE), так что из базы приходит
+одна колонка вместо трёх, а клиент получает компактное имя поля.
+"""
+from typing import List, Optional, Type
+
+from pydantic import BaseModel
+from sqlalchemy import func, select
+from sqlalchemy.engine import Result
+from sqlalchemy.sql import Select
+
+from database.models import Language
+
+# Порядок подстановки, если перевода на выбранный язык нет
+FALLBACK_ORDER = {
+    Language.RU: (Language.RU, Language.EN, Language.UZ),
+    Language.UZ: (Language.UZ, Language.RU, Language.EN),
+    Language.EN: (Language.EN, Language.RU, Language.UZ),
+}
+
+
+def localized_column(model, field: str, lang: Language):
+    """COALESCE(NULLIF(<field>_<lang>, ''), ...) AS <field>"""
+    columns = [getattr(model, f"{field}_{fallback.value}") for fallback in FALLBACK_ORDER[lang]]
+    return func.coalesce(*(func.nullif(column, "") for column in columns)).label(field)
+
+
+def localized_select(model, lang: Language, schema: Type[BaseModel]) -> Select:
+    """SELECT только тех колонок, которые нужны схеме, на одном языке"""
+    table_columns = model.__table__.columns
+    columns = []
+    for field in schema.model_fields:
+        if f"{field}_{lang.value}" in table_columns:
+            columns.append(localized_column(model, field, lang))
+        elif field in table_columns:
+            columns.append(getattr(model, field))
+    return select(*columns)
+
+
+class Projection:
+    """Пара схем ответа для модели: полная (все языки) и проекция на один язык.
+
+    В обоих режимах из базы читаются только колонки, которые есть в схеме
+    (например, краткая схема новости не тянет тяжёлые content_*). Результат —
+    словари строк без ORM-объектов и без валидации: их форма уже задана SELECT,
+    а отдаются они через trusted_response (functions/serialization.py).
+    """
+
+    def __init__(self, model, schema: Type[BaseModel], localized_schema: Type[BaseModel]):
+        self.model = model
+        self.schema = schema
+        self.localized_schema = localized_schema
+        table_columns = model.__table__.columns
+        self._columns = [getattr(model, field) for field in schema.model_fields if field in table_columns]
+
+    def select(self, lang: Optional[Language] = None) -> Select:
+        if lang is None:
+            return select(*self._columns)
+        return localized_select(self.model, Language(lang), self.localized_schema)
+
+    def all(self, result: Result) -> List[dict]:
+        return [dict(row) for row in result.mappings().all()]
+
+    def one_or_none(self, result: Result) -> Optional[dict]:
+        row = result.mappings().first()
+        return dict(row) if row is not None else None
@@ -0,0 +1,311 @@
+"""Метрики HTTP-запросов в формате Prometheus (/internal/metrics)
+
+MetricsMiddleware — чистый ASGI-middleware (без BaseHTTPMiddleware и без лишних задач):
+на запрос это два вызова perf_counter, ContextVar и несколько операций со словарём,
+поэтому метрики включены и в продакшене. Маршрут берётся шаблоном пути
+(/api/content/news/{news_id}), запросы мимо маршрутов считаются вместе как
+"unmatched", нестандартные HTTP-методы — как "OTHER": сканеры не раздувают число серий.
+
+Время и число SQL-запросов считают события курсора движка (database/connection.py)
+в QueryStats текущего запроса; их же проверяет бюджет запросов (functions/query_budget.py).
+
+Метрики хранятся в памяти воркера. Если задан METRICS_DIR, каждый воркер раз в
+METRICS_FLUSH_INTERVAL секунд пишет туда свой снимок, а /internal/metrics складывает
+снимки всех воркеров — иначе каждый опрос Prometheus попадал бы в случайный воркер.
+Счётчики остановленных воркеров сохраняются (сумма не убывает), их gauge — нет.
+"""
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import suppress
+from typing import Dict, List, Optional, Tuple
+
+from config import settings
+from database.connection import QueryStats, current_query_stats, pool_stats
+from functions.query_budget import query_budget
+
+logger = logging.getLogger(__name__)
+
+# Границы корзин гистограмм, секунды (le в Prometheus)
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4"  # charset добавляет Starlette
+UNMATCHED_ROUTE = "unmatched"
+KNOWN_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+OTHER_METHOD = "OTHER"
+
+# Поля pool_stats(): текущие значения и накопительные счётчики
+POOL_GAUGES = ("size", "checked_out", "overflow", "waiting")
+POOL_COUNTERS = ("acquired", "timeouts")
+
+
+class Histogram:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # Последняя корзина — больше BUCKETS[-1]
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+
+
+class RouteMetrics:
+    __slots__ = ("statuses", "duration", "db_duration", "db_queries")
+
+    def __init__(self):
+        self.statuses: Dict[int, int] = defaultdict(int)
+        self.duration = Histogram()
+        self.db_duration = Histogram()
+        self.db_queries = 0
+
+
+def route_label(scope: dict) -> str:
+    """Шаблон пути маршрута, обработавшего запрос"""
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    if scope.get("endpoint") is not None:
+        # Mount (StaticFiles /uploads): маршрута нет, root_path — префикс монтирования
+        return scope.get("root_path") or UNMATCHED_ROUTE
+    return UNMATCHED_ROUTE
+
+
+def method_label(scope: dict) -> str:
+    """HTTP-метод запроса; произвольные методы (FOO, XYZ1) сводятся к одной серии"""
+    method = scope["method"]
+    return method if method in KNOWN_METHODS else OTHER_METHOD
+
+
+class RequestMetrics:
+    def __init__(self, directory: str, flush_interval: float):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.in_flight = 0
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def observe(self, method: str, route: str, status: int, duration: float, queries: QueryStats) -> None:
+        key = (method, route)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            metrics = self.routes[key] = RouteMetrics()
+        metrics.statuses[status] += 1
+        metrics.duration.observe(duration)
+        metrics.db_duration.observe(queries.duration)
+        metrics.db_queries += queries.count
+
+    # ==================== СНИМКИ ВОРКЕРОВ ====================
+    def snapshot(self) -> dict:
+        pool = pool_stats()
+        return {
+            "pid": os.getpid(),
+            "in_flight": self.in_flight,
+            "pool": {key: pool[key] for key in POOL_GAUGES + POOL_COUNTERS if key in pool},
+            "routes": [
+                {
+                    "method": method,
+                    "route": route,
+                    "statuses": {str(code): count for code, count in metrics.statuses.items()},
+                    "duration": metrics.duration.counts,
+                    "duration_sum": metrics.duration.sum,
+                    "db_duration": metrics.db_duration.counts,
+                    "db_duration_sum": metrics.db_duration.sum,
+                    "db_queries": metrics.db_queries,
+                }
+                for (method, route), metrics in self.routes.items()
+            ],
+        }
+
+    def start(self) -> None:
+        if self.directory and self._task is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+            await asyncio.to_thread(self._write, self.snapshot())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self._write, self.snapshot())
+            except Exception as e:
+                logger.warning("Metrics snapshot write failed: %s", e)
+            await asyncio.sleep(self.flush_interval)
+
+    def _write(self, snapshot: dict) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, os.path.join(self.directory, f"{snapshot['pid']}.json"))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _read_others(self) -> List[dict]:
+        """Снимки остальных воркеров (и уже остановленных) из METRICS_DIR"""
+        snapshots = []
+        if not self.directory or not os.path.isdir(self.directory):
+            return snapshots
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json") or name == f"{os.getpid()}.json":
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                continue  # Файл удалён или перезаписывается
+            snapshot["alive"] = _pid_alive(snapshot["pid"])
+            snapshots.append(snapshot)
+        return snapshots
+
+    # ==================== ФОРМАТ PROMETHEUS ====================
+    async def render(self) -> str:
+        own = self.snapshot()
+        own["alive"] = True
+        snapshots = [own] + await asyncio.to_thread(self._read_others)
+        return render_snapshots(snapshots)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _merge_histogram(target: Optional[list], counts: list) -> list:
+    if target is None:
+        return list(counts)
+    return [a + b for a, b in zip(target, counts)]
+
+
+def render_snapshots(snapshots: List[dict]) -> str:
+    """Сложить снимки воркеров и вывести в текстовом формате Prometheus"""
+    statuses: Dict[tuple, int] = defaultdict(int)
+    histograms: Dict[str, Dict[tuple, list]] = {"duration": {}, "db_duration": {}}
+    sums: Dict[str, Dict[tuple, float]] = {"duration": defaultdict(float), "db_duration": defaultdict(float)}
+    db_queries: Dict[tuple, int] = defaultdict(int)
+    in_flight = 0
+    pool: Dict[str, int] = defaultdict(int)
+
+    for snapshot in snapshots:
+        if snapshot["alive"]:
+            in_flight += snapshot["in_flight"]
+        for key, value in snapshot["pool"].items():
+            if key in POOL_COUNTERS or snapshot["alive"]:
+                pool[key] += value
+        for entry in snapshot["routes"]:
+            if len(entry["duration"]) != len(BUCKETS) + 1:
+                continue  # Снимок версии с другими корзинами
+            key = (entry["method"], entry["route"])
+            for code, count in entry["statuses"].items():
+                statuses[key + (code,)] += count
+            for name in ("duration", "db_duration"):
+                histograms[name][key] = _merge_histogram(histograms[name].get(key), entry[name])
+                sums[name][key] += entry[f"{name}_sum"]
+            db_queries[key] += entry["db_queries"]
+
+    lines = [
+        "# HELP http_requests_total HTTP requests by route template and status code.",
+        "# TYPE http_requests_total counter",
+    ]
+    for (method, route, code), count in sorted(statuses.items()):
+        lines.append(f"http_requests_total{_labels(method=method, route=route, status=code)} {count}")
+
+    lines += [
+        "# HELP http_requests_in_flight HTTP requests being processed now.",
+        "# TYPE http_requests_in_flight gauge",
+        f"http_requests_in_flight {in_flight}",
+    ]
+
+    for name, metric, help_text in (
+        ("duration", "http_request_duration_seconds", "Time from request start to the last response byte."),
+        ("db_duration", "http_request_db_duration_seconds", "Time spent in SQL statements per request."),
+    ):
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} histogram"]
+        for (method, route), counts in sorted(histograms[name].items()):
+            cumulative = 0
+            for bound, count in zip(BUCKETS + ("+Inf",), counts):
+                cumulative += count
+                lines.append(f"{metric}_bucket{_labels(method=method, route=route, le=bound)} {cumulative}")
+            labels = _labels(method=method, route=route)
+            lines.append(f"{metric}_sum{labels} {sums[name][(method, route)]:.6f}")
+            lines.append(f"{metric}_count{labels} {cumulative}")
+
+    lines += [
+        "# HELP http_request_db_queries_total SQL statements executed while handling requests.",
+        "# TYPE http_request_db_queries_total counter",
+    ]
+    for (method, route), count in sorted(db_queries.items()):
+        lines.append(f"http_request_db_queries_total{_labels(method=method, route=route)} {count}")
+
+    for key in POOL_GAUGES:
+        if key in pool:
+            lines += [f"# TYPE db_pool_{key} gauge", f"db_pool_{key} {pool[key]}"]
+    for key in POOL_COUNTERS:
+        if key in pool:
+            lines += [f"# TYPE db_pool_{key}_total counter", f"db_pool_{key}_total {pool[key]}"]
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """Считает запросы, время ответа и время в БД по шаблонам маршрутов"""
+
+    def __init__(self, app, metrics: Optional[RequestMetrics] = None):
+        self.app = app
+        self.metrics = metrics or request_metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500  # Если приложение упало до начала ответа
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        queries = QueryStats()
+        token = current_query_stats.set(queries)
+        self.metrics.in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started
+            self.metrics.in_flight -= 1
+            current_query_stats.reset(token)
+            route = route_label(scope)
+            method = method_label(scope)
+            self.metrics.observe(method, route, status_code, duration, queries)
+            query_budget.check(method, route, queries)
+
+
+# Метрики этого воркера (запись снимков в METRICS_DIR запускается в lifespan)
+request_metrics = RequestMetrics(settings.METRICS_DIR, settings.METRICS_FLUSH_INTERVAL)
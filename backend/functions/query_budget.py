@@ -0,0 +1,137 @@
+"""Бюджет SQL-запросов на HTTP-запрос и поиск N+1
+
+MetricsMiddleware передаёт сюда QueryStats каждого запроса. Если запросов больше
+QUERY_BUDGET или запрос одной формы выполнен QUERY_REPEAT_THRESHOLD раз
+(цикл по строкам с запросом на каждую, ленивая загрузка связи), в лог пишется
+предупреждение с маршрутом и отпечатками самых частых запросов. Отпечаток (форма) —
+текст без литералов и с одинаковыми списками параметров, так что запросы с разными
+значениями и IN (...) разной длины сводятся к одному.
+
+Для проверок (benchmarks/query_budgets.py, тесты) — assert_max_queries: все HTTP-
+запросы внутри блока должны уложиться в заданное число SQL-запросов.
+"""
+import logging
+import re
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from config import settings
+from database.connection import QueryStats
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_PARAMETER = r"(?:\$\d+|\?|%\(\w+\)s)(?:::\w+)?"  # asyncpg (с приведением типа), sqlite, psycopg
+_PARAMETER_LIST = re.compile(rf"\(\s*{_PARAMETER}(?:\s*,\s*{_PARAMETER})*\s*\)")
+_LITERAL = re.compile(rf"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b|{_PARAMETER}")
+FINGERPRINT_LENGTH = 300
+REPORTED_STATEMENTS = 3
+FINGERPRINT_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=FINGERPRINT_CACHE_SIZE)
+def fingerprint(statement: str) -> str:
+    """Форма запроса: без литералов и значений параметров (запоминается по тексту)"""
+    text = _WHITESPACE.sub(" ", statement).strip()
+    text = _PARAMETER_LIST.sub("(?)", text)
+    text = _LITERAL.sub("?", text)
+    return text[:FINGERPRINT_LENGTH]
+
+
+def top_statements(stats: QueryStats, limit: int = REPORTED_STATEMENTS) -> List[Tuple[str, int]]:
+    """Самые частые формы запросов: [(отпечаток, сколько раз)]"""
+    shapes: Dict[str, int] = {}
+    for statement, count in stats.statements.items():
+        shape = fingerprint(statement)
+        shapes[shape] = shapes.get(shape, 0) + count
+    return sorted(shapes.items(), key=lambda item: -item[1])[:limit]
+
+
+def describe(stats: QueryStats) -> str:
+    return "; ".join(f"{count}x {shape}" for shape, count in top_statements(stats))
+
+
+class QueryBudget:
+    def __init__(self, budget: int, repeat_threshold: int, warning_interval: float):
+        self.budget = budget
+        self.repeat_threshold = repeat_threshold
+        self.warning_interval = warning_interval
+        self.exceeded = 0
+        self.repeated = 0
+        self._warned: Dict[Tuple[str, str], float] = {}
+        self._recorders: List[list] = []
+
+    def check(self, method: str, route: str, stats: QueryStats) -> None:
+        for recorded in self._recorders:
+            recorded.append((method, route, stats))
+        if not stats.count:
+            return
+
+        over_budget = 0 < self.budget < stats.count
+        repeated = False
+        if 0 < self.repeat_threshold <= stats.count:
+            shape, repeats = top_statements(stats, 1)[0]
+            repeated = repeats >= self.repeat_threshold
+        if not (over_budget or repeated):
+            return
+        self.exceeded += over_budget
+        self.repeated += repeated
+
+        key = (method, route)
+        now = time.monotonic()
+        if now - self._warned.get(key, float("-inf")) < self.warning_interval:
+            return
+        self._warned[key] = now
+        if over_budget:
+            reason = f"{stats.count} SQL queries (budget {self.budget})"
+        else:
+            reason = f"SQL query repeated {repeats}x (N+1?): {shape}"
+        logger.warning("%s %s: %s, %.1f ms in DB: %s", method, route, reason, stats.duration * 1000, describe(stats))
+
+    def stats(self) -> dict:
+        return {
+            "budget": self.budget,
+            "repeat_threshold": self.repeat_threshold,
+            "exceeded": self.exceeded,
+            "repeated": self.repeated,
+        }
+
+    @contextmanager
+    def record(self) -> Iterator[List[Tuple[str, str, QueryStats]]]:
+        """Собрать QueryStats всех HTTP-запросов внутри блока: [(метод, маршрут, QueryStats)]"""
+        recorded: list = []
+        self._recorders.append(recorded)
+        try:
+            yield recorded
+        finally:
+            self._recorders.remove(recorded)
+
+
+@contextmanager
+def assert_max_queries(limit: int, repeat_limit: Optional[int] = None) -> Iterator[list]:
+    """Каждый HTTP-запрос внутри блока выполнил не больше limit SQL-запросов и ни один
+    запрос одной формы не повторился больше repeat_limit раз; иначе AssertionError.
+
+        with assert_max_queries(2):
+            client.get("/api/content/news/1")
+    """
+    with query_budget.record() as recorded:
+        yield recorded
+    if not recorded:
+        raise AssertionError("No HTTP requests were made inside assert_max_queries")
+    failures = []
+    for method, route, stats in recorded:
+        if stats.count > limit:
+            failures.append(f"{method} {route}: {stats.count} queries (limit {limit}): {describe(stats)}")
+        top = top_statements(stats, 1)
+        if repeat_limit is not None and top and top[0][1] > repeat_limit:
+            shape, repeats = top[0]
+            failures.append(f"{method} {route}: statement repeated {repeats} times (repeat_limit {repeat_limit}): {shape}")
+    if failures:
+        raise AssertionError("Query budget exceeded:\n  " + "\n  ".join(failures))
+
+
+# Проверка бюджета этого воркера (вызывается из MetricsMiddleware)
+query_budget = QueryBudget(settings.QUERY_BUDGET, settings.QUERY_REPEAT_THRESHOLD, settings.QUERY_WARNING_INTERVAL)
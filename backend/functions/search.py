@@ -0,0 +1,144 @@
+"""Полнотекстовый поиск по новостям, заболеваниям и документам (Postgres FTS)
+
+Поиск идёт по генерируемым tsvector-колонкам search_<lang> (см. database/models.py)
+через GIN-индексы. Сначала одним UNION ALL ранжируются совпадения всех типов и
+выбирается страница, затем ts_headline считается только для строк этой страницы —
+это самая дорогая часть запроса.
+
+Тексты (content_* и др.) хранятся как HTML: перед ts_headline теги вырезаются, а
+готовый фрагмент экранируется целиком, кроме разметки совпадений <mark>, — его
+можно вставлять в страницу как HTML.
+"""
+import html
+from typing import Iterable, List, Optional
+
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import News, Disease, DiseaseDocument
+from database.models import Language, SEARCH_CONFIGS
+
+SEARCH_TYPES = ("news", "disease", "document")
+
+# Маркеры совпадений (символы из Private Use Area): после экранирования фрагмента
+# заменяются на <mark>...</mark>. MaxFragments > 0 — несколько коротких фрагментов
+START_SEL, STOP_SEL = "\ue000", "\ue001"
+HEADLINE_OPTIONS = (
+    f"StartSel={START_SEL}, StopSel={STOP_SEL}, MaxWords=35, MinWords=15, "
+    "MaxFragments=2, FragmentDelimiter=\" … \""
+)
+HTML_TAG = "<[^>]+>"
+
+
+def strip_tags(text):
+    """SQL-выражение: текст без HTML-тегов (теги заменяются пробелом)"""
+    return func.regexp_replace(text, HTML_TAG, " ", "g")
+
+
+def render_snippet(headline: Optional[str]) -> Optional[str]:
+    """Фрагмент ts_headline -> безопасный HTML: всё экранировано, совпадения в <mark>"""
+    if headline is None:
+        return None
+    escaped = html.escape(html.unescape(headline), quote=False)
+    return escaped.replace(START_SEL, "<mark>").replace(STOP_SEL, "</mark>")
+
+
+def _sources(lang: str):
+    """Для каждого типа: модель, фильтр публичности, заголовок и текст для фрагментов"""
+    return {
+        "news": (
+            News, News.is_published == True,
+            getattr(News, f"title_{lang}"),
+            func.concat_ws(" ", getattr(News, f"excerpt_{lang}"), getattr(News, f"content_{lang}")),
+        ),
+        "disease": (
+            Disease, Disease.is_active == True,
+            getattr(Disease, f"name_{lang}"),
+            func.concat_ws(
+                " ", getattr(Disease, f"description_{lang}"),
+                getattr(Disease, f"symptoms_{lang}"), getattr(Disease, f"treatment_{lang}"),
+            ),
+        ),
+        "document": (
+            DiseaseDocument, DiseaseDocument.is_active == True,
+            getattr(DiseaseDocument, f"title_{lang}"),
+            getattr(DiseaseDocument, f"description_{lang}"),
+        ),
+    }
+
+
+async def search_content(
+    db: AsyncSession,
+    q: str,
+    lang: Language = Language.RU,
+    types: Optional[Iterable[str]] = None,
+    skip: int = 0,
+    limit: int = 20
+) -> dict:
+    """Ранжированные совпадения с подсвеченными фрагментами: {"total": int, "items": [...]}"""
+    lang = Language(lang).value
+    config = SEARCH_CONFIGS[lang]
+    tsquery = func.websearch_to_tsquery(config, q)
+    sources = _sources(lang)
+    types = [t for t in SEARCH_TYPES if types is None or t in types]
+
+    ranked = []
+    for search_type in types:
+        model, is_public, _, _ = sources[search_type]
+        vector = getattr(model, f"search_{lang}")
+        ranked.append(
+            select(
+                literal(search_type).label("type"),
+                model.id.label("id"),
+                func.ts_rank_cd(vector, tsquery).label("rank"),
+            ).where(is_public, vector.op("@@")(tsquery))
+        )
+    if not ranked:
+        return {"total": 0, "items": []}
+
+    hits = union_all(*ranked).subquery()
+    page = (
+        select(hits.c.type, hits.c.id, hits.c.rank, func.count().over().label("total"))
+        .order_by(hits.c.rank.desc(), hits.c.type, hits.c.id.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    rows = (await db.execute(page)).all()
+    if not rows:
+        # Страница за концом выдачи: общее число всё равно нужно клиенту
+        total = 0
+        if skip:
+            total = (await db.execute(select(func.count()).select_from(hits))).scalar()
+        return {"total": total, "items": []}
+
+    # Заголовки и фрагменты — только для строк страницы
+    details = {}
+    for search_type in {row.type for row in rows}:
+        model, _, title, text = sources[search_type]
+        ids = [row.id for row in rows if row.type == search_type]
+        result = await db.execute(
+            select(
+                model.id,
+                title.label("title"),
+                # Нет текста (документ без описания) — фрагмент из заголовка
+                func.ts_headline(
+                    config, strip_tags(func.coalesce(func.nullif(text, ""), title)), tsquery, HEADLINE_OPTIONS
+                ).label("snippet"),
+            ).where(model.id.in_(ids))
+        )
+        for row in result:
+            details[(search_type, row.id)] = row
+
+    items: List[dict] = []
+    for row in rows:
+        detail = details.get((row.type, row.id))
+        if detail is None:
+            continue
+        items.append({
+            "type": row.type,
+            "id": row.id,
+            "title": detail.title,
+            "snippet": render_snippet(detail.snippet),
+            "rank": row.rank,
+        })
+    return {"total": rows[0].total, "items": items}
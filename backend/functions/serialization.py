@@ -0,0 +1,31 @@
+"""Быстрая сериализация ответов с публичным контентом
+
+Приложение по умолчанию отвечает через ORJSONResponse (main.py), но перед этим
+FastAPI всё равно валидирует результат эндпоинта по response_model и прогоняет
+его через jsonable_encoder. Для контента это лишняя работа: Projection выбирает
+из базы ровно колонки схемы ответа, и строки уже имеют нужную форму. Такие
+эндпоинты возвращают trusted_response() — словари строк сразу сериализуются
+orjson, а response_model остаётся для документации OpenAPI.
+"""
+from typing import Any, Optional
+
+import orjson
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+
+
+class ContentJSONResponse(ORJSONResponse):
+    """ORJSONResponse с датами в UTC вида ...Z — как их сериализует pydantic"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+
+
+def trusted_response(content: Any, response: Optional[Response] = None) -> ContentJSONResponse:
+    """JSON-ответ без валидации по response_model.
+
+    Заголовки, выставленные зависимостями (ETag из etag_guard), FastAPI к готовому
+    Response не добавляет — они переносятся из response явно.
+    """
+    headers = dict(response.headers) if response is not None else None
+    return ContentJSONResponse(content, headers=headers)
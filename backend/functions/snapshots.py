@@ -0,0 +1,255 @@
+"""Статические JSON-снимки публичного контента для раздачи через nginx
+
+Ответы публичных GET-эндпоинтов без параметров запроса (/api/content/partners,
+/api/content/home, /api/content/news/15 ...) сохраняются в файлы
+SNAPSHOT_DIR + путь + ".json" рядом с .gz/.br-вариантами. nginx отдаёт их через
+try_files, а при отсутствии файла (или при наличии query string) проксирует
+запрос в API. После каждого COMMIT с publish_invalidation() воркер, сделавший
+запись, перестраивает затронутые снимки; ответ формируется тем же приложением
+(внутренний ASGI-вызов), поэтому совпадает с ответом API байт в байт.
+Снимаются только URL, которые фронтенд запрашивает без параметров: списки новостей
+(/news, /news/feed ...) всегда идут с limit/summary и мимо снимков.
+
+Снимки отдельных записей (/news/{id}) перестраиваются только для строк, переданных
+в publish_invalidation(ids=...): правка одной новости не перерисовывает все.
+Полный проход по всем записям — build_snapshots.py, один раз на деплой (deploy.sh).
+"""
+import asyncio
+import gzip
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable, Collection, Dict, Iterable, List, Optional, Set, Tuple
+
+import brotli
+from sqlalchemy import select
+
+from config import settings
+from database import async_session, News, Disease
+from functions.asgi import asgi_request
+from functions.cache import cache_bypass
+
+logger = logging.getLogger(__name__)
+
+CONTENT_PREFIX = "/api/content"
+
+
+# Изменения по таблицам: множество id затронутых строк или None — любые строки
+Changes = Dict[str, Optional[Set[int]]]
+
+
+def merge_changes(changes: Changes, table: str, ids: Optional[Iterable[int]] = None) -> None:
+    if ids is None or (table in changes and changes[table] is None):
+        changes[table] = None
+    else:
+        changes.setdefault(table, set()).update(ids)
+
+
+async def _published_news_ids(db, only: Optional[Collection[int]] = None) -> List[int]:
+    query = select(News.id).where(News.is_published == True)
+    if only is not None:
+        query = query.where(News.id.in_(only))
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
+async def _active_disease_ids(db, only: Optional[Collection[int]] = None) -> List[int]:
+    query = select(Disease.id).where(Disease.is_active == True)
+    if only is not None:
+        query = query.where(Disease.id.in_(only))
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Снимок эндпоинта: путь (или шаблон с {id}) и таблицы, от которых он зависит.
+    ids(db, only) — id записей, для которых снимок публикуется (only — только из этих)"""
+    path: str
+    tables: Tuple[str, ...]
+    ids: Optional[Callable[..., Awaitable[List[int]]]] = None
+
+    @property
+    def directory(self) -> str:
+        """Для шаблона /news/{id} — путь каталога /news"""
+        return self.path.rsplit("/", 1)[0]
+
+
+SNAPSHOTS = [
+    Snapshot(f"{CONTENT_PREFIX}/home", ("board_members", "partners", "charters", "news")),
+    Snapshot(f"{CONTENT_PREFIX}/board-members", ("board_members",)),
+    Snapshot(f"{CONTENT_PREFIX}/partners", ("partners",)),
+    Snapshot(f"{CONTENT_PREFIX}/charter", ("charters",)),
+    Snapshot(f"{CONTENT_PREFIX}/chief-rheumatologists", ("chief_rheumatologists",)),
+    Snapshot(f"{CONTENT_PREFIX}/centers", ("rheumatology_centers",)),
+    Snapshot(f"{CONTENT_PREFIX}/centers/with-staff", ("rheumatology_centers", "center_staff")),
+    Snapshot(f"{CONTENT_PREFIX}/diseases", ("diseases",)),
+    Snapshot(f"{CONTENT_PREFIX}/diseases/{{id}}", ("diseases",), _active_disease_ids),
+    Snapshot(f"{CONTENT_PREFIX}/news/{{id}}", ("news",), _published_news_ids),
+]
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Записать файл через временный файл + rename: nginx никогда не увидит его наполовину"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_snapshot_files(path: str, body: bytes) -> None:
+    """JSON и его сжатые варианты (gzip_static / brotli_static в nginx)"""
+    # Сначала сжатые: клиент может получить старый .json, но не новый .json со старым .gz
+    write_atomic(path + ".gz", gzip.compress(body, compresslevel=9, mtime=0))
+    write_atomic(path + ".br", brotli.compress(body, quality=11))
+    write_atomic(path, body)
+
+
+def remove_snapshot_files(path: str) -> None:
+    for suffix in ("", ".gz", ".br"):
+        try:
+            os.unlink(path + suffix)
+        except FileNotFoundError:
+            pass
+
+
+class SnapshotPublisher:
+    """Перестраивает снимки после записей этого воркера (по одной задаче за раз)"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.app = None
+        self.written = 0
+        self.failed = 0
+        self.last_built_at: Optional[datetime] = None
+        self._pending: Changes = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.directory) and self.app is not None
+
+    def attach(self, app) -> None:
+        """Подключить ASGI-приложение, чьи ответы сохраняются в снимки"""
+        self.app = app
+
+    def file_path(self, url_path: str) -> str:
+        return os.path.join(self.directory, url_path.lstrip("/") + ".json")
+
+    def schedule(self, changes: Changes) -> None:
+        """Запланировать перестройку снимков, зависящих от изменённых таблиц (из after_commit)"""
+        if not self.enabled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        for table, ids in changes.items():
+            merge_changes(self._pending, table, ids)
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._drain())
+
+    async def wait(self) -> None:
+        """Дождаться запланированной перестройки (при остановке приложения)"""
+        if self._task is not None:
+            await self._task
+
+    async def _drain(self) -> None:
+        # Записи, пришедшие во время перестройки, копятся в _pending и обрабатываются следующим проходом
+        while self._pending:
+            changes, self._pending = self._pending, {}
+            await self.rebuild(changes)
+
+    async def rebuild(self, changes: Optional[Changes] = None) -> int:
+        """Перестроить снимки, зависящие от изменений (None — все); возвращает число файлов"""
+        count = 0
+        for snapshot in SNAPSHOTS:
+            only = None
+            if changes is not None:
+                touched = [changes[table] for table in snapshot.tables if table in changes]
+                if not touched:
+                    continue
+                if all(ids is not None for ids in touched):
+                    only = set().union(*touched)
+            try:
+                count += await self._build(snapshot, only)
+            except Exception:
+                logger.exception("Snapshot %s rebuild failed", snapshot.path)
+        self.last_built_at = datetime.now()
+        return count
+
+    async def _build(self, snapshot: Snapshot, only: Optional[Set[int]] = None) -> int:
+        """only — перестроить снимки только этих записей (None — всех)"""
+        if snapshot.ids is None:
+            return int(await self._publish(snapshot.path))
+
+        async with async_session() as db:
+            ids = await snapshot.ids(db, only)
+        paths = {snapshot.path.format(id=item_id) for item_id in ids}
+        count = 0
+        for path in paths:
+            count += await self._publish(path)
+
+        if only is not None:
+            # Удалённые и снятые с публикации среди изменённых
+            for item_id in only.difference(ids):
+                remove_snapshot_files(self.file_path(snapshot.path.format(id=item_id)))
+            return count
+
+        # Удалённые и снятые с публикации записи: отдаём запрос API (он вернёт 404 или актуальные данные)
+        directory = os.path.join(self.directory, snapshot.directory.lstrip("/"))
+        if os.path.isdir(directory):
+            for name in os.listdir(directory):
+                stem, ext = os.path.splitext(name)
+                url_path = f"{snapshot.directory}/{stem}"
+                if ext == ".json" and stem.isdigit() and url_path not in paths:
+                    remove_snapshot_files(self.file_path(url_path))
+        return count
+
+    async def _publish(self, url_path: str) -> bool:
+        path = self.file_path(url_path)
+        try:
+            status, body = await self.render(url_path)
+        except Exception:
+            status, body = None, b""
+            logger.exception("Snapshot %s render failed", url_path)
+        if status != 200:
+            # Устаревший снимок хуже его отсутствия: nginx уйдёт в API
+            self.failed += 1
+            remove_snapshot_files(path)
+            return False
+        await asyncio.to_thread(write_snapshot_files, path, body)
+        self.written += 1
+        return True
+
+    async def render(self, url_path: str) -> Tuple[int, bytes]:
+        """GET-запрос к приложению без сети: тот же код, схемы ответа и сериализация.
+        Кэши не читаются: в них может быть ответ, ещё не сброшенный по NOTIFY другого воркера"""
+        token = cache_bypass.set(True)
+        try:
+            response = await asgi_request(self.app, "GET", url_path)
+        finally:
+            cache_bypass.reset(token)
+        return response.status, response.body
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "directory": self.directory,
+            "written": self.written,
+            "failed": self.failed,
+            "last_built_at": self.last_built_at.isoformat() if self.last_built_at else None,
+        }
+
+
+# Издатель снимков этого воркера (приложение подключается в lifespan)
+snapshot_publisher = SnapshotPublisher(settings.SNAPSHOT_DIR)
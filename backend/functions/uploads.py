@@ -0,0 +1,308 @@
+"""Приём загружаемых файлов: потоково, с лимитом размера, проверкой типа и SHA-256
+
+Starlette сохраняет multipart-файл больше 1 МБ во временный файл на диске, здесь он
+копируется кусками по UPLOAD_CHUNK_SIZE во временный файл в каталоге uploads (запись
+и хеширование — в потоке, не в event loop) и атомарно переименовывается. Память на
+загрузку не зависит от размера файла. Тип определяется по сигнатуре содержимого,
+а не по заголовку клиента; расширение берётся из типа, а не из имени файла.
+
+Файл сохраняется как <sha256><ext> и регистрируется в таблице stored_files:
+повторная загрузка того же содержимого возвращает уже сохранённый файл.
+collect_garbage() удаляет файлы, на которые не ссылается ни одна колонка *_url,
+спустя UPLOAD_GC_GRACE_DAYS после того, как ссылок не стало.
+"""
+import asyncio
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Set
+
+from fastapi import HTTPException, UploadFile, status
+from sqlalchemy import String, delete, func, select, union, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from database import Base, StoredFile
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+UPLOAD_URL_PREFIX = "/uploads/"
+
+# Advisory lock Postgres: загрузки берут его разделяемым, сборщик мусора — эксклюзивным,
+# чтобы файл не удалили между проверкой «уже есть» и фиксацией новой ссылки на него
+UPLOADS_LOCK_ID = 0x75706C64
+
+# MIME-тип -> расширение сохранённого файла
+UPLOAD_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "application/pdf": ".pdf",
+    "application/msword": ".doc",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
+}
+
+
+@dataclass
+class StoredUpload:
+    filename: str
+    size: int
+    sha256: str
+    content_type: str
+
+    @property
+    def url(self) -> str:
+        return f"{UPLOAD_URL_PREFIX}{self.filename}"
+
+
+def sniff_content_type(head: bytes, filename: Optional[str]) -> Optional[str]:
+    """Тип файла по первым байтам. DOC и DOCX — контейнеры OLE/ZIP общего вида,
+    поэтому для них дополнительно требуется соответствующее расширение."""
+    ext = os.path.splitext(filename or "")[1].lower()
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head.startswith(b"%PDF-"):
+        return "application/pdf"
+    if head.startswith(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1") and ext == ".doc":
+        return "application/msword"
+    if head.startswith(b"PK\x03\x04") and ext == ".docx":
+        return "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    return None
+
+
+def _write_chunk(f, hasher, chunk: bytes) -> None:
+    f.write(chunk)
+    hasher.update(chunk)
+
+
+def _discard(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _place(tmp_path: str, path: str) -> None:
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+
+
+def _hash_file(path: str) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(UPLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+async def receive_upload(file: UploadFile, directory: str) -> tuple[str, StoredUpload]:
+    """Скопировать загрузку во временный файл в directory.
+
+    Возвращает путь временного файла и описание с именем <sha256><ext>; вызывающий
+    переименовывает файл (или удаляет его) сам. Ошибки: 413 — больше UPLOAD_MAX_SIZE, 415 — тип не разрешён.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".upload-")
+    hasher = hashlib.sha256()
+    size = 0
+    content_type = None
+    try:
+        with os.fdopen(fd, "wb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                if content_type is None:
+                    content_type = sniff_content_type(chunk, file.filename)
+                    if content_type not in settings.UPLOAD_ALLOWED_TYPES:
+                        raise HTTPException(
+                            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                            detail="File type is not allowed"
+                        )
+                size += len(chunk)
+                if size > settings.UPLOAD_MAX_SIZE:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"File is larger than {settings.UPLOAD_MAX_SIZE // (1024 * 1024)} MB"
+                    )
+                await asyncio.to_thread(_write_chunk, f, hasher, chunk)
+        if content_type is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Empty file")
+    except BaseException:
+        await asyncio.to_thread(_discard, tmp_path)
+        raise
+
+    digest = hasher.hexdigest()
+    return tmp_path, StoredUpload(
+        filename=f"{digest}{UPLOAD_EXTENSIONS[content_type]}",
+        size=size,
+        sha256=digest,
+        content_type=content_type,
+    )
+
+
+async def save_upload(db: AsyncSession, file: UploadFile, directory: str) -> StoredUpload:
+    """Принять загрузку и сохранить её в directory; одинаковое содержимое хранится один раз"""
+    tmp_path, stored = await receive_upload(file, directory)
+    try:
+        await db.execute(select(func.pg_advisory_xact_lock_shared(UPLOADS_LOCK_ID)))
+        existing = (await db.execute(
+            select(StoredFile).where(StoredFile.sha256 == stored.sha256).order_by(StoredFile.id).limit(1)
+        )).scalar_one_or_none()
+        if existing is not None and os.path.exists(os.path.join(directory, existing.filename)):
+            # Уже есть (в том числе файл, загруженный до хранения по хешу под другим именем)
+            stored.filename = existing.filename
+            existing.uploaded_at = func.now()
+            existing.orphaned_at = None
+            await asyncio.to_thread(_discard, tmp_path)
+        else:
+            await asyncio.to_thread(_place, tmp_path, os.path.join(directory, stored.filename))
+            statement = insert(StoredFile).values(
+                filename=stored.filename, sha256=stored.sha256,
+                size=stored.size, content_type=stored.content_type,
+            )
+            await db.execute(statement.on_conflict_do_update(
+                index_elements=[StoredFile.filename],
+                set_={"uploaded_at": func.now(), "orphaned_at": None},
+            ))
+        await db.commit()
+    except BaseException:
+        await asyncio.to_thread(_discard, tmp_path)
+        raise
+    return stored
+
+
+# ==================== СБОРКА МУСОРА ====================
+def upload_url_columns():
+    """Все строковые колонки *_url всех моделей"""
+    return [
+        column
+        for table in Base.metadata.sorted_tables
+        for column in table.columns
+        if column.name.endswith("_url") and isinstance(column.type, String)
+    ]
+
+
+async def referenced_uploads(db: AsyncSession) -> Set[str]:
+    """Имена файлов uploads, на которые ссылается хотя бы одна колонка *_url"""
+    pattern = f"%{UPLOAD_URL_PREFIX}%"
+    query = union(*(
+        select(column.label("url")).where(column.like(pattern))
+        for column in upload_url_columns()
+    ))
+    urls = (await db.execute(query)).scalars().all()
+    # Ссылка может быть и абсолютной (https://.../uploads/x.jpg), и с параметрами
+    return {url.rsplit(UPLOAD_URL_PREFIX, 1)[1].split("?", 1)[0].split("#", 1)[0] for url in urls}
+
+
+def _scan(directory: str) -> dict:
+    """Файлы каталога: имя -> (размер, mtime); временные файлы загрузок отдельно"""
+    files, temporary = {}, {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            stat = entry.stat(follow_symlinks=False)
+            if entry.name.startswith(".upload-"):
+                temporary[entry.name] = stat.st_mtime
+            elif not entry.name.startswith("."):
+                files[entry.name] = (stat.st_size, stat.st_mtime)
+    return {"files": files, "temporary": temporary}
+
+
+async def collect_garbage(
+    db: AsyncSession,
+    directory: str,
+    grace: Optional[timedelta] = None,
+    dry_run: bool = False
+) -> dict:
+    """Удалить файлы без ссылок, пролежавшие без них дольше grace
+
+    Проход: регистрирует в stored_files файлы без записи (загруженные до хранения
+    по хешу), отмечает orphaned_at у файлов, на которые перестали ссылаться, и
+    снимает отметку с файлов, на которые снова ссылаются. Удаляется файл, который
+    и загружен, и остался без ссылок раньше чем grace назад — поэтому файл,
+    только что загруженный в форму, но ещё не сохранённый, не пропадёт.
+    Запускается периодически (collect_uploads.py из cron).
+    """
+    grace = timedelta(days=settings.UPLOAD_GC_GRACE_DAYS) if grace is None else grace
+    now = datetime.now(timezone.utc)
+    cutoff = now - grace
+
+    await db.execute(select(func.pg_advisory_xact_lock(UPLOADS_LOCK_ID)))
+    referenced = await referenced_uploads(db)
+    scan = await asyncio.to_thread(_scan, directory)
+    files = scan["files"]
+
+    # Незавершённые загрузки (процесс упал посреди копирования)
+    stale_temporary = [
+        name for name, mtime in scan["temporary"].items()
+        if datetime.fromtimestamp(mtime, timezone.utc) < cutoff
+    ]
+
+    known = set((await db.execute(select(StoredFile.filename))).scalars().all())
+    registered = 0
+    for name in sorted(set(files) - known):
+        size, mtime = files[name]
+        digest = await asyncio.to_thread(_hash_file, os.path.join(directory, name))
+        db.add(StoredFile(
+            filename=name, sha256=digest, size=size,
+            uploaded_at=datetime.fromtimestamp(mtime, timezone.utc),
+        ))
+        registered += 1
+    await db.flush()
+
+    # Записи без файла на диске (удалён вручную) не нужны
+    missing = known - set(files)
+    if missing:
+        await db.execute(delete(StoredFile).where(StoredFile.filename.in_(missing)))
+
+    await db.execute(
+        update(StoredFile)
+        .where(StoredFile.filename.in_(referenced), StoredFile.orphaned_at.isnot(None))
+        .values(orphaned_at=None)
+    )
+    await db.execute(
+        update(StoredFile)
+        .where(StoredFile.filename.not_in(referenced), StoredFile.orphaned_at.is_(None))
+        .values(orphaned_at=now)
+    )
+    orphaned = (await db.execute(
+        select(func.count()).select_from(StoredFile).where(StoredFile.orphaned_at.isnot(None))
+    )).scalar()
+
+    expired = (
+        StoredFile.filename.not_in(referenced),
+        StoredFile.orphaned_at < cutoff,
+        StoredFile.uploaded_at < cutoff,
+    )
+    if dry_run:
+        result = await db.execute(select(StoredFile.filename, StoredFile.size).where(*expired))
+    else:
+        result = await db.execute(delete(StoredFile).where(*expired).returning(StoredFile.filename, StoredFile.size))
+    deleted = result.all()
+
+    if dry_run:
+        await db.rollback()
+    else:
+        # Файлы удаляются под блокировкой: параллельная загрузка того же содержимого ждёт
+        for name in [row.filename for row in deleted] + stale_temporary:
+            await asyncio.to_thread(_discard, os.path.join(directory, name))
+        await db.commit()
+
+    return {
+        "files": len(files),
+        "referenced": len(referenced),
+        "registered": registered,
+        "missing": len(missing),
+        "orphaned": orphaned - len(deleted),
+        "deleted": len(deleted),
+        "freed_bytes": sum(row.size for row in deleted),
+        "stale_temporary": len(stale_temporary),
+        "dry_run": dry_run,
+    }
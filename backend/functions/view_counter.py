@@ -0,0 +1,144 @@
+"""Буферизованный счётчик просмотров новостей
+
+Просмотр только увеличивает счётчик в памяти воркера (без обращения к БД).
+Раз в VIEW_COUNTER_FLUSH_INTERVAL секунд и при остановке приложения накопленные
+приращения записываются через UPDATE ... FROM (VALUES ...) пачками по FLUSH_CHUNK
+строк (у asyncpg не больше 32767 параметров на запрос). Пишется именно приращение
+(views_count + delta), поэтому сбросы разных воркеров складываются, а не
+перезаписывают друг друга.
+
+Кэш и снимки сбросом не инвалидируются: актуальное число просмотров отдаёт
+POST /news/{id}/view (views_count в БД плюс ещё не записанные просмотры воркера).
+
+Буфер ограничен VIEW_COUNTER_MAX_PENDING разными новостями, а пачка, которую
+не удалось записать VIEW_COUNTER_MAX_ATTEMPTS раз подряд, выбрасывается —
+одна ошибочная строка не копится в буфере вечно.
+"""
+import asyncio
+import logging
+from collections import Counter
+from contextlib import suppress
+from typing import Dict, Optional
+
+from sqlalchemy import Integer, column, func, update, values
+
+from config import settings
+from database import async_session, News
+
+logger = logging.getLogger(__name__)
+
+# Строк VALUES в одном UPDATE: по два параметра на строку
+FLUSH_CHUNK = 5000
+
+
+class ViewCounter:
+    def __init__(self, flush_interval: float, max_pending: int, max_attempts: int):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self.flushed = 0
+        self.failures = 0
+        self.dropped = 0
+        self._counts: Counter = Counter()
+        self._attempts: Dict[int, int] = {}  # Неудачные попытки записи по id новости
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    def hit(self, news_id: int) -> None:
+        if news_id not in self._counts and len(self._counts) >= self.max_pending:
+            self.dropped += 1
+            return
+        self._counts[news_id] += 1
+
+    def pending(self, news_id: int) -> int:
+        """Просмотры новости, ещё не записанные этим воркером"""
+        return self._counts.get(news_id, 0)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить периодический сброс и записать остаток"""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Записать накопленные приращения; неудачные пачки вернутся в буфер"""
+        async with self._lock:
+            if not self._counts:
+                return 0
+            counts, self._counts = self._counts, Counter()
+            # Одинаковый порядок строк у всех воркеров снижает риск взаимной блокировки
+            items = sorted(counts.items())
+            written = 0
+            for start in range(0, len(items), FLUSH_CHUNK):
+                chunk = items[start:start + FLUSH_CHUNK]
+                try:
+                    await self._write(chunk)
+                except Exception as e:
+                    self.failures += 1
+                    self._requeue(chunk, e)
+                    continue
+                for news_id, _ in chunk:
+                    self._attempts.pop(news_id, None)
+                self.flushed += sum(delta for _, delta in chunk)
+                written += len(chunk)
+            return written
+
+    async def _write(self, chunk: list) -> None:
+        deltas = values(column("id", Integer), column("delta", Integer), name="deltas").data(chunk)
+        async with async_session() as db:
+            await db.execute(
+                update(News)
+                .where(News.id == deltas.c.id)
+                # updated_at явно: иначе onupdate=now() отметит новость как отредактированную
+                .values(
+                    views_count=func.coalesce(News.views_count, 0) + deltas.c.delta,
+                    updated_at=News.updated_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+    def _requeue(self, chunk: list, error: Exception) -> None:
+        kept = lost = 0
+        for news_id, delta in chunk:
+            attempts = self._attempts.get(news_id, 0) + 1
+            if attempts >= self.max_attempts:
+                self._attempts.pop(news_id, None)
+                lost += delta
+            else:
+                self._attempts[news_id] = attempts
+                self._counts[news_id] += delta
+                kept += 1
+        self.dropped += lost
+        if lost:
+            logger.error("View counter flush failed %d times, %d views dropped: %s", self.max_attempts, lost, error)
+        else:
+            logger.warning("View counter flush failed, %d news kept in buffer: %s", kept, error)
+
+    def stats(self) -> dict:
+        return {
+            "pending": sum(self._counts.values()),
+            "pending_news": len(self._counts),
+            "flushed": self.flushed,
+            "failures": self.failures,
+            "dropped": self.dropped,
+            "flush_interval": self.flush_interval,
+        }
+
+
+# Счётчик этого воркера (периодический сброс запускается в lifespan)
+view_counter = ViewCounter(
+    settings.VIEW_COUNTER_FLUSH_INTERVAL, settings.VIEW_COUNTER_MAX_PENDING, settings.VIEW_COUNTER_MAX_ATTEMPTS
+)
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
@@ -7,6 +8,13 @@ import os
 from database.connection import engine, Base
 from database.models import *  # Импортируем все модели для создания таблиц
 from api import api_router
+from api.images import router as images_router
+from api.internal import router as internal_router
+from functions.images import image_cache
+from functions.invalidation import invalidation_listener
+from functions.metrics import MetricsMiddleware, request_metrics
+from functions.snapshots import snapshot_publisher
+from functions.view_counter import view_counter
 
 # Создаём папку uploads если её нет
 UPLOAD_DIR = "uploads"
@@ -18,8 +26,21 @@ async def lifespan(app: FastAPI):
     # Startup: Create tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    # Слушаем инвалидации кэша от других воркеров
+    if engine.dialect.name == "postgresql":
+        invalidation_listener.start()
+    # Снимки для nginx: воркер перестраивает их после своих записей. Полная перестройка —
+    # один раз на деплой (build_snapshots.py в deploy.sh), а не в каждом воркере
+    snapshot_publisher.attach(app)
+    view_counter.start()
+    request_metrics.start()
     yield
     # Shutdown
+    await request_metrics.stop()
+    await view_counter.stop()  # Записываем накопленные просмотры
+    await snapshot_publisher.wait()
+    await invalidation_listener.stop()
+    image_cache.shutdown()
     await engine.dispose()
 
 
@@ -27,7 +48,8 @@ app = FastAPI(
     title="Rheumatology Association of Uzbekistan API",
     description="API for the Rheumatology Association of Uzbekistan website",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS configuration
@@ -39,12 +61,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Метрики запросов по маршрутам (внешний слой: время включает остальные middleware)
+app.add_middleware(MetricsMiddleware)
+
 # Статические файлы (uploads)
 app.mount("/uploads", StaticFiles(directory=UPLOAD_DIR), name="uploads")
 
+# Уменьшенные копии изображений из uploads
+app.include_router(images_router, prefix="/img", tags=["Images"])
+
 # Include API routes
 app.include_router(api_router, prefix="/api")
 
+# Служебные эндпоинты: вне /api, поэтому наружу через nginx не публикуются
+app.include_router(internal_router, prefix="/internal", tags=["Internal"])
+
 
 @app.get("/")
 async def root():
@@ -0,0 +1,80 @@
+"""
+Проверка: горячие запросы списков используют индексы из alembic/versions/0001_listing_indexes.py
+
+Запуск из папки backend (после alembic upgrade head):
+    python -m migrations.explain_indexes
+
+На маленьких таблицах планировщик честно выбирает Seq Scan, поэтому внутри
+транзакции выставляется enable_seqscan = off — так проверяется, что подходящий
+индекс существует и применим к запросу. Код выхода 1, если хоть один не найден.
+"""
+import asyncio
+import json
+import sys
+from sqlalchemy import select, desc, text
+from sqlalchemy.dialects import postgresql
+
+from database.connection import engine
+from database.models import (
+    BoardMember, Partner, ChiefRheumatologist, Disease, RheumatologyCenter, CenterStaff,
+    News, SchoolApplication, CongressRegistration,
+)
+
+
+def _active_ordered(model):
+    return select(model).where(model.is_active == True).order_by(model.order)
+
+
+# (ожидаемый индекс, запрос)
+CHECKS = [
+    ("ix_board_members_active_order", _active_ordered(BoardMember)),
+    ("ix_partners_active_order", _active_ordered(Partner)),
+    ("ix_chief_rheumatologists_active_order", _active_ordered(ChiefRheumatologist)),
+    ("ix_diseases_active_order", _active_ordered(Disease)),
+    ("ix_rheumatology_centers_active_order", _active_ordered(RheumatologyCenter)),
+    ("ix_center_staff_center_active_order",
+     _active_ordered(CenterStaff).where(CenterStaff.center_id == 1)),
+    ("ix_news_published_feed",
+     select(News).where(News.is_published == True)
+     .order_by(desc(News.created_at), desc(News.id)).limit(10)),
+    ("ix_news_feed",
+     select(News).where(News.is_published == True, News.news_type == "event")
+     .order_by(desc(News.created_at), desc(News.id)).limit(10)),
+    ("ix_school_applications_status_type_created",
+     select(SchoolApplication)
+     .where(SchoolApplication.status == "pending", SchoolApplication.school_type == "school")
+     .order_by(SchoolApplication.created_at)),
+    ("ix_congress_registrations_congress_created",
+     select(CongressRegistration).where(CongressRegistration.congress_id == 1)
+     .order_by(CongressRegistration.created_at)),
+]
+
+
+def _index_names(plan: dict) -> set:
+    """Все "Index Name" из узлов плана (рекурсивно)"""
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= _index_names(child)
+    return names
+
+
+async def run_check() -> bool:
+    ok = True
+    async with engine.begin() as conn:
+        await conn.execute(text("SET LOCAL enable_seqscan = off"))
+        for index_name, query in CHECKS:
+            sql = str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+            raw = (await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))).scalar()
+            plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+            used = _index_names(plan)
+            if index_name in used:
+                print(f"OK    {index_name}")
+            else:
+                ok = False
+                print(f"FAIL  {index_name}: план использует {sorted(used) or plan['Node Type']}")
+    await engine.dispose()
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(run_check()) else 1)
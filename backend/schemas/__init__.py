@@ -1,44 +1,54 @@
 from .user import UserCreate, UserResponse, UserLogin, Token, TokenData
 from .content import (
     # News
-    NewsCreate, NewsUpdate, NewsResponse,
+    NewsCreate, NewsUpdate, NewsResponse, NewsLocalizedResponse,
+    NewsSummaryResponse, NewsSummaryLocalizedResponse, NewsFeedResponse,
     # Board Members
-    BoardMemberCreate, BoardMemberUpdate, BoardMemberResponse,
+    BoardMemberCreate, BoardMemberUpdate, BoardMemberResponse, BoardMemberLocalizedResponse,
     # Partners
-    PartnerCreate, PartnerUpdate, PartnerResponse,
+    PartnerCreate, PartnerUpdate, PartnerResponse, PartnerLocalizedResponse,
     # Charter
-    CharterCreate, CharterUpdate, CharterResponse,
+    CharterCreate, CharterUpdate, CharterResponse, CharterLocalizedResponse,
     # Chief Rheumatologists
-    ChiefRheumatologistCreate, ChiefRheumatologistUpdate, ChiefRheumatologistResponse,
+    ChiefRheumatologistCreate, ChiefRheumatologistUpdate, ChiefRheumatologistResponse, ChiefRheumatologistLocalizedResponse,
     # Diseases
-    DiseaseCreate, DiseaseUpdate, DiseaseResponse,
+    DiseaseCreate, DiseaseUpdate, DiseaseResponse, DiseaseLocalizedResponse,
     # Disease Documents
-    DiseaseDocumentCreate, DiseaseDocumentUpdate, DiseaseDocumentResponse,
+    DiseaseDocumentCreate, DiseaseDocumentUpdate, DiseaseDocumentResponse, DiseaseDocumentLocalizedResponse,
     # Rheumatology Centers
-    RheumatologyCenterCreate, RheumatologyCenterUpdate, RheumatologyCenterResponse, RheumatologyCenterWithStaffResponse,
+    RheumatologyCenterCreate, RheumatologyCenterUpdate, RheumatologyCenterResponse, RheumatologyCenterWithStaffResponse, RheumatologyCenterLocalizedResponse, RheumatologyCenterWithStaffLocalizedResponse,
     # Center Staff
-    CenterStaffCreate, CenterStaffUpdate, CenterStaffResponse,
+    CenterStaffCreate, CenterStaffUpdate, CenterStaffResponse, CenterStaffLocalizedResponse,
+    # Home page
+    HomeResponse, HomeLocalizedResponse,
+    # Search
+    SearchHit, SearchResponse,
 )
 
 __all__ = [
     # User
     "UserCreate", "UserResponse", "UserLogin", "Token", "TokenData",
     # News
-    "NewsCreate", "NewsUpdate", "NewsResponse",
+    "NewsCreate", "NewsUpdate", "NewsResponse", "NewsLocalizedResponse",
+    "NewsSummaryResponse", "NewsSummaryLocalizedResponse", "NewsFeedResponse",
     # Board Members
-    "BoardMemberCreate", "BoardMemberUpdate", "BoardMemberResponse",
+    "BoardMemberCreate", "BoardMemberUpdate", "BoardMemberResponse", "BoardMemberLocalizedResponse",
     # Partners
-    "PartnerCreate", "PartnerUpdate", "PartnerResponse",
+    "PartnerCreate", "PartnerUpdate", "PartnerResponse", "PartnerLocalizedResponse",
     # Charter
-    "CharterCreate", "CharterUpdate", "CharterResponse",
+    "CharterCreate", "CharterUpdate", "CharterResponse", "CharterLocalizedResponse",
     # Chief Rheumatologists
-    "ChiefRheumatologistCreate", "ChiefRheumatologistUpdate", "ChiefRheumatologistResponse",
+    "ChiefRheumatologistCreate", "ChiefRheumatologistUpdate", "ChiefRheumatologistResponse", "ChiefRheumatologistLocalizedResponse",
     # Diseases
-    "DiseaseCreate", "DiseaseUpdate", "DiseaseResponse",
+    "DiseaseCreate", "DiseaseUpdate", "DiseaseResponse", "DiseaseLocalizedResponse",
     # Disease Documents
-    "DiseaseDocumentCreate", "DiseaseDocumentUpdate", "DiseaseDocumentResponse",
+    "DiseaseDocumentCreate", "DiseaseDocumentUpdate", "DiseaseDocumentResponse", "DiseaseDocumentLocalizedResponse",
     # Rheumatology Centers
-    "RheumatologyCenterCreate", "RheumatologyCenterUpdate", "RheumatologyCenterResponse", "RheumatologyCenterWithStaffResponse",
+    "RheumatologyCenterCreate", "RheumatologyCenterUpdate", "RheumatologyCenterResponse", "RheumatologyCenterWithStaffResponse", "RheumatologyCenterLocalizedResponse", "RheumatologyCenterWithStaffLocalizedResponse",
     # Center Staff
-    "CenterStaffCreate", "CenterStaffUpdate", "CenterStaffResponse",
+    "CenterStaffCreate", "CenterStaffUpdate", "CenterStaffResponse", "CenterStaffLocalizedResponse",
+    # Home page
+    "HomeResponse", "HomeLocalizedResponse",
+    # Search
+    "SearchHit", "SearchResponse",
 ]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional, Union
 from datetime import datetime
 
 
@@ -80,6 +80,25 @@ class BoardMemberResponse(BoardMemberBase):
         from_attributes = True
 
 
+class BoardMemberLocalizedResponse(BaseModel):
+    """Член правления на одном языке (?lang=...)"""
+    id: int
+    last_name: Optional[str] = None
+    first_name: Optional[str] = None
+    patronymic: Optional[str] = None
+    position: Optional[str] = None
+    degree: Optional[str] = None
+    workplace: Optional[str] = None
+    bio: Optional[str] = None
+    achievements: Optional[str] = None
+    photo_url: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    order: int = 0
+    is_active: bool = True
+    created_at: datetime
+
+
 # ==================== МЕЖДУНАРОДНЫЕ ПАРТНЁРЫ ====================
 class PartnerBase(BaseModel):
     name_ru: str
@@ -127,6 +146,19 @@ class PartnerResponse(PartnerBase):
         from_attributes = True
 
 
+class PartnerLocalizedResponse(BaseModel):
+    id: int
+    name: Optional[str] = None
+    short_name: Optional[str] = None
+    description: Optional[str] = None
+    logo_url: Optional[str] = None
+    website_url: Optional[str] = None
+    country: Optional[str] = None
+    order: int = 0
+    is_active: bool = True
+    created_at: datetime
+
+
 # ==================== УСТАВ ====================
 class CharterBase(BaseModel):
     title_ru: str
@@ -164,6 +196,16 @@ class CharterResponse(CharterBase):
         from_attributes = True
 
 
+class CharterLocalizedResponse(BaseModel):
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    file_url: str
+    version: Optional[str] = None
+    is_active: bool = True
+    created_at: datetime
+
+
 # ==================== ГЛАВНЫЕ РЕВМАТОЛОГИ ====================
 class ChiefRheumatologistBase(BaseModel):
     last_name_ru: str
@@ -247,6 +289,25 @@ class ChiefRheumatologistResponse(ChiefRheumatologistBase):
         from_attributes = True
 
 
+class ChiefRheumatologistLocalizedResponse(BaseModel):
+    id: int
+    last_name: Optional[str] = None
+    first_name: Optional[str] = None
+    patronymic: Optional[str] = None
+    position: Optional[str] = None
+    degree: Optional[str] = None
+    region: Optional[str] = None
+    workplace: Optional[str] = None
+    bio: Optional[str] = None
+    achievements: Optional[str] = None
+    photo_url: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    order: int = 0
+    is_active: bool = True
+    created_at: datetime
+
+
 # ==================== ЗАБОЛЕВАНИЯ ====================
 class DiseaseBase(BaseModel):
     name_ru: str
@@ -298,6 +359,19 @@ class DiseaseResponse(DiseaseBase):
         from_attributes = True
 
 
+class DiseaseLocalizedResponse(BaseModel):
+    id: int
+    name: Optional[str] = None
+    short_name: Optional[str] = None
+    description: Optional[str] = None
+    symptoms: Optional[str] = None
+    treatment: Optional[str] = None
+    image_url: Optional[str] = None
+    order: int = 0
+    is_active: bool = True
+    created_at: datetime
+
+
 # ==================== ДОКУМЕНТЫ О ЗАБОЛЕВАНИЯХ ====================
 class DiseaseDocumentBase(BaseModel):
     disease_id: Optional[int] = None
@@ -339,6 +413,18 @@ class DiseaseDocumentResponse(DiseaseDocumentBase):
         from_attributes = True
 
 
+class DiseaseDocumentLocalizedResponse(BaseModel):
+    id: int
+    disease_id: Optional[int] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    file_url: str
+    document_type: Optional[str] = None
+    order: int = 0
+    is_active: bool = True
+    created_at: datetime
+
+
 # ==================== СОТРУДНИКИ ЦЕНТРОВ ====================
 class CenterStaffBase(BaseModel):
     center_id: int
@@ -396,6 +482,20 @@ class CenterStaffResponse(CenterStaffBase):
         from_attributes = True
 
 
+class CenterStaffLocalizedResponse(BaseModel):
+    id: int
+    center_id: int
+    last_name: Optional[str] = None
+    first_name: Optional[str] = None
+    patronymic: Optional[str] = None
+    position: Optional[str] = None
+    credentials: Optional[str] = None
+    photo_url: Optional[str] = None
+    order: int = 0
+    is_active: bool = True
+    created_at: datetime
+
+
 # ==================== РЕВМАТОЛОГИЧЕСКИЕ ЦЕНТРЫ ====================
 class RheumatologyCenterBase(BaseModel):
     name_ru: str
@@ -445,15 +545,33 @@ class RheumatologyCenterResponse(RheumatologyCenterBase):
         from_attributes = True
 
 
+class RheumatologyCenterLocalizedResponse(BaseModel):
+    id: int
+    name: Optional[str] = None
+    description: Optional[str] = None
+    address: Optional[str] = None
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    website: Optional[str] = None
+    image_url: Optional[str] = None
+    order: int = 0
+    is_active: bool = True
+    created_at: datetime
+
+
 class RheumatologyCenterWithStaffResponse(RheumatologyCenterBase):
     id: int
     created_at: datetime
-    staff: list[CenterStaffResponse] = []
+    staff: List[CenterStaffResponse] = []
 
     class Config:
         from_attributes = True
 
 
+class RheumatologyCenterWithStaffLocalizedResponse(RheumatologyCenterLocalizedResponse):
+    staff: List[CenterStaffLocalizedResponse] = []
+
+
 # ==================== НОВОСТИ И СОБЫТИЯ ====================
 class NewsBase(BaseModel):
     news_type: str = "news"  # "news" или "event"
@@ -532,3 +650,117 @@ class NewsResponse(NewsBase):
 
     class Config:
         from_attributes = True
+
+
+class NewsLocalizedResponse(BaseModel):
+    id: int
+    news_type: str = "news"
+    title: Optional[str] = None
+    subtitle: Optional[str] = None
+    content: Optional[str] = None
+    excerpt: Optional[str] = None
+    image_url: Optional[str] = None
+    background_image_url: Optional[str] = None
+    event_date_start: Optional[datetime] = None
+    event_date_end: Optional[datetime] = None
+    event_location: Optional[str] = None
+    registration_url: Optional[str] = None
+    is_published: bool = False
+    is_featured: bool = False
+    author_id: Optional[int] = None
+    views_count: int = 0
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+class NewsSummaryResponse(BaseModel):
+    """Краткая новость для списков: без полного текста (content_*)"""
+    id: int
+    news_type: str = "news"
+    title_ru: str
+    title_uz: str
+    title_en: str
+    subtitle_ru: Optional[str] = None
+    subtitle_uz: Optional[str] = None
+    subtitle_en: Optional[str] = None
+    excerpt_ru: Optional[str] = None
+    excerpt_uz: Optional[str] = None
+    excerpt_en: Optional[str] = None
+    image_url: Optional[str] = None
+    background_image_url: Optional[str] = None
+    event_date_start: Optional[datetime] = None
+    event_date_end: Optional[datetime] = None
+    event_location_ru: Optional[str] = None
+    event_location_uz: Optional[str] = None
+    event_location_en: Optional[str] = None
+    registration_url: Optional[str] = None
+    is_published: bool = False
+    is_featured: bool = False
+    author_id: Optional[int] = None
+    views_count: int = 0
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class NewsSummaryLocalizedResponse(BaseModel):
+    id: int
+    news_type: str = "news"
+    title: Optional[str] = None
+    subtitle: Optional[str] = None
+    excerpt: Optional[str] = None
+    image_url: Optional[str] = None
+    background_image_url: Optional[str] = None
+    event_date_start: Optional[datetime] = None
+    event_date_end: Optional[datetime] = None
+    event_location: Optional[str] = None
+    registration_url: Optional[str] = None
+    is_published: bool = False
+    is_featured: bool = False
+    author_id: Optional[int] = None
+    views_count: int = 0
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+class NewsFeedResponse(BaseModel):
+    """Страница ленты новостей с курсором на следующую страницу"""
+    items: Union[
+        List[NewsResponse], List[NewsSummaryResponse],
+        List[NewsLocalizedResponse], List[NewsSummaryLocalizedResponse],
+    ] = []
+    next_cursor: Optional[str] = None  # None — это последняя страница
+
+
+# ==================== ГЛАВНАЯ СТРАНИЦА ====================
+class HomeResponse(BaseModel):
+    """Все секции главной страницы одним ответом"""
+    board_members: List[BoardMemberResponse] = []
+    partners: List[PartnerResponse] = []
+    charter: Optional[CharterResponse] = None
+    news: List[NewsResponse] = []           # Последние опубликованные новости
+    upcoming_event: Optional[NewsResponse] = None  # Последнее опубликованное событие
+
+
+class HomeLocalizedResponse(BaseModel):
+    board_members: List[BoardMemberLocalizedResponse] = []
+    partners: List[PartnerLocalizedResponse] = []
+    charter: Optional[CharterLocalizedResponse] = None
+    news: List[NewsLocalizedResponse] = []
+    upcoming_event: Optional[NewsLocalizedResponse] = None
+
+
+# ==================== ПОИСК ====================
+class SearchHit(BaseModel):
+    type: str                # news, disease, document
+    id: int
+    title: Optional[str] = None
+    snippet: Optional[str] = None  # Экранированный HTML, совпадения в <mark>...</mark>
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    total: int
+    items: List[SearchHit] = []
@@ -1,4 +1,8 @@
-"""Скрипт для заполнения БД тестовыми данными"""
+"""Скрипт для заполнения БД тестовыми данными
+
+Несколько написанных вручную записей для разработки. Большой детерминированный
+синтетический набор для нагрузочных тестов строит benchmarks/dataset.py.
+"""
 import asyncio
 from datetime import datetime, timedelta
 from database.connection import async_session
@@ -5,7 +5,7 @@ echo "=== Деплой rheumassociation.uz ==="
 
 # 1. Сборка фронтенда
 echo ""
-echo "[1/3] Сборка фронтенда..."
+echo "[1/4] Сборка фронтенда..."
 docker run --rm \
   -v "$(pwd)/frontend:/app" \
   -w /app \
@@ -16,13 +16,19 @@ echo "Фронтенд собран в frontend/dist/"
 
 # 2. Сборка и запуск контейнеров
 echo ""
-echo "[2/3] Сборка и запуск контейнеров..."
+echo "[2/4] Сборка и запуск контейнеров..."
 docker compose -f docker-compose.prod.yml up -d --build
 
-# 3. Проверка
+# 3. Статические JSON-снимки для nginx (один проход, а не в каждом воркере)
 echo ""
-echo "[3/3] Проверка..."
+echo "[3/4] Перестройка снимков контента..."
 sleep 3
+docker compose -f docker-compose.prod.yml exec -T backend python build_snapshots.py \
+  || echo "Снимки перестроены не полностью: nginx отдаст эти запросы API"
+
+# 4. Проверка
+echo ""
+echo "[4/4] Проверка..."
 docker compose -f docker-compose.prod.yml ps
 
 echo ""
@@ -2,7 +2,7 @@ import { useState, useEffect, useRef } from 'react';
 import { useTranslation } from 'react-i18next';
 import { Link } from 'react-router-dom';
 import { useAuth } from '../context/AuthContext';
-import { contentAPI } from '../services/api';
+import { contentAPI, resizedImageUrl } from '../services/api';
 
 // Хук для отслеживания видимости элемента
 const useInView = (options = {}) => {
@@ -53,19 +53,13 @@ const Home = () => {
 
   const loadData = async () => {
     try {
-      const [boardRes, partnersRes, charterRes, newsRes, eventsRes] = await Promise.all([
-        contentAPI.getBoardMembers().catch(() => ({ data: [] })),
-        contentAPI.getPartners().catch(() => ({ data: [] })),
-        contentAPI.getCharter().catch(() => ({ data: null })),
-        contentAPI.getNews(null, true, 0, 3).catch(() => ({ data: [] })),
-        contentAPI.getNews('event', true, 0, 1).catch(() => ({ data: [] }))
-      ]);
-
-      setBoardMembers(boardRes.data || []);
-      setPartners(partnersRes.data || []);
-      setCharter(charterRes.data);
-      setNews(newsRes.data || []);
-      setUpcomingEvent(eventsRes.data?.[0] || null);
+      const { data } = await contentAPI.getHome();
+
+      setBoardMembers(data.board_members || []);
+      setPartners(data.partners || []);
+      setCharter(data.charter);
+      setNews(data.news || []);
+      setUpcomingEvent(data.upcoming_event || null);
     } catch (err) {
       console.error('Error loading data:', err);
     } finally {
@@ -897,7 +891,7 @@ const Home = () => {
                           <div className="relative aspect-[3/4] bg-stone-100 shadow-lg group-hover/photo:shadow-xl group-hover/photo:shadow-stone-300/50 transition-shadow duration-500">
                             {member.photo_url ? (
                               <img
-                                src={`http://localhost:8000${member.photo_url}`}
+                                src={`http://localhost:8000${resizedImageUrl(member.photo_url, 640)}`}
                                 alt={`${getField(member, 'last_name')} ${getField(member, 'first_name')}`}
                                 className="w-full h-full object-cover grayscale-[15%] sepia-[5%] group-hover/photo:grayscale-[5%] group-hover/photo:sepia-0 transition-all duration-500"
                               />
@@ -1,7 +1,7 @@
 import { useState, useEffect, useCallback } from 'react';
 import { useTranslation } from 'react-i18next';
 import { Link } from 'react-router-dom';
-import { contentAPI } from '../services/api';
+import { contentAPI, resizedImageUrl } from '../services/api';
 
 const News = () => {
   const { t, i18n } = useTranslation();
@@ -27,8 +27,8 @@ const News = () => {
     try {
       setLoading(true);
       const [featuredRes, newsRes] = await Promise.all([
-        contentAPI.getFeaturedNews(10),
-        contentAPI.getNews(null, true, 0, 50),
+        contentAPI.getFeaturedNews(10, true),
+        contentAPI.getNews(null, true, 0, 50, true),
       ]);
       setEvents(featuredRes.data.filter(item => item.news_type === 'event'));
       setNews(newsRes.data);
@@ -290,7 +290,7 @@ const News = () => {
                 <div className="h-48 bg-gray-200 relative overflow-hidden">
                   {item.image_url ? (
                     <img
-                      src={`http://localhost:8000${item.image_url}`}
+                      src={`http://localhost:8000${resizedImageUrl(item.image_url, 640)}`}
                       alt={getLocalizedField(item, 'title')}
                       className="w-full h-full object-cover"
                     />
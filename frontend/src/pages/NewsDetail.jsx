@@ -23,9 +23,13 @@ const NewsDetail = () => {
     try {
       const res = await contentAPI.getNewsItem(id);
       setNews(res.data);
+      // views_count в самой новости — на момент последней правки, актуальное число приходит здесь
+      contentAPI.registerNewsView(id)
+        .then((viewRes) => setNews((current) => current && { ...current, views_count: viewRes.data.views_count }))
+        .catch(() => {});
 
       // Load related news
-      const relatedRes = await contentAPI.getNews(null, true, 0, 4);
+      const relatedRes = await contentAPI.getNews(null, true, 0, 4, true);
       setRelatedNews(relatedRes.data.filter(n => n.id !== parseInt(id)).slice(0, 3));
     } catch (err) {
       console.error('Error loading news:', err);
@@ -1,7 +1,7 @@
 import { useState, useEffect } from 'react';
 import { useTranslation } from 'react-i18next';
 import { Link } from 'react-router-dom';
-import { contentAPI } from '../services/api';
+import { contentAPI, resizedImageUrl } from '../services/api';
 
 const Rheumatology = ({ defaultTab = 'centers' }) => {
   const { t, i18n } = useTranslation();
@@ -13,7 +13,6 @@ const Rheumatology = ({ defaultTab = 'centers' }) => {
   const [loading, setLoading] = useState(true);
   const [selectedCenter, setSelectedCenter] = useState(null);
   const [centerStaff, setCenterStaff] = useState([]);
-  const [loadingStaff, setLoadingStaff] = useState(false);
 
 
   useEffect(() => {
@@ -24,7 +23,8 @@ const Rheumatology = ({ defaultTab = 'centers' }) => {
     try {
       setLoading(true);
       if (defaultTab === 'centers') {
-        const centersRes = await contentAPI.getCenters();
+        // Центры сразу с сотрудниками: выбор центра не требует запроса
+        const centersRes = await contentAPI.getCentersWithStaff();
         setCenters(Array.isArray(centersRes.data) ? centersRes.data : []);
       } else if (defaultTab === 'chiefs') {
         const doctorsRes = await contentAPI.getChiefRheumatologists();
@@ -44,7 +44,7 @@ const Rheumatology = ({ defaultTab = 'centers' }) => {
     return item?.[`${field}_${lang}`] || item?.[`${field}_ru`] || '';
   };
 
-  const handleCenterSelect = async (center) => {
+  const handleCenterSelect = (center) => {
     if (selectedCenter?.id === center.id) {
       setSelectedCenter(null);
       setCenterStaff([]);
@@ -52,16 +52,7 @@ const Rheumatology = ({ defaultTab = 'centers' }) => {
     }
 
     setSelectedCenter(center);
-    setLoadingStaff(true);
-    try {
-      const res = await contentAPI.getCenterStaff(center.id);
-      setCenterStaff(res.data);
-    } catch (error) {
-      console.error('Error loading staff:', error);
-      setCenterStaff([]);
-    } finally {
-      setLoadingStaff(false);
-    }
+    setCenterStaff(center.staff || []);
   };
 
   // Конфигурация для разных табов
@@ -385,7 +376,7 @@ const Rheumatology = ({ defaultTab = 'centers' }) => {
                                 <h4 className="text-lg text-stone-800" style={{ fontFamily: 'Georgia, serif' }}>
                                   {lang === 'ru' ? 'Команда специалистов' : lang === 'uz' ? 'Mutaxassislar jamoasi' : 'Team of Specialists'}
                                 </h4>
-                                {!loadingStaff && centerStaff.length > 0 && (
+                                {centerStaff.length > 0 && (
                                   <p className="text-xs text-stone-500">
                                     {centerStaff.length} {lang === 'ru' ? 'сотрудников' : lang === 'uz' ? 'xodimlar' : 'staff members'}
                                   </p>
@@ -394,11 +385,7 @@ const Rheumatology = ({ defaultTab = 'centers' }) => {
                             </div>
                           </div>
 
-                          {loadingStaff ? (
-                            <div className="flex items-center justify-center py-16">
-                              <div className="w-10 h-10 border-2 border-sky-500/30 border-t-sky-500 rounded-full animate-spin"></div>
-                            </div>
-                          ) : centerStaff.length === 0 ? (
+                          {centerStaff.length === 0 ? (
                             <div className="text-center py-16 text-stone-400">
                               <svg className="w-16 h-16 mx-auto mb-4 text-stone-200" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                                 <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={1} d="M17 20h5v-2a3 3 0 00-5.356-1.857M17 20H7m10 0v-2c0-.656-.126-1.283-.356-1.857M7 20H2v-2a3 3 0 015.356-1.857M7 20v-2c0-.656.126-1.283.356-1.857m0 0a5.002 5.002 0 019.288 0M15 7a3 3 0 11-6 0 3 3 0 016 0zm6 3a2 2 0 11-4 0 2 2 0 014 0zM7 10a2 2 0 11-4 0 2 2 0 014 0z" />
@@ -418,7 +405,7 @@ const Rheumatology = ({ defaultTab = 'centers' }) => {
                                   <div className="relative aspect-[3/4] rounded-xl overflow-hidden bg-gradient-to-br from-slate-100 to-stone-200 shadow-sm group-hover:shadow-lg transition-all duration-300">
                                     {staff.photo_url ? (
                                       <img
-                                        src={`http://localhost:8000${staff.photo_url}`}
+                                        src={`http://localhost:8000${resizedImageUrl(staff.photo_url, 320)}`}
                                         alt={`${getLocalizedField(staff, 'last_name')} ${getLocalizedField(staff, 'first_name')}`}
                                         className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-500"
                                       />
@@ -509,7 +496,7 @@ const Rheumatology = ({ defaultTab = 'centers' }) => {
                               <div className="relative aspect-[3/4] bg-stone-100 shadow-lg overflow-hidden">
                                 {doctor.photo_url ? (
                                   <img
-                                    src={`http://localhost:8000${doctor.photo_url}`}
+                                    src={`http://localhost:8000${resizedImageUrl(doctor.photo_url, 640)}`}
                                     alt={`${getLocalizedField(doctor, 'last_name')} ${getLocalizedField(doctor, 'first_name')}`}
                                     className="w-full h-full object-cover grayscale-[15%] sepia-[5%] group-hover/photo:grayscale-[5%] group-hover/photo:sepia-0 transition-all duration-500"
                                   />
@@ -188,7 +188,7 @@ const BoardMembersAdmin = () => {
                   </div>
                   <input
                     type="file"
-                    accept="image/*"
+                    accept="image/jpeg,image/png,image/gif,image/webp"
                     onChange={handlePhotoUpload}
                     className="text-sm"
                   />
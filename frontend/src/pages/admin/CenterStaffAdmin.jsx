@@ -264,7 +264,7 @@ const CenterStaffAdmin = () => {
                   </div>
                   <input
                     type="file"
-                    accept="image/*"
+                    accept="image/jpeg,image/png,image/gif,image/webp"
                     onChange={handlePhotoUpload}
                     className="text-sm"
                   />
@@ -182,7 +182,7 @@ const CentersAdmin = () => {
                   </div>
                   <input
                     type="file"
-                    accept="image/*"
+                    accept="image/jpeg,image/png,image/gif,image/webp"
                     onChange={handleImageUpload}
                     className="text-sm"
                   />
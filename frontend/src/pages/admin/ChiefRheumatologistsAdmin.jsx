@@ -189,7 +189,7 @@ const ChiefRheumatologistsAdmin = () => {
                   </div>
                   <input
                     type="file"
-                    accept="image/*"
+                    accept="image/jpeg,image/png,image/gif,image/webp"
                     onChange={handlePhotoUpload}
                     className="text-sm"
                   />
@@ -26,24 +26,22 @@ const CongressAdmin = () => {
     }
   };
 
-  const exportToCSV = () => {
-    const headers = ['ФИО', 'Email', 'Телефон', 'Организация', 'Должность', 'Дата регистрации'];
-    const rows = registrations.map(r => [
-      r.full_name,
-      r.email,
-      r.phone || '',
-      r.organization || '',
-      r.position || '',
-      new Date(r.created_at).toLocaleDateString('ru-RU')
-    ]);
-
-    const csvContent = [headers, ...rows].map(row => row.join(',')).join('\n');
-    const blob = new Blob(['\ufeff' + csvContent], { type: 'text/csv;charset=utf-8;' });
-    const url = URL.createObjectURL(blob);
-    const link = document.createElement('a');
-    link.href = url;
-    link.download = 'congress_registrations.csv';
-    link.click();
+  const exportRegistrations = async (format) => {
+    try {
+      // Сервер отдаёт все заявки потоком, а не только загруженную страницу
+      const res = await api.get('/admin/congress/registrations/export', {
+        params: { format },
+        responseType: 'blob',
+      });
+      const url = URL.createObjectURL(res.data);
+      const link = document.createElement('a');
+      link.href = url;
+      link.download = `congress_registrations.${format}`;
+      link.click();
+      URL.revokeObjectURL(url);
+    } catch (err) {
+      console.error('Error exporting registrations:', err);
+    }
   };
 
   if (loading) {
@@ -61,15 +59,20 @@ const CongressAdmin = () => {
           <h1 className="text-2xl font-bold text-gray-800">Заявки на конгресс</h1>
           <p className="text-gray-500">Всего заявок: {registrations.length}</p>
         </div>
-        <button
-          onClick={exportToCSV}
-          className="flex items-center gap-2 px-4 py-2 bg-green-600 text-white rounded-lg hover:bg-green-700 transition-colors"
-        >
-          <svg className="w-5 h-5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-            <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M12 10v6m0 0l-3-3m3 3l3-3m2 8H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z" />
-          </svg>
-          Экспорт CSV
-        </button>
+        <div className="flex gap-2">
+          {['csv', 'xlsx'].map((format) => (
+            <button
+              key={format}
+              onClick={() => exportRegistrations(format)}
+              className="flex items-center gap-2 px-4 py-2 bg-green-600 text-white rounded-lg hover:bg-green-700 transition-colors"
+            >
+              <svg className="w-5 h-5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M12 10v6m0 0l-3-3m3 3l3-3m2 8H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z" />
+              </svg>
+              Экспорт {format.toUpperCase()}
+            </button>
+          ))}
+        </div>
       </div>
 
       <div className="bg-white rounded-xl shadow-sm overflow-hidden">
@@ -1,14 +1,40 @@
 import { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
+import api from '../../services/api';
+
+const SCHOOL_STATUS_LABELS = {
+  pending: 'на рассмотрении',
+  approved: 'одобрено',
+  rejected: 'отклонено',
+};
+
+const formatCount = (value) => (value ?? 0).toLocaleString('ru-RU');
 
 const Dashboard = () => {
   const [stats, setStats] = useState({
-    news: 12,
-    users: 156,
-    congressRegistrations: 89,
-    schoolApplications: 34,
+    news: 0,
+    publishedNews: 0,
+    users: 0,
+    congressRegistrations: 0,
+    schoolApplications: 0,
+    schoolApplicationsByStatus: {},
+    congressRegistrationsByCongress: [],
   });
 
+  useEffect(() => {
+    loadStats();
+  }, []);
+
+  const loadStats = async () => {
+    try {
+      // Счётчики ведёт база, ответ не зависит от размера таблиц
+      const res = await api.get('/admin/stats');
+      setStats(res.data);
+    } catch (err) {
+      console.error('Error loading stats:', err);
+    }
+  };
+
   const quickActions = [
     { label: 'Добавить новость', path: '/admin/news/new', color: 'bg-blue-500' },
     { label: 'Заявки на конгресс', path: '/admin/congress/registrations', color: 'bg-green-500' },
@@ -32,7 +58,8 @@ const Dashboard = () => {
           <div className="flex items-center justify-between">
             <div>
               <p className="text-sm text-gray-500">Новости</p>
-              <p className="text-3xl font-bold text-gray-800">{stats.news}</p>
+              <p className="text-3xl font-bold text-gray-800">{formatCount(stats.news)}</p>
+              <p className="text-xs text-gray-400">опубликовано {formatCount(stats.publishedNews)}</p>
             </div>
             <div className="w-12 h-12 bg-blue-100 rounded-lg flex items-center justify-center">
               <svg className="w-6 h-6 text-blue-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
@@ -49,7 +76,7 @@ const Dashboard = () => {
           <div className="flex items-center justify-between">
             <div>
               <p className="text-sm text-gray-500">Пользователи</p>
-              <p className="text-3xl font-bold text-gray-800">{stats.users}</p>
+              <p className="text-3xl font-bold text-gray-800">{formatCount(stats.users)}</p>
             </div>
             <div className="w-12 h-12 bg-green-100 rounded-lg flex items-center justify-center">
               <svg className="w-6 h-6 text-green-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
@@ -66,7 +93,7 @@ const Dashboard = () => {
           <div className="flex items-center justify-between">
             <div>
               <p className="text-sm text-gray-500">Заявки на конгресс</p>
-              <p className="text-3xl font-bold text-gray-800">{stats.congressRegistrations}</p>
+              <p className="text-3xl font-bold text-gray-800">{formatCount(stats.congressRegistrations)}</p>
             </div>
             <div className="w-12 h-12 bg-purple-100 rounded-lg flex items-center justify-center">
               <svg className="w-6 h-6 text-purple-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
@@ -83,7 +110,12 @@ const Dashboard = () => {
           <div className="flex items-center justify-between">
             <div>
               <p className="text-sm text-gray-500">Заявки в школу</p>
-              <p className="text-3xl font-bold text-gray-800">{stats.schoolApplications}</p>
+              <p className="text-3xl font-bold text-gray-800">{formatCount(stats.schoolApplications)}</p>
+              {Object.entries(SCHOOL_STATUS_LABELS).map(([status, label]) => (
+                <p key={status} className="text-xs text-gray-400">
+                  {label} {formatCount(stats.schoolApplicationsByStatus?.[status])}
+                </p>
+              ))}
             </div>
             <div className="w-12 h-12 bg-orange-100 rounded-lg flex items-center justify-center">
               <svg className="w-6 h-6 text-orange-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
@@ -97,6 +129,21 @@ const Dashboard = () => {
         </div>
       </div>
 
+      {/* Congress registrations by congress */}
+      {stats.congressRegistrationsByCongress?.length > 0 && (
+        <div className="bg-white rounded-xl p-6 shadow-sm mb-8">
+          <h2 className="text-lg font-semibold text-gray-800 mb-4">Заявки по конгрессам</h2>
+          <div className="space-y-2">
+            {stats.congressRegistrationsByCongress.map((item) => (
+              <div key={item.congressId} className="flex items-center justify-between py-2 border-b border-gray-100 last:border-0">
+                <span className="text-sm text-gray-700">{item.title}</span>
+                <span className="text-sm font-semibold text-gray-800">{formatCount(item.count)}</span>
+              </div>
+            ))}
+          </div>
+        </div>
+      )}
+
       <div className="grid lg:grid-cols-2 gap-6">
         {/* Quick Actions */}
         <div className="bg-white rounded-xl p-6 shadow-sm">
@@ -330,7 +330,7 @@ const NewsAdmin = () => {
                     )}
                     <input
                       type="file"
-                      accept="image/*"
+                      accept="image/jpeg,image/png,image/gif,image/webp"
                       onChange={(e) => handleImageUpload(e, 'image_url')}
                       className="text-sm"
                     />
@@ -345,7 +345,7 @@ const NewsAdmin = () => {
                       )}
                       <input
                         type="file"
-                        accept="image/*"
+                        accept="image/jpeg,image/png,image/gif,image/webp"
                         onChange={(e) => handleImageUpload(e, 'background_image_url')}
                         className="text-sm"
                       />
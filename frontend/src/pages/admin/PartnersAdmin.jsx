@@ -183,7 +183,7 @@ const PartnersAdmin = () => {
                   </div>
                   <input
                     type="file"
-                    accept="image/*"
+                    accept="image/jpeg,image/png,image/gif,image/webp"
                     onChange={handleLogoUpload}
                     className="text-sm"
                   />
@@ -47,9 +47,12 @@ export const authAPI = {
 
 // ==================== CONTENT API ====================
 export const contentAPI = {
+  // Home page (все секции одним запросом)
+  getHome: () => api.get('/content/home'),
+
   // Board Members
   getBoardMembers: (includeInactive = false) =>
-    api.get('/content/board-members', { params: { include_inactive: includeInactive } }),
+    api.get('/content/board-members', { params: includeInactive ? { include_inactive: true } : {} }),
   getBoardMember: (id) => api.get(`/content/board-members/${id}`),
   createBoardMember: (data) => api.post('/content/board-members', data),
   updateBoardMember: (id, data) => api.put(`/content/board-members/${id}`, data),
@@ -57,7 +60,7 @@ export const contentAPI = {
 
   // Partners
   getPartners: (includeInactive = false) =>
-    api.get('/content/partners', { params: { include_inactive: includeInactive } }),
+    api.get('/content/partners', { params: includeInactive ? { include_inactive: true } : {} }),
   getPartner: (id) => api.get(`/content/partners/${id}`),
   createPartner: (data) => api.post('/content/partners', data),
   updatePartner: (id, data) => api.put(`/content/partners/${id}`, data),
@@ -72,7 +75,7 @@ export const contentAPI = {
 
   // Chief Rheumatologists
   getChiefRheumatologists: (includeInactive = false) =>
-    api.get('/content/chief-rheumatologists', { params: { include_inactive: includeInactive } }),
+    api.get('/content/chief-rheumatologists', { params: includeInactive ? { include_inactive: true } : {} }),
   getChiefRheumatologist: (id) => api.get(`/content/chief-rheumatologists/${id}`),
   createChiefRheumatologist: (data) => api.post('/content/chief-rheumatologists', data),
   updateChiefRheumatologist: (id, data) => api.put(`/content/chief-rheumatologists/${id}`, data),
@@ -80,7 +83,7 @@ export const contentAPI = {
 
   // Diseases
   getDiseases: (includeInactive = false) =>
-    api.get('/content/diseases', { params: { include_inactive: includeInactive } }),
+    api.get('/content/diseases', { params: includeInactive ? { include_inactive: true } : {} }),
   getDisease: (id) => api.get(`/content/diseases/${id}`),
   createDisease: (data) => api.post('/content/diseases', data),
   updateDisease: (id, data) => api.put(`/content/diseases/${id}`, data),
@@ -95,9 +98,10 @@ export const contentAPI = {
 
   // Rheumatology Centers
   getCenters: (includeInactive = false) =>
-    api.get('/content/centers', { params: { include_inactive: includeInactive } }),
+    api.get('/content/centers', { params: includeInactive ? { include_inactive: true } : {} }),
   getCenter: (id) => api.get(`/content/centers/${id}`),
   getCenterWithStaff: (id) => api.get(`/content/centers/${id}/with-staff`),
+  getCentersWithStaff: () => api.get('/content/centers/with-staff'),
   createCenter: (data) => api.post('/content/centers', data),
   updateCenter: (id, data) => api.put(`/content/centers/${id}`, data),
   deleteCenter: (id) => api.delete(`/content/centers/${id}`),
@@ -111,13 +115,22 @@ export const contentAPI = {
   deleteStaffMember: (id) => api.delete(`/content/center-staff/${id}`),
 
   // News
-  getNews: (newsType = null, publishedOnly = true, skip = 0, limit = 20) =>
-    api.get('/content/news', { params: { news_type: newsType, published_only: publishedOnly, skip, limit } }),
-  getFeaturedNews: (limit = 10) =>
-    api.get('/content/news/featured', { params: { limit } }),
+  // summary=true — краткие новости без полного текста (для списков)
+  getNews: (newsType = null, publishedOnly = true, skip = 0, limit = 20, summary = false) =>
+    api.get('/content/news', { params: { news_type: newsType, published_only: publishedOnly, skip, limit, summary } }),
+  // Лента с курсорной пагинацией: передайте next_cursor из предыдущего ответа
+  getNewsFeed: (cursor = null, limit = 20, newsType = null, summary = true) =>
+    api.get('/content/news/feed', { params: { cursor, limit, news_type: newsType, summary } }),
+  getFeaturedNews: (limit = 10, summary = false) =>
+    api.get('/content/news/featured', { params: { limit, summary } }),
   getEvents: (upcomingOnly = true, limit = 10) =>
     api.get('/content/news/events', { params: { upcoming_only: upcomingOnly, limit } }),
   getNewsItem: (id) => api.get(`/content/news/${id}`),
+  registerNewsView: (id) => api.post(`/content/news/${id}/view`),
+  getPopularNews: (limit = 5, summary = true) =>
+    api.get('/content/news/popular', { params: { limit, summary } }),
+  search: (q, lang = 'ru', type = null, skip = 0, limit = 20) =>
+    api.get('/content/search', { params: { q, lang, skip, limit, ...(type && { type }) } }),
   createNews: (data) => api.post('/content/news', data),
   updateNews: (id, data) => api.put(`/content/news/${id}`, data),
   deleteNews: (id) => api.delete(`/content/news/${id}`),
@@ -135,4 +148,8 @@ export const contentAPI = {
   submitSchoolApplication: (data) => api.post('/content/school-applications', data),
 };
 
+// Уменьшенная копия загруженного изображения (ширина из IMAGE_WIDTHS бэкенда)
+export const resizedImageUrl = (url, width) =>
+  url?.startsWith('/uploads/') ? `/img/${width}/${url.slice('/uploads/'.length)}` : url;
+
 export default api;